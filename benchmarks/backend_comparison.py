@@ -0,0 +1,62 @@
+"""
+Compares the throughput of the available XML parser backends on a generated XML file.
+
+Run from the project root:
+    python -m benchmarks.backend_comparison --records 200000
+"""
+import argparse
+import os
+import tempfile
+import time
+import logic.xml_backend as xml_backend
+from logic.xml_dataframe import XMLParser
+
+
+def write_xml_file(file_path: str, records: int):
+    """
+    Write an XML file with the given number of records. Every third record contains nested columns.
+
+    Args:
+        file_path (str): The path of the XML file.
+        records (int): The number of records.
+    """
+    states = ["NEW", "OPEN", "DONE"]
+    with open(file_path, "w") as file:
+        file.write('<?xml version="1.0"?>\n<root>\n')
+        for i in range(records):
+            properties = f"<properties><state>{states[i % 3]}</state><country>DE</country></properties>" \
+                if i % 3 == 0 else ""
+            file.write(f"<item><name>Item{i}</name><value>{i}</value><unit>kg</unit>{properties}</item>\n")
+        file.write("</root>\n")
+
+
+def main():
+    """
+    Generate the XML file and print the throughput of every backend in DOM and streaming mode.
+    """
+    parser = argparse.ArgumentParser(description="Compare the throughput of the XML parser backends")
+    parser.add_argument("--records", type=int, default=200000, help="number of generated records")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per backend, the fastest one is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "benchmark.xml")
+        write_xml_file(file_path, args.records)
+        size_mb = os.path.getsize(file_path) / 1024 / 1024
+        print(f"{args.records} records, {size_mb:.1f} MB")
+
+        for name in xml_backend.backends:
+            for streaming in [False, True]:
+                durations = list()
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    XMLParser.parse_xml_to_dataframe(file_path, streaming=streaming, backend=name)
+                    durations.append(time.perf_counter() - start)
+                duration = min(durations)
+                mode = "streaming" if streaming else "DOM"
+                print(f"{name:>6} {mode:>9}: {duration:6.2f} s  {size_mb / duration:6.1f} MB/s  "
+                      f"{args.records / duration:9.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
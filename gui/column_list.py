@@ -0,0 +1,177 @@
+import tkinter as tk
+import resources.style as style
+import logic.logging as log
+from gui.virtual_tree import VirtualTreeview
+from logic.column_selection import ColumnSelection
+
+# Number of columns shown at once
+VISIBLE_COLUMNS: int = 12
+# Width of the list in pixels
+LIST_WIDTH: int = 220
+CHECKED: str = "☑"
+UNCHECKED: str = "☐"
+
+
+class ColumnList(tk.Frame):
+    """
+    Searchable list of the columns with their check state. Only the visible columns are rendered, so thousands
+    of columns don't create thousands of widgets.
+    """
+
+    search_entry: tk.Entry
+    regex_checkbox: tk.Checkbutton
+    select_all_button: tk.Button
+    select_none_button: tk.Button
+    tree_view: "_ColumnTreeview"
+    count_label: tk.Label
+
+    __selection: ColumnSelection
+    __search_text: tk.StringVar
+    __use_regex: tk.BooleanVar
+    __translations: dict
+
+    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, selection: ColumnSelection, row: int = 0,
+                 column: int = 0, visible_columns: int = VISIBLE_COLUMNS, pady: int = 0):
+        """
+        Initialize the ColumnList.
+
+        Args:
+            root (Frame | Tk): Frame parent. A Tkinter frame or the root Tkinter window.
+            translations (dict): A dictionary of translations for UI text.
+            selection (ColumnSelection): The shown columns and their states.
+            row (int): The row position of the frame in the grid.
+            column (int): The column position of the frame in the grid.
+            visible_columns (int): The number of columns shown at once.
+            pady (int): The vertical padding around the frame.
+        """
+        super().__init__(root)
+        self.grid(row=row, column=column, sticky=tk.NSEW, pady=pady)
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(1, weight=1)
+        self.__selection = selection
+        self.__translations = translations
+
+        search_label = tk.Label(self, font=style.default_font, text=translations["preview.columns.search"])
+        search_label.grid(row=0, column=0, sticky=tk.W)
+        self.__search_text = tk.StringVar()
+        self.__search_text.trace_add("write", lambda *args: self.update_matches())
+        self.search_entry = tk.Entry(self, textvariable=self.__search_text)
+        self.search_entry.grid(row=0, column=1, sticky=tk.EW)
+        self.__use_regex = tk.BooleanVar(value=False)
+        self.__use_regex.trace_add("write", lambda *args: self.update_matches())
+        self.regex_checkbox = tk.Checkbutton(self, text=translations["preview.columns.regex"],
+                                             variable=self.__use_regex)
+        self.regex_checkbox.grid(row=0, column=2, sticky=tk.W)
+
+        self.tree_view = _ColumnTreeview(self, selection, visible_columns)
+        self.tree_view.grid(row=1, column=0, columnspan=3, sticky=tk.NSEW)
+        self.tree_view.tree.bind("<Button-1>", self.__toggle)
+
+        button_frame = tk.Frame(self)
+        button_frame.grid(row=2, column=0, columnspan=3, sticky=tk.EW)
+        # The buttons change the matching columns only
+        self.select_all_button = tk.Button(button_frame, text=translations["preview.columns.all"],
+                                           command=lambda: self.__select_matches(True))
+        self.select_all_button.pack(side=tk.LEFT)
+        self.select_none_button = tk.Button(button_frame, text=translations["preview.columns.none"],
+                                            command=lambda: self.__select_matches(False))
+        self.select_none_button.pack(side=tk.LEFT)
+        self.count_label = tk.Label(button_frame, font=style.hint_font, text="")
+        self.count_label.pack(side=tk.LEFT, padx=5)
+
+        # Changed columns or states are shown at once
+        selection.add_listener(lambda changed: self.update_matches())
+        self.update_matches()
+
+    def update_matches(self):
+        """
+        Search the columns matching the search text and show them with the selected count.
+        """
+        try:
+            self.tree_view.matches = self.__selection.search(self.__search_text.get(), self.__use_regex.get())
+            self.search_entry.config(foreground="black")
+        except ValueError:
+            # If the regular expression is incomplete while it is typed
+            self.tree_view.matches = list()
+            self.search_entry.config(foreground="red")
+        self.tree_view.render()
+        self.count_label.config(text=str.format(self.__translations["preview.columns.count"],
+                                                self.__selection.selected_count(),
+                                                len(self.__selection.columns)))
+
+    def __toggle(self, event: tk.Event) -> str | None:
+        """
+        Toggle the clicked column.
+
+        Args:
+            event (Event): The click on the Treeview.
+
+        Returns:
+            str | None: 'break' if a column was clicked, so the Treeview doesn't handle the click as well.
+        """
+        item: str = self.tree_view.tree.identify_row(event.y)
+        if not item:
+            return None
+        column: str = self.tree_view.matches[int(item)]
+        selected: bool = self.__selection.toggle(column)
+        log.log_event(f"Column '{column}' {'selected' if selected else 'unselected'}")
+        return "break"
+
+    def __select_matches(self, selected: bool):
+        """
+        Select or unselect the matching columns.
+
+        Args:
+            selected (bool): Select the columns or unselect them.
+        """
+        columns: list | None = self.tree_view.matches
+        if len(columns) == len(self.__selection.columns):
+            # Every column matches, e.g. without search text
+            columns = None
+        changed: int = self.__selection.select(columns, selected)
+        log.log_event(f"{changed} columns {'selected' if selected else 'unselected'}")
+
+
+class _ColumnTreeview(VirtualTreeview):
+    """
+    Virtualized list of the matching columns with a check mark for every selected column.
+    """
+
+    matches: list
+
+    __selection: ColumnSelection
+
+    def __init__(self, root: tk.Frame, selection: ColumnSelection, visible_columns: int):
+        """
+        Initialize the _ColumnTreeview.
+
+        Args:
+            root (Frame): Frame parent.
+            selection (ColumnSelection): The columns and their states.
+            visible_columns (int): The number of columns shown at once.
+        """
+        self.matches = list()
+        self.__selection = selection
+        super().__init__(root, visible_columns, horizontal=False, columns=("column",), show="")
+        self.tree.column("column", width=LIST_WIDTH, anchor=tk.W)
+
+    def row_count(self) -> int:
+        """
+        Returns:
+            int: The number of matching columns.
+        """
+        return len(self.matches)
+
+    def row_values(self, first: int, last: int) -> list:
+        """
+        Get the names and check marks of the visible columns.
+
+        Args:
+            first (int): The position of the first visible column.
+            last (int): The position after the last visible column.
+
+        Returns:
+            list: A tuple of the checked name for every visible column.
+        """
+        return [(f"{CHECKED if self.__selection.is_selected(column) else UNCHECKED} {column}",)
+                for column in self.matches[first:last]]
@@ -0,0 +1,152 @@
+import tkinter as tk
+import pandas as pd
+import resources.style as style
+from gui.virtual_tree import VirtualTreeview
+
+# Number of rows shown at once
+VISIBLE_ROWS: int = 15
+# Width of a column in pixels
+COLUMN_WIDTH: int = 120
+# Maximum number of characters shown of a value
+MAX_VALUE_LENGTH: int = 200
+
+
+class DataGrid(VirtualTreeview):
+    """
+    Virtualized table of the rows of a DataFrame. Only the visible rows are rendered.
+    """
+
+    rows_label: tk.Label
+
+    __dataframe: pd.DataFrame | None
+    __columns: list
+    __column_ids: dict
+    __translations: dict
+
+    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, row: int = 0, column: int = 0,
+                 columnspan: int = 1, visible_rows: int = VISIBLE_ROWS, pady: int = 0):
+        """
+        Initialize the DataGrid.
+
+        Args:
+            root (Frame | Tk): Frame parent. A Tkinter frame or the root Tkinter window.
+            translations (dict): A dictionary of translations for UI text.
+            row (int): The row position of the frame in the grid.
+            column (int): The column position of the frame in the grid.
+            columnspan (int): The number of columns the frame spans in the grid.
+            visible_rows (int): The number of rows shown at once.
+            pady (int): The vertical padding around the frame.
+        """
+        self.__dataframe = None
+        self.__columns = list()
+        self.__column_ids = dict()
+        self.__translations = translations
+        super().__init__(root, visible_rows, show="headings")
+        self.grid(row=row, column=column, columnspan=columnspan, sticky=tk.NSEW, pady=pady)
+
+        self.rows_label = tk.Label(self, font=style.hint_font, text="")
+        self.rows_label.grid(row=2, column=0, sticky=tk.W)
+        self.render()
+
+    def set_dataframe(self, dataframe: pd.DataFrame | None, columns: list | None = None, keep_position: bool = False):
+        """
+        Show the rows of a DataFrame.
+
+        Args:
+            dataframe (pd.DataFrame | None): The shown data or None to clear the table.
+            columns (list | None): The shown columns. Defaults to every column. Columns missing in the data are
+                skipped.
+            keep_position (bool): Keep the first shown row, e.g. after rows were appended.
+        """
+        self.__dataframe = dataframe
+        self.__update_columns(columns if columns is not None or dataframe is None else list(dataframe.columns))
+        if keep_position:
+            self.render()
+        else:
+            self.scroll_to(0)
+
+    def set_columns(self, columns: list):
+        """
+        Change the shown columns.
+
+        Args:
+            columns (list): The shown columns. Columns missing in the data are skipped.
+        """
+        self.__update_columns(columns)
+        self.render()
+
+    def __update_columns(self, columns: list):
+        """
+        Change the columns of the Treeview without rendering the rows. Every column of the data is configured
+        once, changing the shown columns only changes the displayed columns of the Treeview.
+
+        Args:
+            columns (list): The shown columns. Columns missing in the data are skipped.
+        """
+        all_columns: list = list(self.__dataframe.columns) if self.__dataframe is not None else list()
+        if all_columns != list(self.__column_ids):
+            # The column ids are indices, because column names may contain characters of the Tcl syntax
+            self.__column_ids = {column: str(i) for i, column in enumerate(all_columns)}
+            self.tree.config(columns=list(self.__column_ids.values()), displaycolumns=list())
+            for column, column_id in self.__column_ids.items():
+                self.tree.heading(column_id, text=column, anchor=tk.W)
+                self.tree.column(column_id, width=COLUMN_WIDTH, minwidth=40, stretch=False, anchor=tk.W)
+            self.__columns = list()
+        columns = [column for column in columns if column in self.__column_ids]
+        if columns != self.__columns:
+            self.__columns = columns
+            self.tree.config(displaycolumns=[self.__column_ids[column] for column in columns])
+
+    def row_count(self) -> int:
+        """
+        Returns:
+            int: The number of rows of the DataFrame or 0 if none is shown.
+        """
+        return len(self.__dataframe) if self.__dataframe is not None and self.__columns else 0
+
+    def row_values(self, first: int, last: int) -> list:
+        """
+        Get the formatted values of the shown columns of the visible rows. The hidden columns are empty.
+
+        Args:
+            first (int): The position of the first visible row.
+            last (int): The position after the last visible row.
+
+        Returns:
+            list: A list of the values of the Treeview columns for every row.
+        """
+        window: pd.DataFrame = self.__dataframe.iloc[first:last]
+        width: int = max(int(self.__column_ids[column]) for column in self.__columns) + 1
+        rows: list = [[""] * width for _ in range(len(window))]
+        for column in self.__columns:
+            i: int = int(self.__column_ids[column])
+            for row, value in zip(rows, window[column].tolist()):
+                row[i] = _format_value(value)
+        return rows
+
+    def render(self):
+        """
+        Show the visible rows and their positions.
+        """
+        super().render()
+        row_count: int = self.row_count()
+        if row_count:
+            last_row: int = min(self.first_row + self.visible_rows, row_count)
+            self.rows_label.config(text=str.format(self.__translations["preview.rows"], self.first_row + 1,
+                                                   last_row, row_count))
+        else:
+            self.rows_label.config(text="")
+
+
+def _format_value(value) -> str:
+    """
+    Args:
+        value: A value of the DataFrame.
+
+    Returns:
+        str: The shown text, empty for missing values and shortened for long values.
+    """
+    if value is None or value is pd.NaT or value is pd.NA or (isinstance(value, float) and value != value):
+        return ""
+    text: str = str(value)
+    return text if len(text) <= MAX_VALUE_LENGTH else text[:MAX_VALUE_LENGTH - 1] + "…"
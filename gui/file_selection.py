@@ -1,13 +1,22 @@
 import errno
+import os
+import threading
 import tkinter as tk
 from tkinter import filedialog
-import openpyxl
 import pandas as pd
+from logic.column_selection import ColumnSelection
+from logic.parse_cache import ParseCache
 from logic.xml_dataframe import XMLParser
+import logic.export as export
+from gui.task_runner import TaskRunner
 
 import resources.style as style
 import logic.logging as log
-import os
+
+# Number of records scanned for the columns, which are shown before the whole XML file is parsed
+PREVIEW_RECORDS: int = 10000
+# Options of the parsed DataFrame shown in the preview and exported
+PARSE_OPTIONS: dict = {"infer_types": True, "categorical": True}
 
 
 class FileSelectionFrame(tk.Frame):
@@ -17,34 +26,44 @@ class FileSelectionFrame(tk.Frame):
 
     xml_file_button: tk.Button
     xml_file_label: tk.Label
+    refresh_button: tk.Button
     output_file_button: tk.Button
     output_file_label: tk.Label
     output_prettier_checkbox: tk.Checkbutton
+    cancel_button: tk.Button
+    progress_label: tk.Label
 
-    __check_vars: dict | None
+    __column_selection: ColumnSelection | None
     __xml_path: str
     __output_path: str
     __translations: dict
     __use_output_prettier: tk.BooleanVar
+    __task_runner: TaskRunner
+    __cancel_event: threading.Event | None
+    __parse_cache: ParseCache
 
-    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, row: int = 1, column: int = 0, padx: int = 20,
-                 pady: int = 20):
+    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, task_runner: TaskRunner, row: int = 1,
+                 column: int = 0, padx: int = 20, pady: int = 20):
         """
         Initialize the FileSelectionFrame.
 
         Args:
             root (Frame | Tk): Frame parent. A Tkinter frame or the root Tkinter window.
             translations (dict): A dictionary of translations for UI text.
+            task_runner (TaskRunner): Runs the parsing and export in the background.
             row (int): The row position of the frame in the grid.
             column (int): The column position of the frame in the grid.
             padx (int): The horizontal padding around the frame.
             pady (int): The vertical padding around the frame.
         """
         super().__init__(root)
-        self.__check_vars = None
+        self.__column_selection = None
         self.__xml_path = ""
         self.__output_path = ""
         self.__translations = translations
+        self.__task_runner = task_runner
+        self.__cancel_event = None
+        self.__parse_cache = ParseCache()
         row_padding = 20
         column_padding = 30
 
@@ -62,6 +81,13 @@ class FileSelectionFrame(tk.Frame):
         self.xml_file_label = tk.Label(self, font=style.hint_font, text=translations["file.select.none"])
         self.xml_file_label.grid(row=0, column=1, sticky=tk.NW, ipady=style.button_y_padding, padx=column_padding)
 
+        # Parse the records appended to the selected file since it was parsed
+        self.refresh_button = tk.Button(self, font=style.button_font, fg=style.button_fg, bg=style.button_bg,
+                                        state=tk.DISABLED, text=translations["file.refresh.button"],
+                                        command=self.refresh_xml_file)
+        self.refresh_button.grid(row=4, column=0, sticky=tk.EW, ipadx=style.button_x_padding,
+                                 ipady=style.button_y_padding, pady=(row_padding, 0))
+
         # File Output
         self.output_file_button = tk.Button(self, font=style.button_font, fg=style.button_fg,
                                             bg=style.button_bg,
@@ -80,6 +106,17 @@ class FileSelectionFrame(tk.Frame):
         self.output_file_label = tk.Label(self, font=style.hint_font, text=translations["file.output.none"])
         self.output_file_label.grid(row=1, column=1, sticky=tk.NW, ipady=style.button_y_padding, padx=column_padding)
 
+        # Progress of the running parsing or export
+        self.cancel_button = tk.Button(self, font=style.button_font, fg=style.button_fg, bg=style.button_bg,
+                                       state=tk.DISABLED, text=translations["file.cancel.button"],
+                                       command=self.cancel)
+        self.cancel_button.grid(row=3, column=0, sticky=tk.EW, ipadx=style.button_x_padding,
+                                ipady=style.button_y_padding, pady=(row_padding, 0))
+
+        self.progress_label = tk.Label(self, font=style.hint_font, text="")
+        self.progress_label.grid(row=3, column=1, sticky=tk.NW, ipady=style.button_y_padding, padx=column_padding,
+                                 pady=(row_padding, 0))
+
     def select_xml_file(self):
         """
         Open a file dialog to select an input XML file.
@@ -87,52 +124,119 @@ class FileSelectionFrame(tk.Frame):
         """
         log.log_event("Selecting an input XML file")
 
-        filetypes: list = [(self.__translations["file.select.xml"], "*.xml")]
+        filetypes: list = [(self.__translations["file.select.xml"], "*.xml"),
+                           (self.__translations["file.select.compressed"], "*.gz *.bz2 *.xz *.zip")]
         title: str = self.__translations["file.select.title"]
         self.__xml_path = filedialog.askopenfilename(filetypes=filetypes, title=title)
 
         if self.__xml_path:
             # An XML file was selected
-            self.xml_file_label.config(text=str.format(self.__translations["file.select.success"], self.__xml_path),
+            self.xml_file_label.config(text=str.format(self.__translations["file.select.loading"], self.__xml_path),
                                        font=style.default_font)
             log.log_event(f"{self.__xml_path} selected")
-            XMLParser.parse_xml_to_dataframe(self.__xml_path)
-
-            if XMLParser.dataframe is None:
-                # If a parse exception other than an empty file was thrown
-                self.output_file_button.config(state=tk.DISABLED)
-                if log.get_latest_error().__contains__("syntax"):
-                    self.xml_file_label.config(
-                        text=str.format(self.__translations["file.select.error.syntax"], self.__xml_path),
-                        font=style.error_font)
-                else:
-                    self.xml_file_label.config(
-                        text=str.format(self.__translations["file.select.error"], self.__xml_path),
-                        font=style.error_font)
-            else:
-                # XML data can now be exported
-                self.output_file_button.config(state=tk.NORMAL)
+
+            # Parse in the background, so the window keeps responding
+            xml_path: str = self.__xml_path
+            progress = self.__task_runner.wrap(self.__update_progress)
+            self.__set_running(True, cancelable=True)
+
+            def parse_task(cancel_event: threading.Event):
+                if not self.__parse_cache.contains(xml_path, **PARSE_OPTIONS):
+                    # Show the columns of the first records within seconds, even for a huge file
+                    XMLParser.scan_xml_schema(xml_path, max_records=PREVIEW_RECORDS, cancel_event=cancel_event)
+                    if XMLParser.schema is None:
+                        # If the file can't be parsed or the scanning was canceled
+                        XMLParser.set_dataframe_none()
+                        return
+                # An unchanged file that was opened before is loaded from the cache
+                XMLParser.parse_xml_to_dataframe(xml_path, cache=self.__parse_cache, streaming=True,
+                                                 progress=progress, cancel_event=cancel_event, **PARSE_OPTIONS)
+
+            self.__cancel_event = self.__task_runner.run(parse_task, self.__finish_xml_file)
         else:
             # No file was selected
             self.xml_file_label.config(text=self.__translations["file.select.none"], font=style.hint_font)
             self.output_file_button.config(state=tk.DISABLED)
+            self.refresh_button.config(state=tk.DISABLED)
             XMLParser.set_dataframe_none()
             log.log_event("Selection canceled")
 
+    def refresh_xml_file(self):
+        """
+        Parse the selected XML file again. If records were only appended to it, only these are parsed.
+        """
+        if not self.__xml_path:
+            return
+        log.log_event(f"Refreshing {self.__xml_path}")
+        self.xml_file_label.config(text=str.format(self.__translations["file.select.loading"], self.__xml_path),
+                                   font=style.default_font)
+        xml_path: str = self.__xml_path
+        progress = self.__task_runner.wrap(self.__update_progress)
+        self.__set_running(True, cancelable=True)
+
+        def refresh_task(cancel_event: threading.Event):
+            XMLParser.parse_xml_to_dataframe(xml_path, cache=self.__parse_cache, incremental=True, streaming=True,
+                                             progress=progress, cancel_event=cancel_event, **PARSE_OPTIONS)
+
+        self.__cancel_event = self.__task_runner.run(refresh_task, self.__finish_xml_file)
+
+    def __finish_xml_file(self, result: Exception | None):
+        """
+        Update the UI after the selected XML file was parsed in the background.
+
+        Args:
+            result (Exception | None): The unexpected exception raised by the parse task or None.
+        """
+        canceled: bool = self.__cancel_event is not None and self.__cancel_event.is_set()
+        self.__set_running(False)
+        if isinstance(result, Exception):
+            # If the parse task failed unexpectedly, the data of the previous file must not be exported
+            XMLParser.set_dataframe_none()
+
+        if XMLParser.dataframe is None:
+            # If a parse exception other than an empty file was thrown or the parsing was canceled
+            self.output_file_button.config(state=tk.DISABLED)
+            if canceled:
+                self.xml_file_label.config(
+                    text=str.format(self.__translations["file.select.canceled"], self.__xml_path),
+                    font=style.hint_font)
+            elif log.get_latest_error().__contains__("syntax"):
+                self.xml_file_label.config(
+                    text=str.format(self.__translations["file.select.error.syntax"], self.__xml_path),
+                    font=style.error_font)
+            else:
+                self.xml_file_label.config(
+                    text=str.format(self.__translations["file.select.error"], self.__xml_path),
+                    font=style.error_font)
+        else:
+            # XML data can now be exported
+            self.xml_file_label.config(text=str.format(self.__translations["file.select.success"], self.__xml_path),
+                                       font=style.default_font)
+            self.output_file_button.config(state=tk.NORMAL)
+            self.refresh_button.config(state=tk.NORMAL)
+
     def select_output_file(self):
         """
-        Open a file dialog to select an output XLSX file.
-        Save the parsed XML data to the selected XLSX file.
+        Open a file dialog to select an output file. XLSX, CSV and, if pyarrow is installed, Parquet and Feather
+        files can be selected.
+        Save the parsed XML data to the selected file.
         """
-        log.log_event("Selecting an output XLSX file")
-        filetypes = [(self.__translations["file.output.xlsx"], "*.xlsx")]
+        log.log_event("Selecting an output file")
+        export_formats: list = export.available_export_formats()
+        filetypes = [(self.__translations[f"file.output.{export_format}"], f"*.{export_format}")
+                     for export_format in export_formats]
         title = self.__translations["file.output.title"]
-        self.__output_path = filedialog.asksaveasfilename(filetypes=filetypes, title=title, confirmoverwrite=False)
+        selected_type = tk.StringVar(self, value=filetypes[0][0])
+        self.__output_path = filedialog.asksaveasfilename(filetypes=filetypes, title=title, confirmoverwrite=False,
+                                                          typevariable=selected_type)
         if self.__output_path:
             # An output path was selected
-            if not self.__output_path.endswith(".xlsx"):
-                # If the file name has no extension called xlsx
-                self.__output_path += ".xlsx"
+            extension: str = os.path.splitext(self.__output_path)[1].lower().lstrip(".")
+            if extension not in export_formats:
+                # If the file name has no extension of a format, use the one of the selected file type
+                labels: list = [label for label, pattern in filetypes]
+                selected: int = labels.index(selected_type.get()) if selected_type.get() in labels else 0
+                self.__output_path += f".{export_formats[selected]}"
 
             self.output_file_label.config(text=str.format(self.__translations["file.output.success"],
                                                           self.__output_path), font=style.default_font)
@@ -145,81 +249,117 @@ class FileSelectionFrame(tk.Frame):
 
     def __save_output_file(self):
         """
-        Save the parsed XML data to the selected XLSX file.
-        Optionally apply prettier for better readability.
+        Save the parsed XML data to the selected file.
+        Optionally apply prettier for better readability of XLSX files.
         """
-        log.log_event("Exporting XML data to XLSX file")
+        log.log_event(f"Exporting XML data to {export.get_export_format(self.__output_path).upper()} file")
 
-        if not self.__check_vars:
-            # If check_vars is not set externally
+        if self.__column_selection is None or not self.__column_selection.columns:
+            # If the column selection is not set externally
             selected_dataframe: pd.DataFrame = XMLParser.dataframe
         else:
-            # If check_vars is set externally
-            selected_columns = [col for col, var in self.__check_vars.items() if var.get()]
-            selected_dataframe = XMLParser.dataframe[selected_columns]
+            # If the column selection is set externally
+            selected_dataframe = XMLParser.dataframe[self.__column_selection.selected_columns()]
 
-        log.log_event(f"Exporting {len(selected_dataframe.columns)} columns and {len(selected_dataframe)} rows")
-        sheet_name = os.path.splitext(os.path.basename(self.__xml_path))[0]
+        sheet_name = export.default_sheet_name(self.__xml_path)
+        output_path: str = self.__output_path
+        prettier: bool = self.__use_output_prettier.get()
+        total_rows: int = len(selected_dataframe)
+        progress = self.__task_runner.wrap(lambda rows: self.__update_export_progress(rows, total_rows))
 
-        if os.path.exists(self.__output_path):
-            # If the Excel file already exists
-            log.log_event("Add a new sheet to an existing workbook")
+        def export_task(cancel_event: threading.Event) -> Exception | None:
             try:
-                with pd.ExcelWriter(self.__output_path, engine="openpyxl", mode="a") as writer:
-                    workbook = writer.book
-                    i = 1
-                    base_sheet_name = sheet_name
-                    while sheet_name in workbook.sheetnames:
-                        # Find the next unused index if sheet name already exists
-                        sheet_name = f"{base_sheet_name}_{i}"
-                        i += 1
-                    selected_dataframe.to_excel(writer, index=False, sheet_name=sheet_name)
-            except IOError as e:
-                if e.errno == errno.EACCES:
-                    # An access error is thrown
-                    log.log_error(
-                        f"Error while opening the file '{self.__output_path}'. The file is opened by another app and cannot be edited")
-                    self.output_file_label.config(
-                        text=str.format(self.__translations["file.output.error.open"], self.__output_path),
-                        font=style.error_font)
-                else:
-                    # Another IO error is thrown
-                    log.log_error(f"Error while saving the file '{self.__output_path}': {e}")
-                    self.output_file_label.config(
-                        text=str.format(self.__translations["file.output.error.io"], self.__output_path),
-                        font=style.error_font)
-                return
+                export.export_dataframe(selected_dataframe, output_path, sheet_name, prettier=prettier,
+                                        progress=progress, cancel_event=cancel_event)
+            except (IOError, ImportError, ValueError, export.ExportCanceledError) as e:
+                # ValueError is raised for an invalid sheet name or too many rows
+                return e
+            return None
+
+        # Export in the background, so the window keeps responding
+        self.__set_running(True, cancelable=True)
+        self.__cancel_event = self.__task_runner.run(export_task, self.__finish_output_file)
+
+    def __finish_output_file(self, error: Exception | None):
+        """
+        Update the UI after the XML data was exported in the background.
+
+        Args:
+            error (Exception | None): The error thrown while saving the file or None if it was successful.
+        """
+        self.__set_running(False)
+        self.output_file_button.config(state=tk.NORMAL)
+        if error is None:
+            return
+
+        if isinstance(error, export.ExportCanceledError):
+            # The file was removed or the existing workbook restored
+            log.log_event(f"Exporting to {self.__output_path} canceled")
+            self.output_file_label.config(
+                text=str.format(self.__translations["file.output.canceled"], self.__output_path),
+                font=style.hint_font)
+        elif getattr(error, "errno", None) == errno.EACCES:
+            # An access error is thrown
+            log.log_error(
+                f"Error while opening the file '{self.__output_path}'. The file is opened by another app and cannot be edited")
+            self.output_file_label.config(
+                text=str.format(self.__translations["file.output.error.open"], self.__output_path),
+                font=style.error_font)
         else:
-            log.log_event("Create a new workbook")
-            try:
-                selected_dataframe.to_excel(self.__output_path, index=False, sheet_name=sheet_name)
-            except IOError as e:
-                # Another IO error is thrown
-                log.log_error(f"Error while saving the file '{self.__output_path}': {e}")
-                self.output_file_label.config(
-                    text=str.format(self.__translations["file.output.error.io"], self.__output_path),
-                    font=style.error_font)
-                return
+            # Another error is thrown, like an IO error or an invalid sheet name
+            log.log_error(f"Error while saving the file '{self.__output_path}': {error}")
+            self.output_file_label.config(
+                text=str.format(self.__translations["file.output.error.io"], self.__output_path),
+                font=style.error_font)
 
-        if self.__use_output_prettier:
-            # If the Excel sheet should be edited to look nicer
-            # Currently only autosize of the columns
-            log.log_event(f"Apply prettier to Excel sheet")
-            log.log_event(f"Adjust column width to content size")
-            wb = openpyxl.load_workbook(self.__output_path)
-            sheet = wb[sheet_name]
-            for col in sheet.columns:
-                sheet.column_dimensions[col[0].column_letter].auto_size = True
-            wb.save(self.__output_path)
-            log.log_event(f"Finished prettier and closed workbook")
+    def cancel(self):
+        """
+        Cancel the parsing or export running in the background.
+        """
+        if self.__cancel_event is not None:
+            log.log_event("Cancel the running task")
+            self.__cancel_event.set()
 
-        log.log_event(f"XML data exported to {self.__output_path}")
+    def __set_running(self, running: bool, cancelable: bool = False):
+        """
+        Enable or disable the buttons while a task is running in the background.
+
+        Args:
+            running (bool): Whether a task is running.
+            cancelable (bool): Whether the running task can be canceled.
+        """
+        self.xml_file_button.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.output_file_button.config(state=tk.DISABLED)
+        self.refresh_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL if running and cancelable else tk.DISABLED)
+        self.progress_label.config(text="")
+
+    def __update_progress(self, read_bytes: int, records: int):
+        """
+        Show the progress of the parsing.
+
+        Args:
+            read_bytes (int): The number of bytes read from the XML file.
+            records (int): The number of parsed records.
+        """
+        self.progress_label.config(text=str.format(self.__translations["file.progress"],
+                                                   read_bytes / 1024 / 1024, records))
+
+    def __update_export_progress(self, rows: int, total_rows: int):
+        """
+        Show the progress of the export.
+
+        Args:
+            rows (int): The number of written rows.
+            total_rows (int): The number of exported rows.
+        """
+        self.progress_label.config(text=str.format(self.__translations["file.output.progress"], rows, total_rows))
 
-    def set_selected_columns_variables(self, check_vars: dict):
+    def set_column_selection(self, column_selection: ColumnSelection):
         """
-        Set the variables of the selected columns for export based on the provided check variables.
+        Set the selection of the exported columns.
 
         Args:
-            check_vars (dict): A dictionary where keys are column names and values are BooleanVar objects indicating whether the column is selected.
+            column_selection (ColumnSelection): The columns and whether they are selected.
         """
-        self.__check_vars = check_vars
+        self.__column_selection = column_selection
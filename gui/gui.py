@@ -4,6 +4,7 @@ from gui.welcome import WelcomeFrame
 from gui.file_selection import FileSelectionFrame
 from gui.previewframe import PreviewFrame
 from gui.logging import LoggingFrame
+from gui.task_runner import TaskRunner
 
 
 class MainGUI(tk.Tk):
@@ -15,6 +16,7 @@ class MainGUI(tk.Tk):
     file_frame: FileSelectionFrame
     preview_frame: PreviewFrame
     logging_frame: LoggingFrame
+    task_runner: TaskRunner
 
     __translations: dict
 
@@ -46,8 +48,14 @@ class MainGUI(tk.Tk):
         self.columnconfigure(1, weight=1)
         self.rowconfigure(2, weight=1)
 
+        # Parsing and export run in the background, their callbacks are executed by the main loop
+        self.task_runner = TaskRunner(self)
+
         self.welcome_frame = WelcomeFrame(self, self.__translations, row=0, column=0, columnspan=2, padx=10, pady=10)
-        self.file_frame = FileSelectionFrame(self, self.__translations, row=1, column=0, padx=20, pady=20)
-        self.preview_frame = PreviewFrame(self, self.__translations, row=1, column=1, rowspan=2, padx=20, pady=20)
-        self.file_frame.set_selected_columns_variables(self.preview_frame.check_vars)
-        self.logging_frame = LoggingFrame(self, self.__translations, row=2, column=0, columnspan=1, padx=20, pady=20)
+        self.file_frame = FileSelectionFrame(self, self.__translations, self.task_runner, row=1, column=0,
+                                             padx=20, pady=20)
+        self.preview_frame = PreviewFrame(self, self.__translations, self.task_runner, row=1, column=1,
+                                          rowspan=2, padx=20, pady=20)
+        self.file_frame.set_column_selection(self.preview_frame.column_selection)
+        self.logging_frame = LoggingFrame(self, self.__translations, row=2, column=0, columnspan=1, padx=20,
+                                          pady=20)
@@ -3,6 +3,11 @@ from tkinter import ttk, filedialog
 import resources.style as style
 import logic.logging as log
 
+# Maximum number of lines shown, older lines are removed. The saved logs contain every entry
+MAX_LOG_LINES: int = 1000
+# Interval in milliseconds in which the buffered log entries are shown
+FLUSH_INTERVAL: int = 100
+
 
 class LoggingFrame(tk.Frame):
     """
@@ -16,9 +21,12 @@ class LoggingFrame(tk.Frame):
     save_button: tk.Button
 
     __translations: dict
+    __buffer: log.LogBuffer
+    __max_lines: int
+    __line_count: int
 
-    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, row: int = 1, column: int = 0, columnspan: int = 2,
-                 padx: int = 20, pady: int = 20):
+    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, row: int = 1, column: int = 0,
+                 columnspan: int = 2, padx: int = 20, pady: int = 20, max_lines: int = MAX_LOG_LINES):
         """
         Initialize the LoggingFrame.
 
@@ -30,6 +38,7 @@ class LoggingFrame(tk.Frame):
             columnspan (int): The number of columns the frame spans in the grid.
             padx (int): The horizontal padding around the frame.
             pady (int): The vertical padding around the frame.
+            max_lines (int): The maximum number of shown lines.
         """
         super().__init__(root)
         self.grid(row=row, column=column, columnspan=columnspan, sticky=tk.NSEW, padx=padx, pady=pady)
@@ -38,6 +47,9 @@ class LoggingFrame(tk.Frame):
         self.columnconfigure(0, weight=1)
 
         self.__translations = translations
+        self.__buffer = log.LogBuffer(max_entries=max_lines)
+        self.__max_lines = max_lines
+        self.__line_count = 0
 
         # log label
         self.log_label = tk.Label(self, font=style.default_font, text=translations["log.title"])
@@ -61,20 +73,49 @@ class LoggingFrame(tk.Frame):
         self.save_button.grid(row=0, column=0, sticky=tk.E, ipadx=style.button_x_padding,
                               ipady=style.button_y_padding)
 
-        # Add a log listener to update the log frame
-        log.add_log_listener(self.update_log_frame)
+        # The listener only queues the entries, which may be logged by any thread. A timer of the main loop shows
+        # them in batches, so many events don't flood the main loop with updates of the text area
+        log.add_log_listener(self.__buffer.append)
+        self.after(FLUSH_INTERVAL, self.__flush_log)
 
-    def update_log_frame(self, event: str):
+    def update_log_frame(self, entries: list, dropped: int = 0):
         """
-        Update the log text area with a new log event.
+        Add log entries to the log text area and remove the oldest lines beyond the maximum number of lines.
 
         Args:
-            event (str): The log event to be added to the log text area.
+            entries (list): The log entries to be added to the log text area.
+            dropped (int): The number of entries that were skipped before the entries.
         """
+        if not entries and not dropped:
+            return
+        lines: list = list()
+        if dropped:
+            lines.append(str.format(self.__translations["log.dropped"], dropped))
+        lines.extend(entries)
+        # Only follow the new lines if the end is shown, so scrolling up to read isn't interrupted
+        at_end: bool = self.log_text.yview()[1] >= 1.0
+
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{event}\n")
+        text: str = "".join(f"{line}\n" for line in lines)
+        self.log_text.insert(tk.END, text)
+        # Entries like tracebacks span several lines of the text area
+        self.__line_count += text.count("\n")
+        if self.__line_count > self.__max_lines:
+            # If the oldest lines exceed the maximum number of lines
+            excess: int = self.__line_count - self.__max_lines
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.__line_count = self.__max_lines
         self.log_text.config(state=tk.DISABLED)
-        self.log_text.see(tk.END)
+        if at_end:
+            self.log_text.see(tk.END)
+
+    def __flush_log(self):
+        """
+        Show the buffered log entries and schedule the next run.
+        """
+        entries, dropped = self.__buffer.take()
+        self.update_log_frame(entries, dropped)
+        self.after(FLUSH_INTERVAL, self.__flush_log)
 
     def save_log(self):
         """
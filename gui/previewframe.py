@@ -1,26 +1,32 @@
 import tkinter as tk
 import resources.style as style
-import logic.logging as log
+from gui.task_runner import TaskRunner
+from gui.data_grid import DataGrid
+from gui.column_list import ColumnList
+from logic.column_selection import ColumnSelection
 from logic.xml_dataframe import XMLParser
 import pandas as pd
 
+
 class PreviewFrame(tk.Frame):
     """
     Frame for previewing and selecting columns from the parsed XML data.
     """
 
-    check_vars: dict
+    column_selection: ColumnSelection
     preview_label: tk.Label
-    check_frame: tk.Frame
+    column_list: ColumnList
+    data_grid: DataGrid
 
-    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, row: int = 1, column: int = 0, rowspan: int = 3,
-                 padx: int = 20, pady: int = 20):
+    def __init__(self, root: tk.Frame | tk.Tk, translations: dict, task_runner: TaskRunner, row: int = 1,
+                 column: int = 0, rowspan: int = 3, padx: int = 20, pady: int = 20):
         """
         Initialize the PreviewFrame.
 
         Args:
             root (Frame | Tk): Frame parent. A Tkinter frame or the root Tkinter window.
             translations (dict): A dictionary of translations for UI text.
+            task_runner (TaskRunner): Executes the listener in the main thread.
             row (int): The row position of the frame in the grid.
             column (int): The column position of the frame in the grid.
             rowspan (int): The number of rows the frame spans in the grid.
@@ -28,38 +34,68 @@ class PreviewFrame(tk.Frame):
             pady (int): The vertical padding around the frame.
         """
         super().__init__(root)
-        self.grid(row=row, column=column, rowspan=rowspan, sticky=tk.NW, padx=padx, pady=pady)
+        self.grid(row=row, column=column, rowspan=rowspan, sticky=tk.NSEW, padx=padx, pady=pady)
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(1, weight=1)
 
-        self.check_vars = dict()
+        self.column_selection = ColumnSelection()
 
         self.preview_label = tk.Label(self, font=style.default_font, text=translations["preview"])
         self.preview_label.grid(row=0, column=0, sticky=tk.NW)
 
-        # Frame for checkboxes
-        self.check_frame = tk.Frame(self, width=100)
-        self.check_frame.grid(row=0, column=1, pady=10, sticky=tk.EW)
+        # List of the columns, only the visible columns are rendered
+        self.column_list = ColumnList(self, translations, self.column_selection, row=0, column=1, pady=10)
+
+        # Table of the parsed rows, only the visible rows are rendered
+        self.data_grid = DataGrid(self, translations, row=1, column=0, columnspan=2)
+
+        self.column_selection.add_listener(
+            lambda selection: self.data_grid.set_columns(selection.selected_columns()))
 
-        # Listen for changes in the XML data
-        XMLParser.add_listener(self.update_checkboxes)
+        # Listen for changes in the XML data. The scanned columns are shown before the whole file is parsed
+        XMLParser.add_listener(task_runner.wrap(self.update_dataframe))
+        XMLParser.add_schema_listener(task_runner.wrap(self.update_schema))
+        XMLParser.add_append_listener(task_runner.wrap(self.update_appended))
 
-    def update_checkboxes(self, dataframe: pd.DataFrame):
+    def update_dataframe(self, dataframe: pd.DataFrame):
         """
-        Update the checkboxes based on the columns of the provided dataframe.
+        Update the columns and rows based on the provided dataframe.
 
         Args:
             dataframe (pd.DataFrame): The dataframe containing the parsed XML data.
         """
-        for widget in self.check_frame.winfo_children():
-            widget.destroy()
-        self.check_vars.clear()
-
-        if dataframe is not None:
-            # If the construction of the dataframe was successful
-            for col in dataframe.columns:
-                var = tk.BooleanVar(value=True)
-                # Logs changes to the check state
-                var.trace_add("write", lambda *args, col=col, var=var: log.log_event(
-                    f"Column '{col}' {'selected' if var.get() else 'unselected'}"))
-                chk = tk.Checkbutton(self.check_frame, text=col, variable=var)
-                chk.pack(anchor="w")
-                self.check_vars[col] = var
+        self.update_columns(list(dataframe.columns) if dataframe is not None else None)
+        self.data_grid.set_dataframe(dataframe, self.column_selection.selected_columns())
+
+    def update_appended(self, rows: pd.DataFrame):
+        """
+        Add the columns that only occur in rows appended by an incremental parse.
+
+        Args:
+            rows (pd.DataFrame): The appended rows.
+        """
+        known: set = set(self.column_selection.columns)
+        if any(col not in known for col in rows.columns):
+            self.update_columns(list(XMLParser.dataframe.columns))
+        self.data_grid.set_dataframe(XMLParser.dataframe, self.column_selection.selected_columns(),
+                                     keep_position=True)
+
+    def update_schema(self, schema: pd.DataFrame):
+        """
+        Update the columns based on the scanned schema.
+
+        Args:
+            schema (pd.DataFrame): The scanned columns of the XML file, indexed by the column name.
+        """
+        self.update_columns(list(schema.index) if schema is not None else None)
+        # The rows are shown when the file is parsed
+        self.data_grid.set_dataframe(None)
+
+    def update_columns(self, columns: list | None):
+        """
+        Update the listed columns. Known columns keep their check state, new columns are selected.
+
+        Args:
+            columns (list | None): The columns or None to remove all columns.
+        """
+        self.column_selection.set_columns(columns)
@@ -0,0 +1,101 @@
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable
+import logic.logging as log
+
+
+class TaskRunner:
+    """
+    Runs tasks on worker threads and marshals callbacks back to the Tk main loop.
+    Tkinter widgets may only be used by the main thread, so every callback of a task is queued and
+    executed by a timer of the main loop.
+    """
+
+    __root: tk.Misc
+    __calls: queue.SimpleQueue
+    __poll_interval: int
+
+    def __init__(self, root: tk.Misc, poll_interval: int = 50):
+        """
+        Initialize the TaskRunner and start processing the queued callbacks.
+
+        Args:
+            root (Misc): A Tkinter widget whose main loop executes the callbacks.
+            poll_interval (int): The interval in milliseconds in which queued callbacks are executed.
+        """
+        self.__root = root
+        self.__calls = queue.SimpleQueue()
+        self.__poll_interval = poll_interval
+        self.__root.after(self.__poll_interval, self.__process_calls)
+
+    def call_in_main_thread(self, callback: Callable, *args):
+        """
+        Execute a callback in the main thread. Calls of the main thread itself are executed immediately.
+
+        Args:
+            callback (Callable): The callback function.
+            *args: The arguments of the callback.
+        """
+        if threading.current_thread() is threading.main_thread():
+            callback(*args)
+        else:
+            self.__calls.put((callback, args))
+
+    def wrap(self, callback: Callable) -> Callable:
+        """
+        Wrap a callback, so it is always executed in the main thread, e.g. to register it as listener.
+
+        Args:
+            callback (Callable): The callback function.
+
+        Returns:
+            Callable: A function that can be called from any thread.
+        """
+        return lambda *args: self.call_in_main_thread(callback, *args)
+
+    def run(self, task: Callable[[threading.Event], Any], on_done: Callable[[Any], None]) -> threading.Event:
+        """
+        Run a task on a worker thread.
+
+        Args:
+            task (Callable[[threading.Event], Any]): The task function. It gets the cancel event and should stop
+                as soon as the event is set.
+            on_done (Callable[[Any], None]): Called in the main thread with the return value of the task or the
+                exception if the task raised an unexpected exception.
+
+        Returns:
+            threading.Event: The event to cancel the task.
+        """
+        cancel_event = threading.Event()
+
+        def work():
+            result = None
+            try:
+                result = task(cancel_event)
+            except Exception as e:
+                log.log_error(f"Unexpected error in background task: {e}")
+                # The callback has to tell a failed task from a successful one
+                result = e
+            self.call_in_main_thread(on_done, result)
+
+        threading.Thread(target=work, daemon=True).start()
+        return cancel_event
+
+    def __process_calls(self):
+        """
+        Execute all queued callbacks and schedule the next run. A failing callback is logged and doesn't stop the
+        processing, otherwise every later callback would be dropped.
+        """
+        try:
+            while True:
+                try:
+                    callback, args = self.__calls.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(*args)
+                except Exception as e:
+                    log.log_error(f"Unexpected error in callback of background task: {e}")
+        finally:
+            self.__root.after(self.__poll_interval, self.__process_calls)
@@ -0,0 +1,141 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTreeview(tk.Frame):
+    """
+    Treeview which only contains its visible rows.
+
+    Scrolling doesn't move the Treeview but replaces its rows by the rows at the new position, so millions of rows
+    are shown instantly and the memory is bounded by the viewport. Subclasses provide the rows by overriding
+    row_count and row_values. The items are identified by the position of their row.
+    """
+
+    tree: ttk.Treeview
+    scrollbar_v: ttk.Scrollbar
+    scrollbar_h: ttk.Scrollbar | None
+    visible_rows: int
+
+    __first_row: int
+
+    def __init__(self, root: tk.Frame | tk.Tk, visible_rows: int, horizontal: bool = True, **tree_options):
+        """
+        Initialize the VirtualTreeview. Subclasses call render as soon as they can provide their rows.
+
+        Args:
+            root (Frame | Tk): Frame parent. A Tkinter frame or the root Tkinter window.
+            visible_rows (int): The number of rows shown at once.
+            horizontal (bool): Add a horizontal scrollbar.
+            **tree_options: Options of the Treeview, like columns.
+        """
+        super().__init__(root)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.visible_rows = visible_rows
+        self.__first_row = 0
+
+        self.tree = ttk.Treeview(self, height=visible_rows, selectmode=tk.NONE, **tree_options)
+        self.tree.grid(row=0, column=0, sticky=tk.NSEW)
+
+        # The vertical scrollbar moves through the rows, not the items of the Treeview
+        self.scrollbar_v = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.__scroll)
+        self.scrollbar_v.grid(row=0, column=1, sticky=tk.NS)
+        self.scrollbar_h = None
+        if horizontal:
+            self.scrollbar_h = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+            self.scrollbar_h.grid(row=1, column=0, sticky=tk.EW)
+            self.tree.config(xscrollcommand=self.scrollbar_h.set)
+
+        # Windows and macOS report the wheel as MouseWheel, X11 as the buttons 4 and 5
+        self.tree.bind("<MouseWheel>", lambda event: self.__scroll_rows(-1 if event.delta > 0 else 1, tk.UNITS))
+        self.tree.bind("<Button-4>", lambda event: self.__scroll_rows(-1, tk.UNITS))
+        self.tree.bind("<Button-5>", lambda event: self.__scroll_rows(1, tk.UNITS))
+        self.tree.bind("<Prior>", lambda event: self.__scroll_rows(-1, tk.PAGES))
+        self.tree.bind("<Next>", lambda event: self.__scroll_rows(1, tk.PAGES))
+        self.tree.bind("<Home>", lambda event: self.scroll_to(0))
+        self.tree.bind("<End>", lambda event: self.scroll_to(self.row_count()))
+
+    @property
+    def first_row(self) -> int:
+        """
+        Returns:
+            int: The position of the first shown row.
+        """
+        return self.__first_row
+
+    def row_count(self) -> int:
+        """
+        Returns:
+            int: The number of rows. Overridden by the subclasses.
+        """
+        return 0
+
+    def row_values(self, first: int, last: int) -> list:
+        """
+        Get the values of the visible rows. Overridden by the subclasses.
+
+        Args:
+            first (int): The position of the first visible row.
+            last (int): The position after the last visible row.
+
+        Returns:
+            list: A tuple of the values of the Treeview columns for every row.
+        """
+        return list()
+
+    def scroll_to(self, first_row: int):
+        """
+        Show the rows starting at a row.
+
+        Args:
+            first_row (int): The position of the first shown row. Clamped to the rows.
+        """
+        self.__first_row = first_row
+        self.render()
+
+    def render(self):
+        """
+        Replace the items of the Treeview by the visible rows and update the scrollbar.
+        """
+        children: tuple = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        row_count: int = self.row_count()
+        self.__first_row = max(0, min(self.__first_row, row_count - self.visible_rows))
+        last_row: int = min(self.__first_row + self.visible_rows, row_count)
+
+        if last_row > self.__first_row:
+            for position, values in enumerate(self.row_values(self.__first_row, last_row), self.__first_row):
+                self.tree.insert("", tk.END, iid=str(position), values=values)
+        if row_count:
+            self.scrollbar_v.set(self.__first_row / row_count, last_row / row_count)
+        else:
+            self.scrollbar_v.set(0, 1)
+
+    def __scroll(self, action: str, amount: str, unit: str | None = None):
+        """
+        Handle the commands of the vertical scrollbar.
+
+        Args:
+            action (str): 'moveto' to jump to a fraction of the rows or 'scroll' to move by units or pages.
+            amount (str): The fraction or the number of units or pages.
+            unit (str | None): 'units' or 'pages' for the scroll action.
+        """
+        if action == tk.MOVETO:
+            self.scroll_to(int(float(amount) * self.row_count()))
+        elif action == tk.SCROLL:
+            self.__scroll_rows(int(amount), unit)
+
+    def __scroll_rows(self, amount: int, unit: str) -> str:
+        """
+        Move the shown rows.
+
+        Args:
+            amount (int): The number of rows or pages, negative to move up.
+            unit (str): 'units' for rows or 'pages' for pages.
+
+        Returns:
+            str: 'break', so the event is not handled by the Treeview as well.
+        """
+        self.scroll_to(self.__first_row + amount * (self.visible_rows if unit == tk.PAGES else 1))
+        return "break"
@@ -0,0 +1,143 @@
+"""
+Contains a streaming writer of DataFrame chunks to the columnar Parquet and Feather (Arrow IPC) formats.
+Both formats need the optional pyarrow package.
+"""
+import importlib.util
+import os
+import tempfile
+from typing import Iterable
+import pandas as pd
+
+# pyarrow is only imported when writing, so it doesn't slow down the start
+pyarrow_available: bool = importlib.util.find_spec("pyarrow") is not None
+
+# The supported formats
+PARQUET: str = "parquet"
+FEATHER: str = "feather"
+
+
+def write_arrow(dataframes: Iterable[pd.DataFrame], output_path: str, file_format: str) -> int:
+    """
+    Write DataFrame chunks to a Parquet or Feather file. Only the current chunk is held in memory.
+
+    Both formats need the schema before the first rows, but columns and types can change between chunks, e.g.
+    a column missing in a chunk is empty. Therefore, the chunks are spilled to temporary Arrow IPC streams first
+    and written with the unified schema at the end. Missing columns are filled with nulls and types are
+    promoted, e.g. integers to floats.
+
+    Args:
+        dataframes (Iterable[pd.DataFrame]): The chunks of rows in order.
+        output_path (str): The path of the output file.
+        file_format (str): The format, 'parquet' or 'feather'.
+
+    Returns:
+        int: The number of written rows.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the format is unknown or the types of a column can't be unified.
+        IOError: If the file can't be written.
+    """
+    import pyarrow as pa
+
+    if file_format not in (PARQUET, FEATHER):
+        raise ValueError(f"Unknown file format '{file_format}'")
+
+    rows: int = 0
+    chunks: int = 0
+    with tempfile.TemporaryDirectory() as directory:
+        # Every spilled stream has one schema, a new stream is started when the schema changes
+        spilled: list = list()
+        writer = None
+        try:
+            for dataframe in dataframes:
+                table = _to_table(pa, dataframe)
+                if writer is None or not table.schema.equals(spilled[-1][1]):
+                    if writer is not None:
+                        writer.close()
+                    path = os.path.join(directory, f"{len(spilled)}.arrows")
+                    writer = pa.ipc.new_stream(path, table.schema)
+                    spilled.append((path, table.schema))
+                writer.write_table(table)
+                rows += len(dataframe)
+                chunks += 1
+        finally:
+            if writer is not None:
+                writer.close()
+
+        schema = pa.unify_schemas([schema for path, schema in spilled], promote_options="permissive") \
+            if spilled else pa.schema([])
+        if file_format == FEATHER and chunks > 1:
+            # Arrow IPC files only support one dictionary per column, but every chunk has its own categories
+            schema = pa.schema([field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type)
+                                else field for field in schema])
+        try:
+            _write_spilled(pa, spilled, schema, output_path, file_format)
+        except BaseException:
+            # Don't leave an incomplete file behind
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
+    return rows
+
+
+def _to_table(pa, dataframe: pd.DataFrame):
+    """
+    Convert a DataFrame chunk to an Arrow table. Columns without any value get the null type, so they can be
+    unified with the type of the column in other chunks.
+
+    Args:
+        pa: The pyarrow module.
+        dataframe (pd.DataFrame): The chunk of rows.
+
+    Returns:
+        pa.Table: The chunk as Arrow table.
+    """
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    for i, column in enumerate(table.columns):
+        if column.null_count == len(column) and column.type != pa.null():
+            table = table.set_column(i, table.field(i).name, pa.nulls(len(column)))
+    return table.replace_schema_metadata(None)
+
+
+def _write_spilled(pa, spilled: list, schema, output_path: str, file_format: str):
+    """
+    Write the spilled Arrow IPC streams with the unified schema to the output file.
+
+    Args:
+        pa: The pyarrow module.
+        spilled (list): Tuples of the path and the schema of every spilled stream.
+        schema (pa.Schema): The unified schema.
+        output_path (str): The path of the output file.
+        file_format (str): The format, 'parquet' or 'feather'.
+    """
+    if file_format == PARQUET:
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(output_path, schema)
+    else:
+        writer = pa.ipc.new_file(output_path, schema)
+
+    with writer:
+        for path, _ in spilled:
+            with pa.memory_map(path) as source:
+                for batch in pa.ipc.open_stream(source):
+                    writer.write_table(_conform(pa, pa.Table.from_batches([batch]), schema))
+
+
+def _conform(pa, table, schema):
+    """
+    Add the missing columns of a table and cast it to the unified schema.
+
+    Args:
+        pa: The pyarrow module.
+        table (pa.Table): The table of a spilled batch.
+        schema (pa.Schema): The unified schema.
+
+    Returns:
+        pa.Table: The table with the unified schema.
+    """
+    columns: list = list()
+    for field in schema:
+        index = table.schema.get_field_index(field.name)
+        columns.append(table.column(index).cast(field.type) if index >= 0 else pa.nulls(len(table), field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
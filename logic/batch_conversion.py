@@ -0,0 +1,257 @@
+"""
+Contains the batch conversion of multiple XML files in parallel worker processes.
+
+The files are parsed by a process pool, either into sheets of a single workbook, which the parent writes one
+after another, or into separate workbooks, which the workers write themselves. Only a bounded number of files is
+in flight at once, so the memory of the parent doesn't grow with the size of the batch.
+"""
+import glob
+import multiprocessing
+import os
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import NamedTuple
+import pandas as pd
+import logic.logging as log
+import logic.export as export
+from logic.xml_dataframe import XMLParser
+
+# Number of files submitted per worker process before the oldest result is collected
+FILES_IN_FLIGHT_PER_WORKER: int = 2
+
+
+class ConversionResult(NamedTuple):
+    """
+    Result of the conversion of a single XML file.
+    """
+
+    file_path: str
+    output_path: str | None
+    sheet_name: str | None
+    rows: int
+    seconds: float
+    error: str | None
+
+
+def expand_paths(paths: list | str) -> list:
+    """
+    Expand glob patterns to the matching file paths.
+
+    Args:
+        paths (list | str): File paths or glob patterns. A single string is handled as glob pattern. A path of an
+            existing file is not expanded.
+
+    Returns:
+        list: The matching file paths in the order of the patterns, each pattern sorted by name.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+
+    file_paths: list = list()
+    for path in paths:
+        if glob.has_magic(path) and not os.path.exists(path):
+            # Existing files are used as they are, even if their name contains glob characters like []
+            file_paths.extend(sorted(glob.glob(path, recursive=True)))
+        else:
+            file_paths.append(path)
+    return file_paths
+
+
+def convert_files(paths: list | str, output_path: str, separate_files: bool = False, prettier: bool = True,
+                  workers: int | None = None, **options) -> list:
+    """
+    Convert multiple XML files in parallel worker processes.
+
+    The results are either written as sheets of a single workbook or as separate workbooks, named like the
+    XML files, into the output directory. Workbooks of XML files with the same name get an index, like
+    'items_1.xlsx'. Timing and errors of every file are reported to the log.
+
+    Args:
+        paths (list | str): File paths or glob patterns of the XML files.
+        output_path (str): The XLSX file or, for separate files, the output directory.
+        separate_files (bool): Write every XML file to its own workbook instead of its own sheet.
+        prettier (bool): Adjust the column width to the content size.
+        workers (int | None): The number of worker processes. Defaults to the number of CPUs.
+        **options: Parse options passed to XMLParser.read_dataframe.
+
+    Returns:
+        list: A ConversionResult for every XML file in the order of the paths.
+    """
+    file_paths: list = expand_paths(paths)
+    log.log_event(f"Start batch conversion of {len(file_paths)} XML files to {output_path}")
+    if separate_files:
+        os.makedirs(output_path, exist_ok=True)
+
+    start = time.perf_counter()
+    results: list = list()
+    # Spawned workers don't inherit listeners of the parent, like GUI callbacks
+    context = multiprocessing.get_context("spawn")
+    max_workers: int = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        # The submitted files in the order of the paths. A parsed DataFrame is held by the parent until its sheet
+        # is written, so only a few files are submitted ahead
+        in_flight: deque = deque()
+        # The workbooks of files with the same name in different directories get unique names
+        reserved_paths: set = set()
+        for file_path in file_paths:
+            if separate_files:
+                # The workers write their own workbooks
+                file_output_path = _reserve_output_path(
+                    os.path.join(output_path, export.default_sheet_name(file_path) + ".xlsx"), reserved_paths)
+                future = executor.submit(_convert_file, file_path, file_output_path, prettier, options)
+            else:
+                future = executor.submit(_parse_file, file_path, options)
+            in_flight.append((file_path, future))
+
+            if len(in_flight) >= max_workers * FILES_IN_FLIGHT_PER_WORKER:
+                results.append(_collect_result(*in_flight.popleft(), output_path, separate_files, prettier))
+        while in_flight:
+            results.append(_collect_result(*in_flight.popleft(), output_path, separate_files, prettier))
+
+    failed = sum(1 for result in results if result.error is not None)
+    log.log_event(f"Finished batch conversion of {len(results)} files with {failed} errors "
+                  f"in {time.perf_counter() - start:.2f} s")
+    return results
+
+
+def _collect_result(file_path: str, future: Future, output_path: str, separate_files: bool,
+                    prettier: bool) -> ConversionResult:
+    """
+    Wait for the worker of a file, write its sheet if needed and log the result.
+
+    Args:
+        file_path (str): The path of the XML file.
+        future (Future): The future of the worker task.
+        output_path (str): The XLSX file or, for separate files, the output directory.
+        separate_files (bool): The worker wrote its own workbook.
+        prettier (bool): Adjust the column width to the content size.
+
+    Returns:
+        ConversionResult: The result of the conversion.
+    """
+    if separate_files:
+        result = _get_result(file_path, future)
+    else:
+        # The sheets are written one after another to the single workbook
+        result = _write_sheet(file_path, future, output_path, prettier)
+
+    if result.error is None:
+        log.log_event(f"Converted {file_path} with {result.rows} rows in {result.seconds:.2f} s")
+    else:
+        log.log_error(f"Error while converting {file_path} after {result.seconds:.2f} s: {result.error}")
+    return result
+
+
+def _reserve_output_path(output_path: str, reserved_paths: set) -> str:
+    """
+    Reserve an output path that no other file of the batch uses, by appending the next unused index to the file
+    name. The paths are compared independent of the case, like on Windows and macOS.
+
+    Args:
+        output_path (str): The preferred file path.
+        reserved_paths (set): The case folded paths reserved by other files of the batch. The reserved path is
+            added.
+
+    Returns:
+        str: The preferred file path or, if it is already reserved, the first unreserved 'name_i.extension'.
+    """
+    base_path, extension = os.path.splitext(output_path)
+    i = 1
+    while output_path.casefold() in reserved_paths:
+        output_path = f"{base_path}_{i}{extension}"
+        i += 1
+    reserved_paths.add(output_path.casefold())
+    return output_path
+
+
+def _get_result(file_path: str, future: Future) -> ConversionResult:
+    """
+    Wait for the result of a worker. Errors of the worker process itself are turned into a failed result.
+
+    Args:
+        file_path (str): The path of the XML file.
+        future (Future): The future of the worker task.
+
+    Returns:
+        ConversionResult: The result of the conversion.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return ConversionResult(file_path, None, None, 0, 0.0, str(e))
+
+
+def _write_sheet(file_path: str, future: Future, output_path: str, prettier: bool) -> ConversionResult:
+    """
+    Wait for the DataFrame parsed by a worker and add it as sheet to the workbook.
+
+    Args:
+        file_path (str): The path of the XML file.
+        future (Future): The future of the worker task returning the parse result and the DataFrame.
+        output_path (str): The path of the XLSX file.
+        prettier (bool): Adjust the column width to the content size.
+
+    Returns:
+        ConversionResult: The result of the conversion including the time of writing the sheet.
+    """
+    try:
+        result, dataframe = future.result()
+    except Exception as e:
+        return ConversionResult(file_path, None, None, 0, 0.0, str(e))
+    if dataframe is None:
+        return result
+
+    start = time.perf_counter()
+    try:
+        sheet_name = export.export_dataframe(dataframe, output_path, export.default_sheet_name(file_path),
+                                             prettier=prettier)
+    except (IOError, ValueError) as e:
+        # If the sheet can't be written, e.g. because of an invalid sheet name
+        return result._replace(seconds=result.seconds + time.perf_counter() - start, error=str(e))
+    return result._replace(output_path=output_path, sheet_name=sheet_name,
+                           seconds=result.seconds + time.perf_counter() - start)
+
+
+def _parse_file(file_path: str, options: dict) -> tuple[ConversionResult, pd.DataFrame | None]:
+    """
+    Parse an XML file in a worker process.
+
+    Args:
+        file_path (str): The path of the XML file.
+        options (dict): Parse options passed to XMLParser.read_dataframe.
+
+    Returns:
+        tuple[ConversionResult, pd.DataFrame | None]: The parse result and the DataFrame, None on errors.
+    """
+    start = time.perf_counter()
+    try:
+        dataframe = XMLParser.read_dataframe(file_path, **options)
+    except (ET.ParseError, OSError, ValueError) as e:
+        return ConversionResult(file_path, None, None, 0, time.perf_counter() - start, str(e)), None
+    return ConversionResult(file_path, None, None, len(dataframe), time.perf_counter() - start, None), dataframe
+
+
+def _convert_file(file_path: str, output_path: str, prettier: bool, options: dict) -> ConversionResult:
+    """
+    Parse an XML file and write it to its own workbook in a worker process.
+
+    Args:
+        file_path (str): The path of the XML file.
+        output_path (str): The path of the XLSX file.
+        prettier (bool): Adjust the column width to the content size.
+        options (dict): Parse options passed to XMLParser.read_dataframe.
+
+    Returns:
+        ConversionResult: The result of the conversion.
+    """
+    start = time.perf_counter()
+    try:
+        dataframe = XMLParser.read_dataframe(file_path, **options)
+        sheet_name = export.export_dataframe(dataframe, output_path, export.default_sheet_name(file_path),
+                                             prettier=prettier)
+    except (ET.ParseError, OSError, ValueError) as e:
+        # ValueError is raised for an invalid sheet name or a ZIP archive without a single XML file
+        return ConversionResult(file_path, None, None, 0, time.perf_counter() - start, str(e))
+    return ConversionResult(file_path, output_path, sheet_name, len(dataframe), time.perf_counter() - start, None)
@@ -0,0 +1,218 @@
+"""
+Contains the command line interface to convert XML files without the GUI.
+
+Run from the project root:
+    python main.py items.xml --output items.xlsx --columns name,value
+"""
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+import logic.logging as log
+import logic.export as export
+import logic.type_inference as type_inference
+from logic.record_filter import RecordFilter
+from logic.record_path import RecordPath
+from logic.batch_conversion import expand_paths
+from logic.xml_dataframe import XMLParser
+
+# Exit codes
+EXIT_SUCCESS: int = 0
+EXIT_FAILURE: int = 1
+EXIT_USAGE: int = 2
+EXIT_INTERRUPTED: int = 130
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """
+    Create the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser.
+    """
+    parser = argparse.ArgumentParser(prog="forkium", description="Convert XML files to sheets of an Excel file "
+                                                                 "or to CSV, Parquet or Feather files")
+    parser.add_argument("inputs", nargs="+", metavar="INPUT", help="XML files, also compressed as .gz, .bz2, .xz or "
+                                                                 ".zip, or glob patterns like 'data/*.xml'")
+    parser.add_argument("-o", "--output", required=True,
+                        help="the XLSX file, new sheets are added if it exists. The extension .csv, .parquet or "
+                             ".feather selects another format, only a single input can be written to it")
+    parser.add_argument("-f", "--format", dest="export_format", choices=export.export_formats, default=None,
+                        help="the output format. Defaults to the format of the output extension")
+    parser.add_argument("-c", "--columns", action="append", metavar="COLUMNS",
+                        help="comma separated columns to export, can be repeated. Defaults to every column")
+    parser.add_argument("--filter", dest="record_filter", metavar="EXPRESSION",
+                        help="only export the records matching the expression, like "
+                             "'state == \"NEW\" and date >= \"2024-01-01\"'")
+    parser.add_argument("--record-path", metavar="PATH",
+                        help="the path of the record elements, like 'items/item' or '//item'. "
+                             "Defaults to the children of the root element")
+    parser.add_argument("-s", "--sheet-name", default="{name}",
+                        help="the sheet name, '{name}' is replaced by the XML file name without extension. "
+                             "Used names get the next unused index (default: '{name}')")
+    parser.add_argument("--split", choices=export.split_modes + ["none"], default=export.SPLIT_SHEETS,
+                        help="split rows beyond the row limit of Excel into sheets or workbooks, "
+                             "'none' fails instead (default: sheets)")
+    parser.add_argument("--no-prettier", dest="prettier", action="store_false",
+                        help="don't adjust the column width to the content size")
+    parser.add_argument("--no-infer-types", dest="infer_types", action="store_false",
+                        help="export every value as text instead of numbers, booleans and dates")
+    parser.add_argument("--schema", action="append", metavar="SCHEMA",
+                        help="comma separated column types like 'price:float,state:category', can be repeated. "
+                             f"Types: {', '.join(type_inference.column_types)}")
+    parser.add_argument("--backend", default=None, help="the XML parser backend, 'lxml' or 'etree'")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes to parse a large XML file")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print errors")
+    return parser
+
+
+def parse_columns(values: list | None) -> list | None:
+    """
+    Split the column arguments into the column names.
+
+    Args:
+        values (list | None): The values of the column arguments, each containing comma separated names.
+
+    Returns:
+        list | None: The column names in the given order without duplicates or None if no column was given.
+    """
+    if not values:
+        return None
+    columns: dict = dict()
+    for value in values:
+        columns.update(dict.fromkeys(column.strip() for column in value.split(",") if column.strip()))
+    return list(columns)
+
+
+def convert_file(file_path: str, output_path: str, columns: list | None, sheet_name: str, prettier: bool,
+                 export_format: str | None = None, split: str | None = export.SPLIT_SHEETS,
+                 **options) -> str | None:
+    """
+    Parse an XML file and export the selected columns as sheet of an XLSX file, like the export of the GUI.
+
+    Args:
+        file_path (str): The path of the XML file.
+        output_path (str): The path of the XLSX file.
+        columns (list | None): The columns to export or None for every column.
+        sheet_name (str): The preferred name of the sheet.
+        prettier (bool): Adjust the column width to the content size.
+        export_format (str | None): The export format. Defaults to the format of the output extension.
+        split (str | None): Split rows beyond the row limit of Excel into 'sheets' or 'workbooks', None fails.
+        **options: Parse options passed to XMLParser.read_dataframe, like infer_types or schema.
+
+    Returns:
+        str | None: The name of the written sheet or None for formats without sheets.
+
+    Raises:
+        ET.ParseError: If the XML file contains an error.
+        KeyError: If a selected column doesn't exist in the XML file.
+        OSError: If a file can't be read or written.
+        ImportError: If the export format needs pyarrow, which is not installed.
+    """
+    # Only the selected columns are extracted while parsing
+    dataframe = XMLParser.read_dataframe(file_path, streaming=True, columns=columns, **options)
+    if columns is not None:
+        missing: list = [column for column in columns if column not in dataframe.columns]
+        if missing:
+            raise KeyError(f"Columns not found: {', '.join(missing)}")
+        dataframe = dataframe[columns]
+    return export.export_dataframe(dataframe, output_path, sheet_name, prettier=prettier, export_format=export_format,
+                                   split=split)
+
+
+def main(argv: list | None = None) -> int:
+    """
+    Convert the XML files given by the command line arguments.
+
+    Args:
+        argv (list | None): The command line arguments without the program name. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code. 0 if every file was converted, 1 if a file failed, 2 for invalid arguments and
+            130 if the conversion was interrupted.
+    """
+    parser = create_argument_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        # argparse exits after printing the usage or help
+        return e.code if isinstance(e.code, int) else EXIT_USAGE
+
+    if args.workers < 1:
+        parser.print_usage(sys.stderr)
+        print(f"{parser.prog}: error: --workers must be at least 1", file=sys.stderr)
+        return EXIT_USAGE
+
+    # Print the log, like the log frame of the GUI
+    listener = None if args.quiet else (lambda entry: print(entry, file=sys.stderr))
+    if listener is not None:
+        log.add_log_listener(listener)
+    try:
+        return _convert(parser, args)
+    finally:
+        if listener is not None:
+            log.remove_log_listener(listener)
+
+
+def _convert(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """
+    Convert the XML files of the parsed command line arguments.
+
+    Args:
+        parser (argparse.ArgumentParser): The argument parser, used for the program name.
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        int: The exit code.
+    """
+    file_paths: list = expand_paths(args.inputs)
+    if not file_paths:
+        print(f"{parser.prog}: error: no XML file matches {' '.join(args.inputs)}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    export_format: str = args.export_format or export.get_export_format(args.output)
+    if export_format != export.XLSX and len(file_paths) > 1:
+        print(f"{parser.prog}: error: {export_format.upper()} files can't contain multiple XML files",
+              file=sys.stderr)
+        return EXIT_USAGE
+
+    columns = parse_columns(args.columns)
+    try:
+        schema: dict = type_inference.parse_schema(args.schema)
+        record_filter = RecordFilter(args.record_filter) if args.record_filter is not None else None
+        if args.record_path is not None:
+            RecordPath(args.record_path)
+    except ValueError as e:
+        parser.print_usage(sys.stderr)
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    failed: int = 0
+    try:
+        for file_path in file_paths:
+            start = time.perf_counter()
+            sheet_name = args.sheet_name.replace("{name}", export.default_sheet_name(file_path))
+            try:
+                sheet_name = convert_file(file_path, args.output, columns, sheet_name, args.prettier, export_format,
+                                          None if args.split == "none" else args.split, backend=args.backend,
+                                          workers=args.workers, infer_types=args.infer_types, schema=schema,
+                                          categorical=True, record_filter=record_filter,
+                                          record_path=args.record_path)
+            except (ET.ParseError, KeyError, ValueError, OSError, ImportError) as e:
+                # Continue with the next file, the exit code reports the failure
+                failed += 1
+                message = e.args[0] if isinstance(e, KeyError) else str(e)
+                log.log_error(f"Error while converting {file_path}: {message}")
+                if args.quiet:
+                    print(f"{parser.prog}: error: {file_path}: {message}", file=sys.stderr)
+                continue
+            target = args.output if sheet_name is None else f"sheet '{sheet_name}'"
+            log.log_event(f"Converted {file_path} to {target} in {time.perf_counter() - start:.2f} s")
+    except KeyboardInterrupt:
+        log.log_error("Conversion interrupted")
+        return EXIT_INTERRUPTED
+
+    return EXIT_FAILURE if failed else EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
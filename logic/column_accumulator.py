@@ -0,0 +1,193 @@
+from array import array
+import numpy as np
+import pandas as pd
+
+# Code of a missing value in the categorical mode
+MISSING_CODE: int = -1
+# Number of rows after which the dictionaries are checked in the categorical mode
+DICTIONARY_CHECK_INTERVAL: int = 10000
+# Columns with a larger ratio of distinct values store the values themselves in the categorical mode
+MAX_DICTIONARY_RATIO: float = 0.5
+
+
+class ColumnAccumulator:
+    """
+    Collecting parsed values column by column instead of one dictionary per row.
+
+    In the categorical mode every distinct value of a column is stored once in a dictionary and the rows only
+    store the code of the value, which keeps the memory low for repetitive values like status or country codes.
+    Columns with mostly distinct values, like names or identifiers, switch back to storing the values, because
+    their dictionary would only add memory.
+    """
+
+    columns: list
+    row_count: int
+    categorical: bool
+
+    # Maps every column name to its list of values or array of codes
+    __index: dict
+    # The lists of values or arrays of codes in the order of the columns
+    __values: list
+    # Maps the column names to the dictionary of their values and codes in the categorical mode
+    __dictionaries: dict | None
+    # Whether rows were discarded, their values can remain in the dictionaries
+    __discarded: bool
+
+    def __init__(self, columns: list | None = None, categorical: bool = False):
+        """
+        Initialize the ColumnAccumulator.
+
+        Args:
+            columns (list | None): Columns that are known before the first value is set.
+            categorical (bool): Store codes of the values and construct categorical columns.
+        """
+        self.columns = list()
+        self.row_count = 0
+        self.categorical = categorical
+        self.__index = dict()
+        self.__values = list()
+        self.__dictionaries = dict() if categorical else None
+        self.__discarded = False
+        for column in columns or list():
+            self.add_column(column)
+
+    def add_column(self, column: str) -> list | array:
+        """
+        Add a column if it is not known yet.
+
+        Args:
+            column (str): The name of the column.
+
+        Returns:
+            list | array: The values or the codes of the column.
+        """
+        values: list | array | None = self.__index.get(column)
+        if values is None:
+            # New columns are appended in first-seen order
+            values = self.__new_values()
+            self.__index[column] = values
+            self.columns.append(column)
+            self.__values.append(values)
+            if self.__dictionaries is not None:
+                self.__dictionaries[column] = dict()
+        return values
+
+    def set_value(self, column: str, value):
+        """
+        Set the value of a column in the current row.
+        Rows in which the column was missing so far are back-filled with NaN.
+
+        Args:
+            column (str): The name of the column.
+            value: The value of the column in the current row.
+        """
+        values: list | array | None = self.__index.get(column)
+        if values is None:
+            values = self.add_column(column)
+        dictionary: dict | None = self.__dictionaries.get(column) if self.__dictionaries is not None else None
+        if dictionary is not None:
+            # Store the code of the value, a new value gets the next code
+            value = MISSING_CODE if value is None else dictionary.setdefault(value, len(dictionary))
+
+        missing: int = self.row_count - len(values)
+        if missing:
+            if missing < 0:
+                # If the column was already set in the current row, the last value wins
+                values[-1] = value
+                return
+            values.extend(self.__missing_values(column, missing))
+        values.append(value)
+
+    def end_row(self):
+        """
+        Finish the current row. The following values belong to the next row.
+        """
+        self.row_count += 1
+        if self.__dictionaries and self.row_count % DICTIONARY_CHECK_INTERVAL == 0:
+            self.__drop_large_dictionaries()
+
+    def discard_row(self):
+        """
+        Remove the values of the current row, e.g. of a record that doesn't match a filter.
+        Found columns are kept, even if they only contained values of discarded rows.
+        """
+        for values in self.__values:
+            if len(values) > self.row_count:
+                del values[self.row_count:]
+        self.__discarded = True
+
+    def to_dataframe(self, columns: list | None = None) -> pd.DataFrame:
+        """
+        Construct a DataFrame of the accumulated rows.
+
+        Args:
+            columns (list | None): The columns of the DataFrame. Defaults to all found columns in first-seen order.
+
+        Returns:
+            pd.DataFrame: The DataFrame of the accumulated rows. In the categorical mode the columns that store codes
+                are categorical.
+        """
+        data: dict = dict()
+        for column, values in zip(self.columns, self.__values):
+            # Back-fill the columns that are missing in the last rows
+            missing: int = self.row_count - len(values)
+            if missing > 0:
+                values.extend(self.__missing_values(column, missing))
+
+            dictionary: dict | None = self.__dictionaries.get(column) if self.__dictionaries is not None else None
+            if dictionary is None:
+                data[column] = values
+            else:
+                codes = np.frombuffer(values, dtype=np.int32).copy()
+                data[column] = pd.Categorical.from_codes(codes, categories=list(dictionary))
+                if self.__discarded:
+                    # Drop the values that only occurred in discarded rows
+                    data[column] = data[column].remove_unused_categories()
+        if columns is None:
+            columns = self.columns
+        return pd.DataFrame(data, columns=columns, index=pd.RangeIndex(self.row_count))
+
+    def reset(self):
+        """
+        Remove the accumulated rows but keep the known columns.
+        """
+        self.row_count = 0
+        self.__values = [self.__new_values() for _ in self.columns]
+        self.__index = dict(zip(self.columns, self.__values))
+        if self.__dictionaries is not None:
+            self.__dictionaries = {column: dict() for column in self.columns}
+        self.__discarded = False
+
+    def __new_values(self) -> list | array:
+        """
+        Returns:
+            list | array: An empty list of values or an empty array of 32-bit codes in the categorical mode.
+        """
+        return list() if self.__dictionaries is None else array("i")
+
+    def __missing_values(self, column: str, count: int) -> list:
+        """
+        Args:
+            column (str): The name of the column.
+            count (int): The number of missing values.
+
+        Returns:
+            list: NaN or the missing code if the column stores codes for every missing value.
+        """
+        if self.__dictionaries is not None and column in self.__dictionaries:
+            return [MISSING_CODE] * count
+        return [np.nan] * count
+
+    def __drop_large_dictionaries(self):
+        """
+        Switch the columns with mostly distinct values from codes back to the values.
+        """
+        for i, column in enumerate(self.columns):
+            dictionary: dict | None = self.__dictionaries.get(column)
+            if dictionary is None or len(dictionary) <= self.row_count * MAX_DICTIONARY_RATIO:
+                continue
+            categories: list = list(dictionary)
+            values: list = [categories[code] if code != MISSING_CODE else np.nan for code in self.__values[i]]
+            self.__values[i] = values
+            self.__index[column] = values
+            del self.__dictionaries[column]
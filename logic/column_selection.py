@@ -0,0 +1,158 @@
+"""
+Contains the selection of the exported columns, which scales to thousands of columns.
+The states are stored as one flag per column instead of one variable per column.
+"""
+import re
+from typing import Callable
+
+
+class ColumnSelection:
+    """
+    The columns of the parsed XML data and which of them are selected.
+    """
+
+    columns: list
+
+    # Maps every column to its position
+    __index: dict
+    # One flag per column, 1 if it is selected
+    __selected: bytearray
+    __listeners: list
+
+    def __init__(self, columns: list | None = None):
+        """
+        Initialize the ColumnSelection. Every column is selected.
+
+        Args:
+            columns (list | None): The columns in their order.
+        """
+        self.columns = list()
+        self.__index = dict()
+        self.__selected = bytearray()
+        self.__listeners = list()
+        self.set_columns(columns)
+
+    def set_columns(self, columns: list | None):
+        """
+        Replace the columns. Known columns keep their state, new columns are selected.
+
+        Args:
+            columns (list | None): The columns in their order or None to remove every column.
+        """
+        columns = list(columns) if columns is not None else list()
+        selected: bytearray = bytearray(self.__selected[self.__index[column]] if column in self.__index else 1
+                                        for column in columns)
+        self.columns = columns
+        self.__index = {column: i for i, column in enumerate(columns)}
+        self.__selected = selected
+        self.__notify()
+
+    def is_selected(self, column: str) -> bool:
+        """
+        Args:
+            column (str): The name of the column.
+
+        Returns:
+            bool: True if the column is selected, False if it is not selected or unknown.
+        """
+        position: int | None = self.__index.get(column)
+        return position is not None and bool(self.__selected[position])
+
+    def toggle(self, column: str) -> bool:
+        """
+        Select an unselected column or unselect a selected one.
+
+        Args:
+            column (str): The name of the column.
+
+        Returns:
+            bool: True if the column is selected now.
+
+        Raises:
+            KeyError: If the column is unknown.
+        """
+        position: int = self.__index[column]
+        self.__selected[position] ^= 1
+        self.__notify()
+        return bool(self.__selected[position])
+
+    def select(self, columns: list | None = None, selected: bool = True) -> int:
+        """
+        Select or unselect columns.
+
+        Args:
+            columns (list | None): The columns. Defaults to every column. Unknown columns are ignored.
+            selected (bool): Select the columns or unselect them.
+
+        Returns:
+            int: The number of changed columns.
+        """
+        flag: int = int(selected)
+        if columns is None:
+            changed: int = len(self.__selected) - self.__selected.count(flag)
+            self.__selected = bytearray([flag]) * len(self.columns)
+        else:
+            changed = 0
+            for column in columns:
+                position: int | None = self.__index.get(column)
+                if position is not None and self.__selected[position] != flag:
+                    self.__selected[position] = flag
+                    changed += 1
+        if changed:
+            self.__notify()
+        return changed
+
+    def selected_columns(self) -> list:
+        """
+        Returns:
+            list: The selected columns in their order.
+        """
+        return [column for column, selected in zip(self.columns, self.__selected) if selected]
+
+    def selected_count(self) -> int:
+        """
+        Returns:
+            int: The number of selected columns.
+        """
+        return self.__selected.count(1)
+
+    def search(self, text: str, regex: bool = False) -> list:
+        """
+        Find the columns matching a search text, independent of the case.
+
+        Args:
+            text (str): The text contained in the column names or a regular expression. Empty to match every column.
+            regex (bool): Search for the regular expression instead of the text.
+
+        Returns:
+            list: The matching columns in their order.
+
+        Raises:
+            ValueError: If the regular expression is invalid.
+        """
+        if not text:
+            return list(self.columns)
+        if regex:
+            try:
+                pattern = re.compile(text, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression '{text}': {e}") from e
+            return [column for column in self.columns if pattern.search(column)]
+        text = text.casefold()
+        return [column for column in self.columns if text in column.casefold()]
+
+    def add_listener(self, listener: Callable):
+        """
+        Add a listener that will be notified when the columns or their states change.
+
+        Args:
+            listener (Callable): The listener function to be added. It gets the selection.
+        """
+        self.__listeners.append(listener)
+
+    def __notify(self):
+        """
+        Notify all listeners.
+        """
+        for listener in self.__listeners:
+            listener(self)
@@ -0,0 +1,51 @@
+"""
+Contains a streaming CSV writer for DataFrame chunks.
+"""
+import csv
+import os
+import shutil
+import tempfile
+from typing import Iterable
+import pandas as pd
+
+
+def write_csv(dataframes: Iterable[pd.DataFrame], output_path: str) -> int:
+    """
+    Write DataFrame chunks to a CSV file. Only the current chunk is held in memory.
+
+    The rows are written to a temporary file first and the header is written when all chunks are known, so
+    columns found in later chunks are added to the header. Rows written before a column was found end before
+    its field, which CSV readers like pandas read as empty values.
+
+    Args:
+        dataframes (Iterable[pd.DataFrame]): The chunks of rows in order.
+        output_path (str): The path of the CSV file.
+
+    Returns:
+        int: The number of written rows.
+
+    Raises:
+        IOError: If the file can't be written.
+    """
+    # Maps every column name to its position
+    positions: dict = dict()
+    rows: int = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="") as body:
+        for dataframe in dataframes:
+            for column in dataframe.columns:
+                positions.setdefault(column, len(positions))
+            # Fields of every column found so far in the order of the header
+            dataframe.reindex(columns=list(positions)).to_csv(body, header=False, index=False, lineterminator="\r\n")
+            rows += len(dataframe)
+
+        body.seek(0)
+        try:
+            with open(output_path, "w", encoding="utf-8", newline="") as file:
+                csv.writer(file, lineterminator="\r\n").writerow(list(positions))
+                shutil.copyfileobj(body, file, 1024 * 1024)
+        except BaseException:
+            # Don't leave an incomplete file behind
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
+    return rows
@@ -0,0 +1,320 @@
+import os
+import sys
+import threading
+from typing import Callable, Iterable, Iterator, Sequence
+import pandas as pd
+import logic.logging as log
+import logic.arrow_writer as arrow_writer
+from logic.csv_writer import write_csv
+import logic.xlsx_writer as xlsx_writer
+import logic.xml_input as xml_input
+from logic.xlsx_writer import XLSXWriter
+
+# Supported export formats by their file extension
+XLSX: str = "xlsx"
+CSV: str = "csv"
+PARQUET: str = arrow_writer.PARQUET
+FEATHER: str = arrow_writer.FEATHER
+export_formats: list = [XLSX, CSV, PARQUET, FEATHER]
+
+# How rows beyond the row limit of Excel are exported
+SPLIT_SHEETS: str = "sheets"
+SPLIT_WORKBOOKS: str = "workbooks"
+split_modes: list = [SPLIT_SHEETS, SPLIT_WORKBOOKS]
+
+# With progress or canceling, a DataFrame is written in chunks of this number of rows
+EXPORT_CHUNK_ROWS: int = 50000
+
+
+class ExportCanceledError(Exception):
+    """
+    Raised if the export of a DataFrame was canceled.
+    """
+
+
+def default_sheet_name(file_path: str) -> str:
+    """
+    Get the sheet name for the data of an XML file, which is the file name without extension. The extension of a
+    compressed file is removed too, e.g. 'items.xml.gz' results in 'items'.
+
+    Args:
+        file_path (str): The path of the XML file.
+
+    Returns:
+        str: The sheet name.
+    """
+    return xml_input.strip_extensions(os.path.basename(file_path))
+
+
+def available_export_formats() -> list:
+    """
+    Get the export formats that can be written. Parquet and Feather need the optional pyarrow package.
+
+    Returns:
+        list: The available export formats.
+    """
+    return [export_format for export_format in export_formats
+            if export_format not in (PARQUET, FEATHER) or arrow_writer.pyarrow_available]
+
+
+def get_export_format(output_path: str) -> str:
+    """
+    Get the export format of an output file by its extension.
+
+    Args:
+        output_path (str): The path of the output file.
+
+    Returns:
+        str: The export format. Defaults to XLSX for unknown extensions.
+    """
+    extension: str = os.path.splitext(output_path)[1].lower().lstrip(".")
+    if extension in ("arrow", "ipc"):
+        # Feather version 2 is the Arrow IPC file format
+        return FEATHER
+    return extension if extension in export_formats else XLSX
+
+
+def _open_workbook(output_path: str) -> XLSXWriter:
+    """
+    Open a writer of a new workbook or, if the file already exists, of the existing workbook.
+
+    Args:
+        output_path (str): The path of the XLSX file.
+
+    Returns:
+        XLSXWriter: The writer.
+
+    Raises:
+        IOError: If the file can't be opened.
+    """
+    if os.path.exists(output_path):
+        # If the Excel file already exists
+        log.log_event(f"Add a new sheet to the existing workbook {output_path}")
+        return XLSXWriter(output_path, append=True)
+    log.log_event(f"Create a new workbook {output_path}")
+    return XLSXWriter(output_path)
+
+
+def _check_row_limit(dataframes: Iterable[pd.DataFrame], max_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Pass the chunks through and fail as soon as they exceed the row limit.
+
+    Args:
+        dataframes (Iterable[pd.DataFrame]): The chunks of rows in order.
+        max_rows (int): The maximum number of rows.
+
+    Yields:
+        pd.DataFrame: The chunks.
+
+    Raises:
+        ValueError: If the chunks contain more rows than allowed.
+    """
+    rows: int = 0
+    for dataframe in dataframes:
+        rows += len(dataframe)
+        if rows > max_rows:
+            raise ValueError(f"The rows exceed the limit of {max_rows} rows of an Excel sheet")
+        yield dataframe
+
+
+def _track_progress(dataframes: Iterable[pd.DataFrame], progress: Callable[[int], None] | None,
+                    cancel_event: threading.Event | None) -> Iterable[pd.DataFrame]:
+    """
+    Pass the chunks through, report the written rows and stop as soon as the cancel event is set.
+
+    Args:
+        dataframes (Iterable[pd.DataFrame]): The chunks of rows in order.
+        progress (Callable[[int], None] | None): Called with the number of written rows after every chunk.
+        cancel_event (threading.Event | None): The export is canceled before the next chunk if the event is set.
+
+    Returns:
+        Iterable[pd.DataFrame]: The chunks, the given ones without progress and cancel event.
+    """
+    if progress is None and cancel_event is None:
+        return dataframes
+
+    def track() -> Iterator[pd.DataFrame]:
+        rows: int = 0
+        for dataframe in dataframes:
+            if cancel_event is not None and cancel_event.is_set():
+                raise ExportCanceledError(f"Export canceled after {rows} rows")
+            yield dataframe
+            # The writer requests the next chunk after the previous one is written
+            rows += len(dataframe)
+            if progress is not None:
+                progress(rows)
+
+    return track()
+
+
+def find_unused_sheet_name(sheet_names: list, sheet_name: str) -> str:
+    """
+    Find a sheet name that is not used yet by appending the next unused index.
+    Like in Excel, the names are compared case-insensitively.
+
+    Args:
+        sheet_names (list): The names of the existing sheets.
+        sheet_name (str): The preferred sheet name.
+
+    Returns:
+        str: The preferred sheet name or, if it is already used, the first unused 'name_i'.
+    """
+    i = 1
+    base_sheet_name = sheet_name
+    used_names: set = {name.lower() for name in sheet_names}
+    while sheet_name.lower() in used_names:
+        # Find the next unused index if sheet name already exists
+        sheet_name = f"{base_sheet_name}_{i}"
+        i += 1
+    return sheet_name
+
+
+def find_unused_path(output_path: str) -> str:
+    """
+    Find a file path that is not used yet by appending the next unused index to the file name.
+
+    Args:
+        output_path (str): The preferred file path.
+
+    Returns:
+        str: The preferred file path or, if it already exists, the first unused 'name_i.extension'.
+    """
+    base_path, extension = os.path.splitext(output_path)
+    i = 1
+    while os.path.exists(output_path):
+        output_path = f"{base_path}_{i}{extension}"
+        i += 1
+    return output_path
+
+
+def export_dataframe(dataframe: pd.DataFrame, output_path: str, sheet_name: str, prettier: bool = True,
+                     export_format: str | None = None, split: str | None = SPLIT_SHEETS,
+                     progress: Callable[[int], None] | None = None,
+                     cancel_event: threading.Event | None = None) -> str | None:
+    """
+    Save a DataFrame as sheet of an XLSX file. If the file already exists, a new sheet is added.
+    Optionally apply prettier for better readability.
+    CSV, Parquet and Feather files are supported as well, they contain only the DataFrame and are replaced.
+
+    Args:
+        dataframe (pd.DataFrame): The data to be exported.
+        output_path (str): The path of the output file.
+        sheet_name (str): The preferred name of the sheet.
+        prettier (bool): Adjust the column width to the content size.
+        export_format (str | None): The export format. Defaults to the format of the file extension.
+        split (str | None): How rows beyond the row limit of Excel are exported, see export_dataframes.
+        progress (Callable[[int], None] | None): Called regularly with the number of written rows.
+        cancel_event (threading.Event | None): The export is canceled as soon as the event is set.
+
+    Returns:
+        str | None: The name of the (first) written sheet or None for formats without sheets.
+
+    Raises:
+        IOError: If the file can't be written.
+        ImportError: If the export format needs pyarrow, which is not installed.
+        ValueError: If the rows exceed the row limit of Excel and splitting is disabled.
+        ExportCanceledError: If the cancel event was set. No incomplete file is left behind.
+    """
+    log.log_event(f"Exporting {len(dataframe.columns)} columns and {len(dataframe)} rows")
+    dataframes: list = [dataframe]
+    if (progress is not None or cancel_event is not None) and len(dataframe) > EXPORT_CHUNK_ROWS:
+        # The writers request the chunks one after another, which reports the progress in between
+        dataframes = [dataframe.iloc[start:start + EXPORT_CHUNK_ROWS]
+                      for start in range(0, len(dataframe), EXPORT_CHUNK_ROWS)]
+    return export_dataframes(dataframes, output_path, sheet_name, prettier=prettier, export_format=export_format,
+                             split=split, progress=progress, cancel_event=cancel_event)
+
+
+def export_dataframes(dataframes: Iterable[pd.DataFrame], output_path: str, sheet_name: str,
+                      prettier: bool = True, export_format: str | None = None,
+                      split: str | None = SPLIT_SHEETS, progress: Callable[[int], None] | None = None,
+                      cancel_event: threading.Event | None = None) -> str | None:
+    """
+    Save DataFrame chunks, e.g. of XMLParser.iter_dataframes, as one sheet of an XLSX file. The sheet is written
+    by the streaming XLSXWriter, so only one chunk is held in memory at a time. If the file already exists, the
+    new sheet is added without rewriting the existing sheets. Optionally apply prettier for better readability.
+    CSV, Parquet and Feather files are streamed as well, they contain only the chunks and are replaced.
+
+    A sheet holds at most 1,048,575 rows below the header. More rows are split into consecutive sheets 'name',
+    'name_1', ... or into consecutive workbooks 'file.xlsx', 'file_1.xlsx', ... The size of a list of DataFrames
+    is checked before anything is written, a stream is split while it is written.
+
+    Args:
+        dataframes (Iterable[pd.DataFrame]): The chunks of rows in order.
+        output_path (str): The path of the output file.
+        sheet_name (str): The preferred name of the sheet.
+        prettier (bool): Adjust the column width to the content size.
+        export_format (str | None): The export format. Defaults to the format of the file extension.
+        split (str | None): Split rows beyond the row limit into 'sheets' or 'workbooks'. None doesn't split and
+            raises an error instead.
+        progress (Callable[[int], None] | None): Called with the number of written rows after every chunk.
+        cancel_event (threading.Event | None): The export is canceled before the next chunk if the event is set.
+
+    Returns:
+        str | None: The name of the (first) written sheet or None for formats without sheets.
+
+    Raises:
+        IOError: If the file can't be written.
+        ImportError: If the export format needs pyarrow, which is not installed.
+        ValueError: If the export format or split mode is unknown or the rows exceed the row limit of Excel and
+            splitting is disabled.
+        ExportCanceledError: If the cancel event was set. No incomplete file is left behind and an existing
+            workbook is restored.
+    """
+    if export_format is None:
+        export_format = get_export_format(output_path)
+    elif export_format not in export_formats:
+        raise ValueError(f"Unknown export format '{export_format}'. Supported: {', '.join(export_formats)}")
+    if export_format != XLSX:
+        log.log_event(f"Create a new {export_format.upper()} file")
+        dataframes = _track_progress(dataframes, progress, cancel_event)
+        if export_format == CSV:
+            rows = write_csv(dataframes, output_path)
+        else:
+            rows = arrow_writer.write_arrow(dataframes, output_path, export_format)
+        log.log_event(f"{rows} rows written")
+        log.log_event(f"XML data exported to {output_path}")
+        return None
+
+    if split is not None and split not in split_modes:
+        raise ValueError(f"Unknown split mode '{split}'. Supported: {', '.join(split_modes)}")
+
+    # The header takes the first row of every sheet
+    max_rows: int = xlsx_writer.MAX_SHEET_ROWS - 1
+    if isinstance(dataframes, Sequence):
+        # Check the size up front, before any row is serialized
+        total_rows: int = sum(len(dataframe) for dataframe in dataframes)
+        if total_rows > max_rows:
+            if split is None:
+                raise ValueError(f"{total_rows} rows exceed the limit of {max_rows} rows of an Excel sheet")
+            log.log_event(f"{total_rows} rows exceed the limit of {max_rows} rows of an Excel sheet. "
+                          f"Split into {-(-total_rows // max_rows)} {split}")
+    dataframes = _track_progress(dataframes, progress, cancel_event)
+    if split is None:
+        dataframes = _check_row_limit(dataframes, max_rows)
+        max_rows = sys.maxsize
+
+    first_sheet_name: str | None = None
+    writer: XLSXWriter | None = None
+    try:
+        for part in xlsx_writer.split_rows(dataframes, max_rows):
+            if writer is None or split == SPLIT_WORKBOOKS:
+                if writer is not None:
+                    writer.close()
+                writer = _open_workbook(output_path if writer is None else find_unused_path(output_path))
+            part_sheet_name = find_unused_sheet_name(writer.sheet_names, sheet_name)
+            rows = writer.write_sheet(part_sheet_name, part, prettier=prettier)
+            log.log_event(f"{rows} rows written to sheet '{part_sheet_name}'"
+                          f"{' with column width adjusted to content size' if prettier else ''}")
+            if first_sheet_name is None:
+                first_sheet_name = part_sheet_name
+    except BaseException:
+        # The writer restores an existing workbook or removes a new one
+        if writer is not None:
+            writer.abort()
+        raise
+    writer.close()
+    sheet_name = first_sheet_name
+
+    log.log_event(f"XML data exported to {output_path}")
+    return sheet_name
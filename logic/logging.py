@@ -1,3 +1,5 @@
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Callable
 
@@ -57,6 +59,17 @@ def add_log_listener(listener: Callable):
     log_listeners.append(listener)
 
 
+def remove_log_listener(listener: Callable):
+    """
+    Remove a listener function added by add_log_listener.
+
+    Args:
+        listener (Callable): The callback function to be removed.
+    """
+    if listener in log_listeners:
+        log_listeners.remove(listener)
+
+
 def get_latest_error() -> str:
     """
     Get the most recent error entry.
@@ -68,3 +81,56 @@ def get_latest_error() -> str:
         return error_entries[-1]
     else:
         return str()
+
+
+class LogBuffer:
+    """
+    Thread-safe queue of log entries, which are taken in batches, e.g. by a timer of a widget.
+    The queue holds at most max_entries, older entries are dropped and counted.
+    """
+
+    max_entries: int
+
+    __entries: deque
+    __dropped: int
+    __lock: threading.Lock
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the LogBuffer.
+
+        Args:
+            max_entries (int): The maximum number of queued entries.
+        """
+        self.max_entries = max_entries
+        self.__entries = deque(maxlen=max_entries)
+        self.__dropped = 0
+        self.__lock = threading.Lock()
+
+    def append(self, entry: str):
+        """
+        Queue a log entry. Can be registered as log listener and called from any thread.
+
+        Args:
+            entry (str): The log entry.
+        """
+        with self.__lock:
+            if len(self.__entries) == self.max_entries:
+                # If the oldest entry is dropped
+                self.__dropped += 1
+            self.__entries.append(entry)
+
+    def take(self) -> tuple[list, int]:
+        """
+        Take every queued entry.
+
+        Returns:
+            tuple[list, int]: The queued entries in their order and the number of entries dropped since the last
+                call.
+        """
+        with self.__lock:
+            entries: list = list(self.__entries)
+            dropped: int = self.__dropped
+            self.__entries.clear()
+            self.__dropped = 0
+        return entries, dropped
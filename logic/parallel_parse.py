@@ -0,0 +1,351 @@
+"""
+Contains the parallel parsing of a single XML file.
+The file is split on the boundaries of the records (the direct children of the root) and the byte ranges are
+parsed in worker processes.
+"""
+import io
+import mmap
+import multiprocessing
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+import logic.logging as log
+from logic.xml_dataframe import ParseCanceledError, XMLParser
+
+# Files are only split into parts of at least this size
+MIN_PART_SIZE: int = 4 * 1024 * 1024
+# Number of parts per worker. More parts than workers balance the load and bound the memory per task
+PARTS_PER_WORKER: int = 4
+# Interval in seconds in which the cancel event is checked while the parts are parsed
+CANCEL_INTERVAL: float = 0.1
+
+_START_TAG = re.compile(rb'<([^\s/>!?]+)(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+_DOCTYPE = re.compile(rb'<!DOCTYPE(?:[^\[>"\']|"[^"]*"|\'[^\']*\')*(?:\[.*?\])?\s*>', re.S)
+
+
+class RecordRanges:
+    """
+    Byte ranges of the records of an XML file. Every range can be parsed on its own by wrapping it into the
+    header, which contains everything up to the end of the root start tag, and the footer, the root end tag.
+    """
+
+    header: bytes
+    footer: bytes
+    ranges: list
+
+    def __init__(self, header: bytes, footer: bytes, ranges: list):
+        """
+        Initialize the RecordRanges.
+
+        Args:
+            header (bytes): The prolog and the start tag of the root.
+            footer (bytes): The end tag of the root.
+            ranges (list): Tuples of the start and end offset of the consecutive ranges.
+        """
+        self.header = header
+        self.footer = footer
+        self.ranges = ranges
+
+
+class RangeReader(io.RawIOBase):
+    """
+    Readable stream of a byte range of a file wrapped into the header and footer of the document.
+    """
+
+    __file: io.BufferedReader
+    __remaining: int
+    __parts: list
+    __range: str
+
+    def __init__(self, file_path: str, header: bytes, start: int, end: int, footer: bytes):
+        """
+        Initialize the RangeReader.
+
+        Args:
+            file_path (str): The path of the XML file.
+            header (bytes): The bytes read before the range.
+            start (int): The offset of the first byte of the range.
+            end (int): The offset after the last byte of the range.
+            footer (bytes): The bytes read after the range.
+        """
+        super().__init__()
+        self.__file = open(file_path, "rb")
+        self.__file.seek(start)
+        self.__remaining = end - start
+        self.__parts = [header, None, footer]
+        self.__range = f"{file_path} [{start}:{end}]"
+
+    def readable(self) -> bool:
+        """
+        Returns:
+            bool: Always True, the stream is readable.
+        """
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Read the next bytes of the header, the range or the footer into the buffer.
+
+        Args:
+            buffer: The writable buffer.
+
+        Returns:
+            int: The number of read bytes. Zero at the end of the stream.
+        """
+        while self.__parts:
+            part = self.__parts[0]
+            if part is None:
+                # Read from the range of the file
+                data = self.__file.read(min(len(buffer), self.__remaining))
+                self.__remaining -= len(data)
+                if not data or self.__remaining <= 0:
+                    self.__parts.pop(0)
+                if not data:
+                    continue
+            else:
+                data = part[:len(buffer)]
+                if len(data) < len(part):
+                    self.__parts[0] = part[len(data):]
+                else:
+                    self.__parts.pop(0)
+                if not data:
+                    continue
+            buffer[:len(data)] = data
+            return len(data)
+        return 0
+
+    def close(self):
+        """
+        Close the stream and the underlying file.
+        """
+        self.__file.close()
+        super().close()
+
+    def __str__(self) -> str:
+        """
+        Returns:
+            str: The file path and the byte range, used in the log.
+        """
+        return self.__range
+
+
+def find_record_ranges(file_path: str, parts: int) -> RecordRanges | None:
+    """
+    Split the records of an XML file into byte ranges of roughly the same size.
+
+    The file is not tokenized completely. The split points are the next start tags of the first record name
+    after equally distributed offsets. A split point inside a nested element, a comment or CDATA leaves an
+    unclosed construct in the previous range, so such a range fails to parse instead of resulting in wrong rows.
+
+    Args:
+        file_path (str): The path of the XML file.
+        parts (int): The maximum number of ranges.
+
+    Returns:
+        RecordRanges | None: The ranges or None if the file can't be split, e.g. if it contains no records.
+    """
+    if os.path.getsize(file_path) == 0:
+        return None
+
+    with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[:2] in (b"\xff\xfe", b"\xfe\xff"):
+            # UTF-16 documents can't be scanned byte-wise
+            return None
+
+        root_start = _skip_markup(data, 0, prolog=True)
+        root_tag = _START_TAG.match(data, root_start) if root_start >= 0 else None
+        if root_tag is None or root_tag.group(0).endswith(b"/>"):
+            return None
+        root_name: bytes = root_tag.group(1)
+
+        first_record = _skip_markup(data, root_tag.end(), prolog=False)
+        record_tag = _START_TAG.match(data, first_record) if first_record >= 0 else None
+        root_end = data.rfind(b"</" + root_name)
+        if record_tag is None or root_end < record_tag.end():
+            return None
+
+        # Split before the start tags of the first record name
+        record_start = re.compile(rb"<" + re.escape(record_tag.group(1)) + rb"[\s/>]")
+        boundaries: list = [first_record]
+        for i in range(1, parts):
+            target = first_record + (root_end - first_record) * i // parts
+            if target <= boundaries[-1]:
+                continue
+            match = record_start.search(data, target, root_end)
+            if match is None:
+                break
+            boundaries.append(match.start())
+        boundaries.append(root_end)
+
+        header: bytes = data[:root_tag.end()]
+        footer: bytes = b"</" + root_name + b">"
+    return RecordRanges(header, footer, list(zip(boundaries[:-1], boundaries[1:])))
+
+
+def _skip_markup(data: mmap.mmap, position: int, prolog: bool) -> int:
+    """
+    Find the next start or end tag, skipping comments, processing instructions and text.
+
+    Args:
+        data (mmap.mmap): The content of the XML file.
+        position (int): The offset to start from.
+        prolog (bool): Also skip a document type declaration and a byte order mark.
+
+    Returns:
+        int: The offset of the next tag or -1 if there is none or it is an end tag.
+    """
+    if prolog and data[:3] == b"\xef\xbb\xbf":
+        position = 3
+    while True:
+        position = data.find(b"<", position)
+        if position < 0:
+            return -1
+        if data[position:position + 2] == b"<?":
+            end = data.find(b"?>", position)
+            position = end + 2 if end >= 0 else -1
+        elif data[position:position + 4] == b"<!--":
+            end = data.find(b"-->", position)
+            position = end + 3 if end >= 0 else -1
+        elif prolog and data[position:position + 9] == b"<!DOCTYPE":
+            match = _DOCTYPE.match(data, position)
+            position = match.end() if match else -1
+        elif data[position:position + 2] in (b"</", b"<!"):
+            # No records or CDATA directly in the root
+            return -1
+        else:
+            return position
+        if position < 0:
+            return -1
+
+
+def read_dataframe_parallel(file_path: str, workers: int, progress: Callable[[int, int], None] | None = None,
+                            cancel_event: threading.Event | None = None, **options) -> pd.DataFrame | None:
+    """
+    Parse the records of an XML file in parallel worker processes and merge the partial DataFrames in document
+    order. The columns keep their first-seen order.
+
+    Args:
+        file_path (str): The path of the XML file.
+        workers (int): The number of worker processes.
+        progress (Callable[[int, int], None] | None): Called after every parsed part with the number of bytes and
+            records of the parsed parts.
+        cancel_event (threading.Event | None): The parsing is canceled as soon as the event is set. Parts that
+            are already parsed by a worker are finished in the background.
+        **options: Parse options passed to XMLParser.read_dataframe of the workers, like categorical.
+
+    Returns:
+        pd.DataFrame | None: The parsed XML data or None if the file can't be split or a range fails to parse.
+            The caller has to parse the file sequentially then.
+
+    Raises:
+        ParseCanceledError: If the cancel event was set.
+    """
+    parts = min(workers * PARTS_PER_WORKER, os.path.getsize(file_path) // MIN_PART_SIZE)
+    if parts < 2:
+        return None
+    record_ranges = find_record_ranges(file_path, parts)
+    if record_ranges is None or len(record_ranges.ranges) < 2:
+        return None
+    log.log_event(f"Parse {len(record_ranges.ranges)} parts of the XML file with {workers} worker processes")
+
+    context = multiprocessing.get_context("spawn")
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    canceled: bool = False
+    try:
+        futures: dict = {executor.submit(_parse_range, file_path, record_ranges.header, start, end,
+                                         record_ranges.footer, options): i
+                         for i, (start, end) in enumerate(record_ranges.ranges)}
+        dataframes: list = [None] * len(futures)
+        read_bytes: int = 0
+        records: int = 0
+        pending: set = set(futures)
+        while pending:
+            # The events of the parent can't be passed to the workers, so the parent checks them
+            done, pending = wait(pending, timeout=CANCEL_INTERVAL, return_when=FIRST_COMPLETED)
+            if cancel_event is not None and cancel_event.is_set():
+                canceled = True
+                raise ParseCanceledError(f"Parsing of {file_path} canceled")
+            for future in done:
+                i: int = futures[future]
+                dataframes[i] = future.result()
+                start, end = record_ranges.ranges[i]
+                read_bytes += end - start
+                records += len(dataframes[i])
+            if done and progress is not None:
+                progress(read_bytes, records)
+    except (ET.ParseError, BrokenProcessPool) as e:
+        log.log_event(f"Parsing the parts of the XML file failed: {e}")
+        return None
+    finally:
+        # A canceled parsing doesn't wait for the running parts
+        executor.shutdown(wait=not canceled, cancel_futures=True)
+
+    return _merge_dataframes(dataframes, options.get("categorical", False))
+
+
+def _merge_dataframes(dataframes: list, categorical: bool) -> pd.DataFrame:
+    """
+    Concatenate the partial DataFrames with the columns in first-seen order.
+
+    Args:
+        dataframes (list): The DataFrames of the parts in document order.
+        categorical (bool): The parts were parsed in the categorical mode. Columns that are categorical in every
+            part containing them stay categorical with the categories in first-seen order.
+
+    Returns:
+        pd.DataFrame: The merged DataFrame.
+    """
+    columns: dict = dict()
+    for dataframe in dataframes:
+        columns.update(dict.fromkeys(dataframe.columns))
+    # Categorical columns with different categories are concatenated as text
+    merged: pd.DataFrame = pd.concat(dataframes, ignore_index=True).reindex(columns=list(columns))
+    if not categorical:
+        return merged
+
+    for column in columns:
+        parts: list = [dataframe[column] for dataframe in dataframes if column in dataframe.columns]
+        if not all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            # If the values of a part were too distinct for a category
+            continue
+        categoricals: list = list()
+        for dataframe in dataframes:
+            if column in dataframe.columns:
+                values: pd.Categorical = dataframe[column].array
+                categoricals.append(pd.Categorical.from_codes(values.codes,
+                                                              categories=values.categories.astype(object)))
+            else:
+                # The column is missing in every record of the part
+                categoricals.append(pd.Categorical.from_codes(np.full(len(dataframe), -1, dtype=np.int8),
+                                                              categories=pd.Index([], dtype=object)))
+        merged[column] = union_categoricals(categoricals)
+    return merged
+
+
+def _parse_range(file_path: str, header: bytes, start: int, end: int, footer: bytes, options: dict) -> pd.DataFrame:
+    """
+    Parse a byte range of an XML file in a worker process.
+
+    Args:
+        file_path (str): The path of the XML file.
+        header (bytes): The prolog and the start tag of the root.
+        start (int): The offset of the first byte of the range.
+        end (int): The offset after the last byte of the range.
+        footer (bytes): The end tag of the root.
+        options (dict): Parse options passed to XMLParser.read_dataframe.
+
+    Returns:
+        pd.DataFrame: The parsed records of the range.
+
+    Raises:
+        ET.ParseError: If the range can't be parsed.
+    """
+    with RangeReader(file_path, header, start, end, footer) as source:
+        return XMLParser.read_dataframe(source, streaming=True, **options)
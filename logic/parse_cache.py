@@ -0,0 +1,365 @@
+"""
+Contains an on-disk cache of parsed XML files, so re-opening an unchanged file doesn't parse it again.
+
+Every entry is an Arrow IPC (Feather) file of the DataFrame with a JSON file of its metadata. An entry belongs to
+the path of the XML file and the parse options, and is only valid while the size, the modification time and the
+content hash of the file match. A file up to FULL_HASH_SIZE with a changed modification time stays valid if its
+content is unchanged, a larger file is parsed again. The least recently used entries are removed when the cache
+exceeds its size.
+The cache needs the optional pyarrow package, without it every lookup misses and nothing is stored.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import pandas as pd
+import logic.logging as log
+
+# pyarrow is only imported when the cache is used, so it doesn't slow down the start
+pyarrow_available: bool = importlib.util.find_spec("pyarrow") is not None
+
+# The default maximum size of all entries in bytes
+MAX_CACHE_SIZE: int = 2 * 1024 ** 3
+# Files up to this size are hashed completely, larger files only by samples
+FULL_HASH_SIZE: int = 16 * 1024 ** 2
+# The number and size of the samples hashed of a larger file, including its start and end
+HASH_SAMPLES: int = 64
+HASH_SAMPLE_SIZE: int = 64 * 1024
+
+# Parse options that don't change the parsed DataFrame
+_IGNORED_OPTIONS: set = {"streaming", "backend", "workers", "progress", "cancel_event"}
+_DATA_EXTENSION: str = ".feather"
+_METADATA_EXTENSION: str = ".json"
+
+
+def default_cache_directory() -> str:
+    """
+    Returns:
+        str: The cache directory of the user for Forkium, e.g. ~/.cache/forkium/parse_cache on Linux.
+    """
+    if sys.platform == "win32":
+        base: str = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(base, "forkium", "parse_cache")
+
+
+def content_hash(file_path: str) -> str:
+    """
+    Hash the content of a file. Files larger than FULL_HASH_SIZE are hashed by evenly distributed samples, so
+    hashing takes milliseconds even for huge files. The samples detect appended or truncated content, but miss an
+    edit of the same size between them, so the hash of a larger file is only trusted with an unchanged
+    modification time.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        str: The hexadecimal hash.
+
+    Raises:
+        OSError: If the file can't be read.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        size: int = os.fstat(file.fileno()).st_size
+        digest.update(size.to_bytes(8, "little"))
+        if size <= FULL_HASH_SIZE:
+            while block := file.read(1024 ** 2):
+                digest.update(block)
+        else:
+            last: int = size - HASH_SAMPLE_SIZE
+            for i in range(HASH_SAMPLES):
+                file.seek(last * i // (HASH_SAMPLES - 1))
+                digest.update(file.read(HASH_SAMPLE_SIZE))
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    An on-disk cache of parsed DataFrames with a size-bounded least-recently-used eviction.
+    """
+
+    directory: str
+    max_size: int
+
+    def __init__(self, directory: str | None = None, max_size: int = MAX_CACHE_SIZE):
+        """
+        Initialize the ParseCache. The directory is created when the first entry is stored.
+
+        Args:
+            directory (str | None): The directory of the entries. Defaults to the cache directory of the user.
+            max_size (int): The maximum size of all entries in bytes.
+        """
+        self.directory = directory if directory is not None else default_cache_directory()
+        self.max_size = max_size
+
+    def load(self, file_path: str, **options) -> pd.DataFrame | None:
+        """
+        Load the cached DataFrame of an XML file. Outdated and damaged entries are removed.
+
+        Args:
+            file_path (str): The path of the XML file.
+            **options: The parse options of the DataFrame, like infer_types. Options that don't change the result,
+                like progress, are ignored.
+
+        Returns:
+            pd.DataFrame | None: The cached DataFrame or None if there is no valid entry.
+        """
+        if not pyarrow_available:
+            return None
+        name: str = self.__entry_name(file_path, options)
+        metadata: dict | None = self.__read_metadata(name)
+        if metadata is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+            if metadata["size"] != stat.st_size:
+                raise LookupError
+            if metadata["mtime"] != stat.st_mtime_ns:
+                # The file was touched, copied or edited in place. Only a complete hash proves an equal content,
+                # the samples of larger files can miss an edit of the same size
+                if stat.st_size > FULL_HASH_SIZE or metadata["hash"] != content_hash(file_path):
+                    raise LookupError
+                metadata["mtime"] = stat.st_mtime_ns
+                self.__write_metadata(name, metadata)
+            elif metadata["hash"] != content_hash(file_path):
+                raise LookupError
+
+            import pyarrow.feather as feather
+            data_path: str = os.path.join(self.directory, name + _DATA_EXTENSION)
+            dataframe: pd.DataFrame = feather.read_table(data_path).to_pandas()
+            # Mark the entry as recently used
+            os.utime(data_path)
+        except LookupError:
+            log.log_event(f"Cached data of {file_path} is outdated")
+            self.__remove(name)
+            return None
+        except Exception as e:
+            # If the XML file is gone or the entry is damaged
+            log.log_error(f"Error while loading cached data of {file_path}: {e}")
+            self.__remove(name)
+            return None
+        log.log_event(f"Loaded {len(dataframe)} cached rows of {file_path}")
+        return dataframe
+
+    def contains(self, file_path: str, **options) -> bool:
+        """
+        Check if the cache contains an entry of the XML file, without validating its content.
+
+        Args:
+            file_path (str): The path of the XML file.
+            **options: The parse options of the DataFrame, see load.
+
+        Returns:
+            bool: True if an entry with the size and modification time of the file exists.
+        """
+        if not pyarrow_available:
+            return False
+        metadata: dict | None = self.__read_metadata(self.__entry_name(file_path, options))
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return metadata is not None and metadata["size"] == stat.st_size and metadata["mtime"] == stat.st_mtime_ns
+
+    def fingerprint(self, file_path: str) -> dict | None:
+        """
+        Take the size, the modification time and the content hash of an XML file. It has to be taken before the
+        file is parsed, so a file changed while parsing doesn't match its stored entry.
+
+        Args:
+            file_path (str): The path of the XML file.
+
+        Returns:
+            dict | None: The fingerprint passed to store or None if the cache is not available.
+
+        Raises:
+            OSError: If the file can't be read.
+        """
+        if not pyarrow_available:
+            return None
+        stat = os.stat(file_path)
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "hash": content_hash(file_path)}
+
+    def store(self, file_path: str, dataframe: pd.DataFrame, fingerprint: dict | None = None, **options) -> bool:
+        """
+        Store the parsed DataFrame of an XML file and evict the least recently used entries beyond the maximum
+        size. Errors are logged, so a failing cache never fails the parsing.
+
+        Args:
+            file_path (str): The path of the XML file.
+            dataframe (pd.DataFrame): The parsed DataFrame.
+            fingerprint (dict | None): The fingerprint of the file taken before parsing it. If None, it is taken
+                now, which is only valid for a file that wasn't changed since it was parsed.
+            **options: The parse options of the DataFrame, see load.
+
+        Returns:
+            bool: True if the DataFrame was stored.
+        """
+        if not pyarrow_available:
+            return False
+        name: str = self.__entry_name(file_path, options)
+        data_path: str = os.path.join(self.directory, name + _DATA_EXTENSION)
+        try:
+            if fingerprint is None:
+                fingerprint = self.fingerprint(file_path)
+            metadata: dict = {"path": os.path.abspath(file_path), **fingerprint, "options": option_key(options)}
+            os.makedirs(self.directory, exist_ok=True)
+
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            if table.nbytes > self.max_size:
+                log.log_event(f"Parsed data of {file_path} exceeds the cache size")
+                return False
+            # Replace the entry at once, so a concurrent load never reads a partial file
+            descriptor, temporary_path = tempfile.mkstemp(suffix=_DATA_EXTENSION, dir=self.directory)
+            os.close(descriptor)
+            try:
+                feather.write_feather(table, temporary_path)
+                os.replace(temporary_path, data_path)
+            finally:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+            self.__write_metadata(name, metadata)
+        except Exception as e:
+            log.log_error(f"Error while caching parsed data of {file_path}: {e}")
+            self.__remove(name)
+            return False
+        log.log_event(f"Cached {len(dataframe)} parsed rows of {file_path}")
+        self.__evict()
+        return True
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        for name in self.__entry_names():
+            self.__remove(name)
+
+    def size(self) -> int:
+        """
+        Returns:
+            int: The size of all entries in bytes.
+        """
+        return sum(size for _, _, size in self.__entries())
+
+    def __entry_name(self, file_path: str, options: dict) -> str:
+        """
+        Args:
+            file_path (str): The path of the XML file.
+            options (dict): The parse options.
+
+        Returns:
+            str: The file name of the entry without extension, a hash of the path and the options.
+        """
+        key: str = json.dumps([os.path.abspath(file_path), option_key(options)])
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def __read_metadata(self, name: str) -> dict | None:
+        """
+        Args:
+            name (str): The name of the entry.
+
+        Returns:
+            dict | None: The metadata of the entry or None if it doesn't exist or is damaged.
+        """
+        try:
+            with open(os.path.join(self.directory, name + _METADATA_EXTENSION), encoding="utf-8") as file:
+                metadata = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.__remove(name)
+            return None
+        if not isinstance(metadata, dict) or not {"size", "mtime", "hash"} <= metadata.keys():
+            self.__remove(name)
+            return None
+        return metadata
+
+    def __write_metadata(self, name: str, metadata: dict):
+        """
+        Args:
+            name (str): The name of the entry.
+            metadata (dict): The metadata of the entry.
+
+        Raises:
+            OSError: If the metadata can't be written.
+        """
+        path: str = os.path.join(self.directory, name + _METADATA_EXTENSION)
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(metadata, file)
+        os.replace(path + ".tmp", path)
+
+    def __entry_names(self) -> set:
+        """
+        Returns:
+            set: The names of all entries, including incomplete ones.
+        """
+        try:
+            file_names: list = os.listdir(self.directory)
+        except OSError:
+            return set()
+        return {os.path.splitext(file_name)[0] for file_name in file_names
+                if file_name.endswith(_DATA_EXTENSION) or file_name.endswith(_METADATA_EXTENSION)}
+
+    def __entries(self) -> list:
+        """
+        Returns:
+            list: Tuples of the name, the last use and the size in bytes of every complete entry.
+        """
+        entries: list = list()
+        for name in self.__entry_names():
+            try:
+                data = os.stat(os.path.join(self.directory, name + _DATA_EXTENSION))
+                metadata = os.stat(os.path.join(self.directory, name + _METADATA_EXTENSION))
+            except OSError:
+                continue
+            entries.append((name, data.st_mtime, data.st_size + metadata.st_size))
+        return entries
+
+    def __evict(self):
+        """
+        Remove the least recently used entries until the cache doesn't exceed its maximum size.
+        """
+        entries: list = sorted(self.__entries(), key=lambda entry: entry[1])
+        size: int = sum(entry[2] for entry in entries)
+        for name, _, entry_size in entries:
+            if size <= self.max_size:
+                break
+            self.__remove(name)
+            size -= entry_size
+            log.log_event(f"Removed cache entry {name}")
+
+    def __remove(self, name: str):
+        """
+        Remove the files of an entry, if they exist.
+
+        Args:
+            name (str): The name of the entry.
+        """
+        for extension in (_DATA_EXTENSION, _METADATA_EXTENSION):
+            try:
+                os.remove(os.path.join(self.directory, name + extension))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                log.log_error(f"Error while removing cache entry {name}: {e}")
+
+
+def option_key(options: dict) -> str:
+    """
+    Args:
+        options (dict): The parse options.
+
+    Returns:
+        str: A stable text of the options that change the parsed DataFrame.
+    """
+    relevant: dict = {key: getattr(value, "expression", value) for key, value in options.items()
+                      if key not in _IGNORED_OPTIONS and value is not None}
+    return json.dumps(relevant, sort_keys=True, default=str)
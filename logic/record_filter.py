@@ -0,0 +1,287 @@
+"""
+Contains filter expressions, which are evaluated for every record while parsing an XML file.
+
+An expression compares leaf columns with values, like 'state == "NEW" and date >= "2024-01-01"'.
+Comparisons can be combined with 'and', 'or', 'not' and parentheses. Quoted values and words are compared as
+text, so ISO dates compare chronologically. Numbers compare numerically, records whose value is no number don't
+match. 'null' matches missing and empty values. Every other comparison with a missing value doesn't match.
+"""
+import operator
+import re
+from typing import Any, Callable
+
+_TOKEN = re.compile(r"""\s*(?:(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(?P<operator>==|!=|<=|>=|<|>|=)"""
+                    r"""|(?P<parenthesis>[()])|(?P<word>[^\s()"'=!<>]+))""")
+_NUMBER = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_OPERATORS: dict = {"==": operator.eq, "=": operator.eq, "!=": operator.ne, "<": operator.lt,
+                    "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+_KEYWORDS: set = {"and", "or", "not"}
+
+
+class RecordFilter:
+    """
+    A parsed filter expression. Evaluating it per record doesn't parse the expression again.
+    """
+
+    expression: str
+    columns: frozenset
+
+    __tokens: list
+    __position: int
+    __predicate: Callable[[Callable[[str], Any]], bool]
+
+    def __init__(self, expression: str):
+        """
+        Parse a filter expression.
+
+        Args:
+            expression (str): The filter expression, like 'state == "NEW"'.
+
+        Raises:
+            ValueError: If the expression contains a syntax error.
+        """
+        self.expression = expression
+        self.__tokens = _tokenize(expression)
+        self.__position = 0
+        columns: set = set()
+        self.__predicate = self.__parse_or(columns)
+        if self.__position < len(self.__tokens):
+            raise ValueError(f"Unexpected '{self.__tokens[self.__position][1]}' in filter '{expression}'")
+        self.columns = frozenset(columns)
+
+    def matches(self, get_value: Callable[[str], Any]) -> bool:
+        """
+        Evaluate the filter for a record.
+
+        Args:
+            get_value (Callable[[str], Any]): Returns the text of a column in the record or None if it is missing,
+                like the get method of a dictionary.
+
+        Returns:
+            bool: True if the record matches the filter.
+        """
+        return self.__predicate(get_value)
+
+    def __parse_or(self, columns: set) -> Callable:
+        """
+        Parse comparisons combined with 'or'.
+
+        Args:
+            columns (set): Collects the compared columns.
+
+        Returns:
+            Callable: The predicate of the parsed part.
+        """
+        predicates: list = [self.__parse_and(columns)]
+        while self.__accept_keyword("or"):
+            predicates.append(self.__parse_and(columns))
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda get_value: any(predicate(get_value) for predicate in predicates)
+
+    def __parse_and(self, columns: set) -> Callable:
+        """
+        Parse comparisons combined with 'and'.
+
+        Args:
+            columns (set): Collects the compared columns.
+
+        Returns:
+            Callable: The predicate of the parsed part.
+        """
+        predicates: list = [self.__parse_not(columns)]
+        while self.__accept_keyword("and"):
+            predicates.append(self.__parse_not(columns))
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda get_value: all(predicate(get_value) for predicate in predicates)
+
+    def __parse_not(self, columns: set) -> Callable:
+        """
+        Parse a negation, an expression in parentheses or a comparison.
+
+        Args:
+            columns (set): Collects the compared columns.
+
+        Returns:
+            Callable: The predicate of the parsed part.
+        """
+        if self.__accept_keyword("not"):
+            predicate = self.__parse_not(columns)
+            return lambda get_value: not predicate(get_value)
+        if self.__accept("parenthesis", "("):
+            predicate = self.__parse_or(columns)
+            if not self.__accept("parenthesis", ")"):
+                raise ValueError(f"Missing ')' in filter '{self.expression}'")
+            return predicate
+        return self.__parse_comparison(columns)
+
+    def __parse_comparison(self, columns: set) -> Callable:
+        """
+        Parse a comparison of a column with a value.
+
+        Args:
+            columns (set): Collects the compared columns.
+
+        Returns:
+            Callable: The predicate of the comparison.
+        """
+        column = self.__expect("word", "column")
+        compare = _OPERATORS[self.__expect("operator", "comparison operator")]
+        kind, value = self.__next("value")
+        columns.add(column)
+
+        if kind == "string":
+            text: str = re.sub(r"\\(.)", r"\1", value[1:-1])
+            return lambda get_value: _compare_text(get_value(column), compare, text)
+        if kind != "word":
+            raise ValueError(f"Expected a value instead of '{value}' in filter '{self.expression}'")
+        if value.lower() == "null":
+            if compare not in (operator.eq, operator.ne):
+                raise ValueError(f"'null' can only be compared with '==' or '!=' in filter '{self.expression}'")
+            is_null: bool = compare is operator.eq
+            return lambda get_value: _is_null(get_value(column)) == is_null
+        if _NUMBER.fullmatch(value):
+            number: float = float(value)
+            return lambda get_value: _compare_number(get_value(column), compare, number)
+        return lambda get_value: _compare_text(get_value(column), compare, value)
+
+    def __next(self, expected: str) -> tuple:
+        """
+        Consume the next token.
+
+        Args:
+            expected (str): The description of the expected token for the error message.
+
+        Returns:
+            tuple: The kind and the text of the token.
+
+        Raises:
+            ValueError: If the expression ends.
+        """
+        if self.__position >= len(self.__tokens):
+            raise ValueError(f"Expected a {expected} at the end of filter '{self.expression}'")
+        token = self.__tokens[self.__position]
+        self.__position += 1
+        return token
+
+    def __expect(self, kind: str, expected: str) -> str:
+        """
+        Consume the next token, which has to be of the given kind.
+
+        Args:
+            kind (str): The kind of the token.
+            expected (str): The description of the expected token for the error message.
+
+        Returns:
+            str: The text of the token.
+
+        Raises:
+            ValueError: If the next token is of another kind.
+        """
+        token_kind, text = self.__next(expected)
+        if token_kind != kind or (kind == "word" and text.lower() in _KEYWORDS):
+            raise ValueError(f"Expected a {expected} instead of '{text}' in filter '{self.expression}'")
+        return text
+
+    def __accept(self, kind: str, text: str) -> bool:
+        """
+        Consume the next token if it matches.
+
+        Args:
+            kind (str): The kind of the token.
+            text (str): The text of the token.
+
+        Returns:
+            bool: True if the token matched and was consumed.
+        """
+        if self.__position < len(self.__tokens) and self.__tokens[self.__position] == (kind, text):
+            self.__position += 1
+            return True
+        return False
+
+    def __accept_keyword(self, keyword: str) -> bool:
+        """
+        Consume the next token if it is the keyword, independent of the case.
+
+        Args:
+            keyword (str): The keyword in lower case.
+
+        Returns:
+            bool: True if the keyword was consumed.
+        """
+        if self.__position < len(self.__tokens):
+            kind, text = self.__tokens[self.__position]
+            if kind == "word" and text.lower() == keyword:
+                self.__position += 1
+                return True
+        return False
+
+
+def _tokenize(expression: str) -> list:
+    """
+    Split a filter expression into tokens.
+
+    Args:
+        expression (str): The filter expression.
+
+    Returns:
+        list: Tuples of the kind and the text of every token.
+
+    Raises:
+        ValueError: If the expression contains an invalid character or no token at all.
+    """
+    tokens: list = list()
+    position: int = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid character '{expression[position:].strip()[:1]}' in filter '{expression}'")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    if not tokens:
+        raise ValueError("The filter is empty")
+    return tokens
+
+
+def _is_null(value) -> bool:
+    """
+    Args:
+        value: The text of a column or None.
+
+    Returns:
+        bool: True if the value is missing or empty.
+    """
+    return value is None or value == ""
+
+
+def _compare_text(value, compare: Callable, text: str) -> bool:
+    """
+    Args:
+        value: The text of a column or None.
+        compare (Callable): The comparison operator.
+        text (str): The compared text.
+
+    Returns:
+        bool: The result of the comparison, False for missing values.
+    """
+    return value is not None and compare(value, text)
+
+
+def _compare_number(value, compare: Callable, number: float) -> bool:
+    """
+    Args:
+        value: The text of a column or None.
+        compare (Callable): The comparison operator.
+        number (float): The compared number.
+
+    Returns:
+        bool: The result of the comparison, False for missing values and values that are no number.
+    """
+    if value is None:
+        return False
+    try:
+        return compare(float(value), number)
+    except ValueError:
+        return False
@@ -0,0 +1,74 @@
+"""
+Contains the paths selecting the record elements of an XML file, which become the rows of the DataFrame.
+
+The syntax is a small subset of ElementPath:
+    'items/item'          item elements in the items children of the root
+    '/export/items/item'  the same path, starting with the root element
+    'item' or '//item'    item elements at any depth, records nested in records are part of the outer record
+'*' matches every element. Steps without a namespace also match the elements of every namespace.
+"""
+
+# The default records, the direct children of the root
+DEFAULT_RECORD_PATH: str = "/*/*"
+
+
+class RecordPath:
+    """
+    A parsed record path, which is matched against the tags from the root to an element.
+    """
+
+    path: str
+    # The maximum depth of a record or None if the records can be at any depth
+    max_depth: int | None
+
+    __steps: list
+    __anywhere: bool
+
+    def __init__(self, path: str = DEFAULT_RECORD_PATH):
+        """
+        Parse a record path.
+
+        Args:
+            path (str): The record path, like 'items/item'. Defaults to the direct children of the root.
+
+        Raises:
+            ValueError: If the path is empty or contains an empty step.
+        """
+        self.path = path
+        path = path.strip()
+        if path.startswith(".//") or path.startswith("//"):
+            self.__anywhere = True
+            path = path.split("//", 1)[1]
+        elif path.startswith("/"):
+            self.__anywhere = False
+            path = path[1:]
+        elif "/" not in path:
+            # A tag name
+            self.__anywhere = True
+        else:
+            # Relative to the root element
+            self.__anywhere = False
+            path = "*/" + path
+
+        steps: list = [step.strip() for step in path.split("/")]
+        if not path or not all(steps):
+            raise ValueError(f"Invalid record path '{self.path}'")
+        self.__steps = steps
+        self.max_depth = None if self.__anywhere else len(steps)
+
+    def matches(self, tags: list) -> bool:
+        """
+        Check if an element is a record.
+
+        Args:
+            tags (list): The tags of the elements from the root to the checked element.
+
+        Returns:
+            bool: True if the element is selected by the path.
+        """
+        if len(tags) < len(self.__steps) or (not self.__anywhere and len(tags) != len(self.__steps)):
+            return False
+        for step, tag in zip(reversed(self.__steps), reversed(tags)):
+            if step != "*" and step != tag and (step[0] == "{" or not tag.endswith("}" + step)):
+                return False
+        return True
@@ -0,0 +1,364 @@
+"""
+Contains the inference of column types for parsed XML data.
+Every parsed value is text, so numeric, boolean and date columns are converted to native dtypes and repetitive
+text columns to categories. The conversions are vectorized over whole columns.
+"""
+import numpy as np
+import pandas as pd
+import logic.logging as log
+
+# The column types of a schema
+STRING: str = "string"
+INTEGER: str = "integer"
+FLOAT: str = "float"
+BOOLEAN: str = "boolean"
+DATETIME: str = "datetime"
+CATEGORY: str = "category"
+column_types: list = [STRING, INTEGER, FLOAT, BOOLEAN, DATETIME, CATEGORY]
+
+# Text columns with at most this ratio of distinct values are converted to categories
+CATEGORY_RATIO: float = 0.5
+# Number of values a type is checked with before all values are checked, so most types are rejected early
+SAMPLE_SIZE: int = 1000
+
+# Integers without leading zeros, so codes like '007' stay text. More than 15 digits exceed the precision of Excel
+_INTEGER_PATTERN: str = r"[+-]?(?:0|[1-9]\d{0,14})"
+_FLOAT_PATTERN: str = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+# Numbers that stay text in a float column, e.g. codes with leading zeros or identifiers beyond 15 digits
+_TEXT_NUMBER_PATTERN: str = r"[+-]?(?:0\d.*|\d{16,})"
+_DATETIME_PATTERN: str = r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?"
+_BOOLEAN_VALUES: dict = {"true": True, "false": False}
+# The range of integer columns
+_INT64_MIN: int = -2 ** 63
+_INT64_MAX: int = 2 ** 63 - 1
+
+
+def parse_schema(values: list | None) -> dict:
+    """
+    Split schema arguments like 'price:float,state:category' into a schema.
+
+    Args:
+        values (list | None): The arguments, each containing comma separated pairs of column and type.
+
+    Returns:
+        dict: Maps every column name to its type.
+
+    Raises:
+        ValueError: If a pair has no type or the type is unknown.
+    """
+    schema: dict = dict()
+    for value in values or list():
+        for pair in value.split(","):
+            if not pair.strip():
+                continue
+            column, separator, column_type = pair.rpartition(":")
+            column_type = column_type.strip().lower()
+            if not separator or not column.strip():
+                raise ValueError(f"Invalid schema entry '{pair.strip()}', expected 'column:type'")
+            if column_type not in column_types:
+                raise ValueError(f"Unknown column type '{column_type}', expected one of {', '.join(column_types)}")
+            schema[column.strip()] = column_type
+    return schema
+
+
+def infer_types(dataframe: pd.DataFrame, schema: dict | None = None, infer: bool = True) -> pd.DataFrame:
+    """
+    Convert the text columns of a DataFrame to native dtypes.
+
+    Columns of the schema get their given type, values that can't be converted become missing values.
+    The type of the other columns is inferred if every value matches it. Integers with leading zeros or more
+    than 15 digits and dates with a time zone stay text, so no information is lost.
+
+    Args:
+        dataframe (pd.DataFrame): The parsed data with text columns.
+        schema (dict | None): Maps column names to their type, see column_types. Missing columns are ignored.
+        infer (bool): Infer the type of the columns that are not part of the schema.
+
+    Returns:
+        pd.DataFrame: The data with the converted columns. Columns are only replaced, not copied.
+
+    Raises:
+        ValueError: If a type of the schema is unknown.
+    """
+    schema = schema or dict()
+    for column_type in schema.values():
+        if column_type not in column_types:
+            raise ValueError(f"Unknown column type '{column_type}', expected one of {', '.join(column_types)}")
+
+    columns: dict = dict()
+    for i, column in enumerate(dataframe.columns):
+        series: pd.Series = dataframe.iloc[:, i]
+        if column in schema:
+            converted = convert_column(series, schema[column])
+            invalid: int = int(converted.isna().sum() - series.isna().sum())
+            if invalid > 0:
+                log.log_event(f"{invalid} values of column '{column}' are no {schema[column]} and were dropped")
+        elif infer:
+            converted = infer_column(series)
+        else:
+            continue
+        if converted is not series:
+            columns[i] = converted
+
+    if not columns:
+        return dataframe
+    result = dataframe.copy(deep=False)
+    for i, converted in columns.items():
+        result.isetitem(i, converted)
+    return result
+
+
+def infer_column(series: pd.Series) -> pd.Series:
+    """
+    Infer the type of a text column and convert it.
+
+    Args:
+        series (pd.Series): The text values of the column.
+
+    Returns:
+        pd.Series: The converted column or the given column if it stays text.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return _infer_categorical(series)
+    if series.dtype != object:
+        return series
+    values: pd.Series = series.dropna()
+    if values.empty or not isinstance(values.iloc[0], str):
+        return series
+
+    for column_type in (INTEGER, FLOAT, BOOLEAN, DATETIME):
+        if _matches_type(values, column_type):
+            converted = convert_column(series, column_type)
+            # Dates like 2024-02-30 match the pattern but can't be converted
+            if converted.isna().sum() == series.isna().sum():
+                return converted
+    if values.nunique() <= len(values) * CATEGORY_RATIO:
+        return convert_column(series, CATEGORY)
+    return series
+
+
+def _infer_categorical(series: pd.Series) -> pd.Series:
+    """
+    Infer the type of a categorical text column, e.g. of the categorical mode of the ColumnAccumulator.
+    Only the distinct values are checked and converted, the rows are mapped by their codes.
+
+    Args:
+        series (pd.Series): The categorical column with text categories.
+
+    Returns:
+        pd.Series: The converted column, the given column if it stays categorical or a text column if the
+            values are too distinct for a category.
+    """
+    categories = pd.Series(series.cat.categories, dtype=object)
+    converted = infer_column(categories)
+    if converted is categories:
+        # The values stay text, the same values are categorical as in an inferred text column
+        if len(categories) <= series.count() * CATEGORY_RATIO:
+            return series
+        return series.astype(object)
+    return _take_categories(series, converted)
+
+
+def _take_categories(series: pd.Series, categories: pd.Series) -> pd.Series:
+    """
+    Map the codes of a categorical column to the converted categories.
+
+    Args:
+        series (pd.Series): The categorical column.
+        categories (pd.Series): The converted categories in the order of the categories of the column.
+
+    Returns:
+        pd.Series: The column with the converted values.
+    """
+    codes = series.cat.codes.to_numpy()
+    if (codes < 0).any():
+        # Missing values need the nullable dtypes
+        if categories.dtype == np.int64:
+            categories = categories.astype("Int64")
+        elif categories.dtype == np.bool_:
+            categories = categories.astype("boolean")
+    array = categories.to_numpy() if isinstance(categories.dtype, np.dtype) else categories.array
+    values = pd.api.extensions.take(array, codes, allow_fill=True)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _to_integer(series: pd.Series) -> pd.Series:
+    """
+    Convert text values to integers without the detour over floats, so identifiers with more digits than the
+    precision of a float keep their value.
+
+    Args:
+        series (pd.Series): The text values of the column.
+
+    Returns:
+        pd.Series: The column with the nullable integer dtype. Fractions and values beyond the range of int64
+            become missing values.
+    """
+    converted = pd.to_numeric(series, errors="coerce", dtype_backend="numpy_nullable")
+    if pd.api.types.is_integer_dtype(converted.dtype):
+        return converted.astype("Int64")
+    # If a fraction or a value beyond int64 is found, the values are floats and are converted again without them
+    valid = (converted.notna() & (converted % 1 == 0)).to_numpy(dtype=bool, na_value=False)
+    # Parsed floats are not exact, so values close to the range of int64 are checked on their text
+    large = valid & (converted.abs() >= 2 ** 62).to_numpy(dtype=bool, na_value=False)
+    if large.any():
+        valid[large] = series[large].map(_fits_int64).to_numpy(dtype=bool)
+    # Integers written as floats like 1e3 only keep the precision of a float
+    converted = pd.to_numeric(series.where(valid), errors="coerce", dtype_backend="numpy_nullable")
+    return converted.astype("Int64")
+
+
+def _fits_int64(text: str) -> bool:
+    """
+    Args:
+        text (str): The text of an integral number, also written as float like 1e19.
+
+    Returns:
+        bool: True if the number is in the range of int64.
+    """
+    try:
+        value: int | float = int(text.strip())
+    except ValueError:
+        value = float(text)
+    return _INT64_MIN <= value <= _INT64_MAX
+
+
+def append_rows(dataframe: pd.DataFrame, rows: pd.DataFrame, schema: dict | None = None) -> pd.DataFrame | None:
+    """
+    Append parsed text rows to a converted DataFrame, e.g. the records appended to an XML file since it was
+    parsed. The rows are converted to the dtypes of the DataFrame instead of inferring the types again.
+
+    Categorical columns get the new values as additional categories. Columns that are new in the rows stay text.
+    The types of schema columns are applied like by infer_types, the inferred types only if every new value
+    matches them, because the inference of all rows could result in another type.
+
+    Args:
+        dataframe (pd.DataFrame): The converted data.
+        rows (pd.DataFrame): The parsed text rows to append.
+        schema (dict | None): Maps column names to their type, see infer_types.
+
+    Returns:
+        pd.DataFrame | None: The data with the appended rows, indexed from 0, or None if a new value doesn't
+            match the inferred type of its column, so the types have to be inferred again.
+    """
+    schema = schema or dict()
+    columns: dict = dict()
+    for column in dataframe.columns:
+        existing: pd.Series = dataframe[column]
+        series: pd.Series = rows[column] if column in rows.columns \
+            else pd.Series(np.nan, index=rows.index, dtype=object)
+        if isinstance(existing.dtype, pd.CategoricalDtype):
+            values: pd.Series = series.dropna()
+            new_categories = values[~values.isin(existing.cat.categories)].unique()
+            if len(new_categories):
+                existing = existing.cat.add_categories(new_categories)
+            converted = pd.Series(pd.Categorical(series, categories=existing.cat.categories), index=rows.index)
+        else:
+            column_type: str = _dtype_type(existing.dtype)
+            values = series.dropna()
+            if column not in schema and not values.empty and not _matches_type(values, column_type):
+                return None
+            converted = convert_column(series, column_type)
+            if column not in schema and converted.isna().sum() != series.isna().sum():
+                return None
+        columns[column] = pd.concat([existing, converted], ignore_index=True)
+
+    for column in rows.columns:
+        if column not in columns:
+            # A column found in the appended rows only, which is missing in the previous rows
+            missing = pd.Series(np.nan, index=dataframe.index, dtype=object)
+            columns[column] = pd.concat([missing, rows[column].astype(object)], ignore_index=True)
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(dataframe) + len(rows)))
+
+
+def _dtype_type(dtype) -> str:
+    """
+    Args:
+        dtype: The dtype of a converted column, not categorical.
+
+    Returns:
+        str: The column type of the dtype, see column_types. Unknown dtypes are text.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return BOOLEAN
+    if pd.api.types.is_integer_dtype(dtype):
+        return INTEGER
+    if pd.api.types.is_float_dtype(dtype):
+        return FLOAT
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return DATETIME
+    return STRING
+
+
+def _matches_type(values: pd.Series, column_type: str) -> bool:
+    """
+    Check if all text values can be inferred as a type.
+
+    Args:
+        values (pd.Series): The text values without missing values.
+        column_type (str): The type, see column_types.
+
+    Returns:
+        bool: True if all values match the type. Every value matches a string, no value a category.
+    """
+    if column_type == STRING:
+        return True
+    if column_type == INTEGER:
+        return _all_match(values, _INTEGER_PATTERN)
+    if column_type == FLOAT:
+        return _all_match(values, _FLOAT_PATTERN) and not values.str.fullmatch(_TEXT_NUMBER_PATTERN).any()
+    if column_type == BOOLEAN:
+        return bool(values.iloc[:SAMPLE_SIZE].str.lower().isin(_BOOLEAN_VALUES.keys()).all()) \
+            and bool(values.str.lower().isin(_BOOLEAN_VALUES.keys()).all())
+    if column_type == DATETIME:
+        return _all_match(values, _DATETIME_PATTERN)
+    return False
+
+
+def _all_match(values: pd.Series, pattern: str) -> bool:
+    """
+    Check if all values match a pattern. A sample is checked first, because it rejects most patterns.
+
+    Args:
+        values (pd.Series): The text values without missing values.
+        pattern (str): The regular expression every value has to match completely.
+
+    Returns:
+        bool: True if all values match.
+    """
+    return bool(values.iloc[:SAMPLE_SIZE].str.fullmatch(pattern).all()) and bool(values.str.fullmatch(pattern).all())
+
+
+def convert_column(series: pd.Series, column_type: str) -> pd.Series:
+    """
+    Convert a text column to a type. Values that can't be converted become missing values.
+
+    Args:
+        series (pd.Series): The text values of the column, also as categorical column.
+        column_type (str): The type, see column_types.
+
+    Returns:
+        pd.Series: The converted column. Integer and boolean columns with missing values get the nullable dtype.
+
+    Raises:
+        ValueError: If the type is unknown.
+    """
+    if column_type == STRING:
+        return series
+    if isinstance(series.dtype, pd.CategoricalDtype) and column_type != CATEGORY:
+        # Only the distinct values are converted
+        categories = pd.Series(series.cat.categories, dtype=object)
+        return _take_categories(series, convert_column(categories, column_type))
+    if column_type == CATEGORY:
+        return series.astype("category")
+    if column_type == DATETIME:
+        return pd.to_datetime(series, format="ISO8601", errors="coerce")
+    if column_type == BOOLEAN:
+        converted = series.str.lower().map(_BOOLEAN_VALUES)
+        return converted.astype(bool) if converted.notna().all() else converted.astype("boolean")
+    if column_type == FLOAT:
+        return pd.to_numeric(series, errors="coerce").astype(float)
+    if column_type == INTEGER:
+        converted = _to_integer(series)
+        return converted if converted.hasnans else converted.astype("int64")
+    raise ValueError(f"Unknown column type '{column_type}', expected one of {', '.join(column_types)}")
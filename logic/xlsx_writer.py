@@ -0,0 +1,730 @@
+"""
+Contains a write-only XLSX writer that streams DataFrame chunks into the sheets of a workbook.
+Only the current chunk is held in memory, the rows are written to a temporary file and copied into the
+XLSX zip container when the sheet is finished.
+"""
+import datetime
+import os
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+import tempfile
+import zipfile
+from typing import IO, Iterable, Iterator, NamedTuple
+from xml.sax.saxutils import escape, quoteattr
+import numpy as np
+import pandas as pd
+
+# Characters that are not allowed in sheet names
+_INVALID_SHEET_NAME = re.compile(r"[\\*?:/\[\]]")
+# Control characters that are not allowed in XML
+_ILLEGAL_CHARACTERS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Excel doesn't allow wider columns
+MAX_COLUMN_WIDTH: int = 255
+# Excel doesn't allow more rows per sheet, including the header
+MAX_SHEET_ROWS: int = 1048576
+# Start of the date serial numbers of Excel
+_EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+_XML_DECLARATION: str = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NAMESPACE: str = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_RELATIONSHIP_NAMESPACE: str = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PACKAGE_RELATIONSHIP_NAMESPACE: str = "http://schemas.openxmlformats.org/package/2006/relationships"
+_SHEET_CONTENT_TYPE: str = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+
+
+class CellStyles(NamedTuple):
+    """
+    Indexes of the cell styles (cellXfs) of styles.xml used for the written cells.
+    """
+
+    header: int
+    datetime: int
+    date: int
+
+
+# Cell styles of the styles.xml of new workbooks
+DEFAULT_STYLES: CellStyles = CellStyles(header=1, datetime=2, date=3)
+
+_STYLES: str = (
+    _XML_DECLARATION +
+    f'<styleSheet xmlns="{_MAIN_NAMESPACE}">'
+    '<numFmts count="2"><numFmt numFmtId="164" formatCode="yyyy\\-mm\\-dd\\ hh:mm:ss"/>'
+    '<numFmt numFmtId="165" formatCode="yyyy\\-mm\\-dd"/></numFmts>'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/>'
+    '</border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1" '
+    'applyAlignment="1"><alignment horizontal="center" vertical="top"/></xf>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>')
+
+
+def column_letter(index: int) -> str:
+    """
+    Get the letters of a column like Excel names them.
+
+    Args:
+        index (int): The zero-based index of the column.
+
+    Returns:
+        str: The column letters, e.g. 'A' for 0 and 'AA' for 26.
+    """
+    letters: str = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def validate_sheet_name(sheet_name: str):
+    """
+    Check that a sheet name can be used in a workbook.
+
+    Args:
+        sheet_name (str): The name of the sheet.
+
+    Raises:
+        ValueError: If the name is empty or contains characters that are not allowed.
+    """
+    if not sheet_name or _INVALID_SHEET_NAME.search(sheet_name):
+        raise ValueError(f"Invalid sheet name '{sheet_name}'. A sheet name can't be empty or contain \\*?:/[]")
+
+
+def content_widths(dataframe: pd.DataFrame) -> list:
+    """
+    Calculate the width every column needs to show its header and its longest value.
+    The lengths are computed vectorized per column.
+
+    Args:
+        dataframe (pd.DataFrame): The data of the columns.
+
+    Returns:
+        list: The widths in characters in the order of the columns.
+    """
+    widths: list = list()
+    for i, column in enumerate(dataframe.columns):
+        values = dataframe.iloc[:, i].dropna()
+        length = values.astype(str).str.len().max() if len(values) else 0
+        widths.append(max(len(str(column)), int(length)))
+    return widths
+
+
+def split_rows(dataframes: Iterable[pd.DataFrame], max_rows: int) -> Iterator[Iterator[pd.DataFrame]]:
+    """
+    Split a stream of DataFrame chunks into consecutive parts of at most max_rows rows, e.g. one per sheet.
+    A chunk crossing the limit is sliced. Every part has to be consumed before the next one is requested.
+
+    Args:
+        dataframes (Iterable[pd.DataFrame]): The chunks of rows in order.
+        max_rows (int): The maximum number of rows per part.
+
+    Yields:
+        Iterator[pd.DataFrame]: The chunks of the next part. There is always at least one part.
+    """
+    chunks: Iterator[pd.DataFrame] = iter(dataframes)
+    # A chunk that is not written yet, e.g. the rest of a sliced chunk
+    pending: list = list()
+    finished: bool = False
+
+    def part() -> Iterator[pd.DataFrame]:
+        nonlocal finished
+        rows: int = 0
+        while rows < max_rows:
+            chunk = pending.pop() if pending else next(chunks, None)
+            if chunk is None:
+                finished = True
+                return
+            if rows + len(chunk) > max_rows:
+                pending.append(chunk.iloc[max_rows - rows:])
+                chunk = chunk.iloc[:max_rows - rows]
+            rows += len(chunk)
+            yield chunk
+
+    while True:
+        yield part()
+        if finished:
+            return
+        if not pending:
+            # Only start another part if there are more rows
+            chunk = next(chunks, None)
+            while chunk is not None and len(chunk) == 0:
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            pending.append(chunk)
+
+
+def _string_cell(reference: str, text: str, style: int = 0) -> str:
+    """
+    Build the XML of a cell with an inline string.
+
+    Args:
+        reference (str): The reference of the cell, like 'A1'.
+        text (str): The text of the cell.
+        style (int): The index of the cell style.
+
+    Returns:
+        str: The XML of the cell.
+    """
+    if _ILLEGAL_CHARACTERS.search(text):
+        text = _ILLEGAL_CHARACTERS.sub("", text)
+    space = ' xml:space="preserve"' if text[:1].isspace() or text[-1:].isspace() else ""
+    style_attribute = f' s="{style}"' if style else ""
+    return f'<c r="{reference}"{style_attribute} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+
+def _cell(reference: str, value, styles: CellStyles) -> str:
+    """
+    Build the XML of a cell for a value of a DataFrame.
+
+    Args:
+        reference (str): The reference of the cell, like 'A1'.
+        value: The value of the cell.
+        styles (CellStyles): The cell styles of the workbook.
+
+    Returns:
+        str: The XML of the cell or an empty string for missing values.
+    """
+    if isinstance(value, str):
+        return _string_cell(reference, value)
+    if value is None or value is pd.NaT or value is pd.NA:
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{reference}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, np.integer)):
+        return f'<c r="{reference}"><v>{int(value)}</v></c>'
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if value != value:
+            # NaN marks a missing value
+            return ""
+        if value in (float("inf"), float("-inf")):
+            return _string_cell(reference, str(value))
+        return f'<c r="{reference}"><v>{value!r}</v></c>'
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        serial = float((value - _EXCEL_EPOCH) / datetime.timedelta(days=1))
+        return f'<c r="{reference}" s="{styles.datetime}"><v>{serial!r}</v></c>'
+    if isinstance(value, datetime.date):
+        serial = (value - _EXCEL_EPOCH.date()).days
+        return f'<c r="{reference}" s="{styles.date}"><v>{serial}</v></c>'
+    return _string_cell(reference, str(value))
+
+
+class SheetStream:
+    """
+    Rows of a sheet that is currently written. The rows are streamed to a temporary file, the header row is
+    written when the sheet is finished, so columns found in later chunks can still be added.
+    """
+
+    columns: list
+    row_count: int
+    # Running maximum of the content width of every column, None if the widths are not adjusted
+    widths: list | None
+    styles: CellStyles
+
+    # Maps every column name to its position
+    __positions: dict
+    __body: IO[str]
+
+    def __init__(self, prettier: bool = False, styles: CellStyles = DEFAULT_STYLES):
+        """
+        Initialize the SheetStream.
+
+        Args:
+            prettier (bool): Adjust the column width to the content size.
+            styles (CellStyles): The cell styles of the workbook.
+        """
+        self.styles = styles
+        self.columns = list()
+        self.row_count = 0
+        self.widths = list() if prettier else None
+        self.__positions = dict()
+        self.__body = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def write_dataframe(self, dataframe: pd.DataFrame):
+        """
+        Append the rows of a DataFrame. Columns that are not known yet are appended to the sheet.
+
+        Args:
+            dataframe (pd.DataFrame): The next chunk of rows.
+        """
+        positions: list = list()
+        for column in dataframe.columns:
+            position: int | None = self.__positions.get(column)
+            if position is None:
+                position = len(self.columns)
+                self.__positions[column] = position
+                self.columns.append(column)
+                if self.widths is not None:
+                    self.widths.append(0)
+            positions.append(position)
+        letters: list = [column_letter(position) for position in positions]
+
+        if self.widths is not None:
+            # Track the widths while writing, so the workbook doesn't have to be read again
+            for position, width in zip(positions, content_widths(dataframe)):
+                self.widths[position] = max(self.widths[position], width)
+
+        write = self.__body.write
+        styles: CellStyles = self.styles
+        # The header is the first row
+        row_number: int = self.row_count + 2
+        for values in dataframe.itertuples(index=False, name=None):
+            cells = "".join([_cell(f"{letter}{row_number}", value, styles) for letter, value in zip(letters, values)])
+            write(f'<row r="{row_number}">{cells}</row>')
+            row_number += 1
+        self.row_count += len(dataframe)
+
+    def write_to(self, target: IO[bytes]):
+        """
+        Write the complete sheet XML.
+
+        Args:
+            target (IO[bytes]): The binary stream of the sheet part.
+        """
+        last_cell: str = f"{column_letter(max(len(self.columns), 1) - 1)}{self.row_count + 1}"
+        header: str = "".join([_string_cell(f"{column_letter(i)}1", str(column), self.styles.header)
+                               for i, column in enumerate(self.columns)])
+        columns: str = ""
+        if self.widths:
+            # Some padding for the bold header and the cell margins
+            columns = "<cols>" + "".join([f'<col min="{i}" max="{i}" width="{min(width + 2, MAX_COLUMN_WIDTH)}" '
+                                          f'customWidth="1"/>'
+                                          for i, width in enumerate(self.widths, 1)]) + "</cols>"
+        target.write((f'{_XML_DECLARATION}<worksheet xmlns="{_MAIN_NAMESPACE}" '
+                      f'xmlns:r="{_RELATIONSHIP_NAMESPACE}"><dimension ref="A1:{last_cell}"/>{columns}'
+                      f'<sheetData><row r="1">{header}</row>').encode("utf-8"))
+
+        # Copy the rows in blocks
+        self.__body.seek(0)
+        while block := self.__body.read(1024 * 1024):
+            target.write(block.encode("utf-8"))
+        target.write(b"</sheetData></worksheet>")
+
+    def close(self):
+        """
+        Delete the temporary file of the rows.
+        """
+        self.__body.close()
+
+
+def _append_children(xml: str, tag: str, children: str, count: int | None = None) -> str:
+    """
+    Append XML to the children of the first element with a tag. The rest of the document is kept unchanged,
+    including namespace prefixes and extensions that a reserialization would lose.
+
+    Args:
+        xml (str): The XML document.
+        tag (str): The local name of the element.
+        children (str): The XML of the children to append.
+        count (int | None): The new value of the count attribute of the element, if it has one.
+
+    Returns:
+        str: The changed XML document.
+
+    Raises:
+        ValueError: If the document has no element with the tag.
+    """
+    match = re.search(rf"<((?:[\w.-]+:)?){tag}(\s[^>]*?)?(/?)>", xml)
+    if match is None:
+        raise ValueError(f"Element '{tag}' not found")
+    prefix, attributes, empty = match.group(1), match.group(2) or "", match.group(3)
+    if count is not None:
+        attributes = re.sub(r'\scount="\d*"', "", attributes) + f' count="{count}"'
+    start_tag: str = f"<{prefix}{tag}{attributes}>"
+    end_tag: str = f"</{prefix}{tag}>"
+    if empty:
+        return xml[:match.start()] + start_tag + children + end_tag + xml[match.end():]
+    end = xml.index(end_tag, match.end())
+    return xml[:match.start()] + start_tag + xml[match.end():end] + children + xml[end:]
+
+
+def _add_cell_styles(styles: str) -> tuple[str, CellStyles]:
+    """
+    Add the cell styles of the written cells to the styles.xml of an existing workbook.
+
+    Args:
+        styles (str): The content of styles.xml.
+
+    Returns:
+        tuple[str, CellStyles]: The changed styles.xml and the indexes of the added cell styles.
+
+    Raises:
+        ValueError: If styles.xml lacks the fonts, borders or cell styles.
+    """
+    root = ET.fromstring(styles.encode("utf-8"))
+    namespace = {"m": _MAIN_NAMESPACE}
+    fonts, borders, cell_styles = (root.find(f"m:{tag}", namespace) for tag in ["fonts", "borders", "cellXfs"])
+    if fonts is None or borders is None or cell_styles is None:
+        raise ValueError("Incomplete styles")
+    number_formats = root.find("m:numFmts", namespace)
+    format_ids: list = [int(number_format.get("numFmtId")) for number_format in root.iterfind("m:numFmts/m:numFmt",
+                                                                                                 namespace)]
+    # Custom number formats start at 164
+    datetime_id: int = max(format_ids + [163]) + 1
+    prefix: str = re.search(r"<((?:[\w.-]+:)?)styleSheet\b", styles).group(1)
+
+    number_format_xml: str = (f'<{prefix}numFmt numFmtId="{datetime_id}" formatCode="yyyy\\-mm\\-dd\\ hh:mm:ss"/>'
+                              f'<{prefix}numFmt numFmtId="{datetime_id + 1}" formatCode="yyyy\\-mm\\-dd"/>')
+    if number_formats is None:
+        # The number formats are the first children of the style sheet
+        match = re.search(rf"<{prefix}styleSheet(\s[^>]*)?>", styles)
+        styles = (styles[:match.end()] + f'<{prefix}numFmts count="2">{number_format_xml}</{prefix}numFmts>' +
+                  styles[match.end():])
+    else:
+        styles = _append_children(styles, "numFmts", number_format_xml, len(number_formats) + 2)
+
+    styles = _append_children(styles, "fonts", f'<{prefix}font><{prefix}b/><{prefix}sz val="11"/>'
+                                               f'<{prefix}name val="Calibri"/><{prefix}family val="2"/>'
+                                               f'</{prefix}font>', len(fonts) + 1)
+    styles = _append_children(styles, "borders",
+                              f'<{prefix}border><{prefix}left style="thin"/><{prefix}right style="thin"/>'
+                              f'<{prefix}top style="thin"/><{prefix}bottom style="thin"/><{prefix}diagonal/>'
+                              f'</{prefix}border>', len(borders) + 1)
+    styles = _append_children(styles, "cellXfs",
+                              f'<{prefix}xf numFmtId="0" fontId="{len(fonts)}" fillId="0" '
+                              f'borderId="{len(borders)}" xfId="0" applyFont="1" applyBorder="1" applyAlignment="1">'
+                              f'<{prefix}alignment horizontal="center" vertical="top"/></{prefix}xf>'
+                              f'<{prefix}xf numFmtId="{datetime_id}" fontId="0" fillId="0" borderId="0" xfId="0" '
+                              f'applyNumberFormat="1"/>'
+                              f'<{prefix}xf numFmtId="{datetime_id + 1}" fontId="0" fillId="0" borderId="0" '
+                              f'xfId="0" applyNumberFormat="1"/>', len(cell_styles) + 3)
+    return styles, CellStyles(header=len(cell_styles), datetime=len(cell_styles) + 1, date=len(cell_styles) + 2)
+
+
+def _resolve_target(directory: str, target: str) -> str:
+    """
+    Resolve the target of a relationship to the name of a part in the zip container.
+
+    Args:
+        directory (str): The directory of the part the relationship belongs to.
+        target (str): The absolute or relative target.
+
+    Returns:
+        str: The part name without leading slash.
+    """
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(directory, target))
+
+
+class WorkbookParts:
+    """
+    The parts of an existing workbook that reference its sheets. They are changed textually to add sheets.
+    """
+
+    workbook_path: str
+    workbook: str
+    relationships_path: str
+    relationships: str
+    content_types: str
+    styles_path: str
+    styles: str
+    sheet_names: list
+    sheet_ids: list
+    relationship_ids: set
+
+    def __init__(self, archive: zipfile.ZipFile):
+        """
+        Initialize the WorkbookParts by reading them from the XLSX zip container.
+
+        Args:
+            archive (zipfile.ZipFile): The XLSX zip container.
+
+        Raises:
+            KeyError: If a part is missing.
+            ValueError: If a part is invalid.
+            ET.ParseError: If a part is no valid XML.
+        """
+        relationship = f"{{{_PACKAGE_RELATIONSHIP_NAMESPACE}}}Relationship"
+        package_relationships = ET.fromstring(archive.read("_rels/.rels"))
+        self.workbook_path = next(_resolve_target("", element.get("Target"))
+                                  for element in package_relationships.iter(relationship)
+                                  if element.get("Type") == f"{_RELATIONSHIP_NAMESPACE}/officeDocument")
+        directory, name = posixpath.split(self.workbook_path)
+        self.relationships_path = posixpath.join(directory, "_rels", f"{name}.rels")
+
+        self.workbook = archive.read(self.workbook_path).decode("utf-8")
+        self.relationships = archive.read(self.relationships_path).decode("utf-8")
+        self.content_types = archive.read("[Content_Types].xml").decode("utf-8")
+
+        sheets = ET.fromstring(self.workbook.encode("utf-8")).iterfind(f"{{{_MAIN_NAMESPACE}}}sheets/"
+                                                                       f"{{{_MAIN_NAMESPACE}}}sheet")
+        sheets = list(sheets)
+        self.sheet_names = [sheet.get("name") for sheet in sheets]
+        self.sheet_ids = [int(sheet.get("sheetId")) for sheet in sheets]
+
+        relationships = list(ET.fromstring(self.relationships.encode("utf-8")).iter(relationship))
+        self.relationship_ids = {element.get("Id") for element in relationships}
+        self.styles_path = next(_resolve_target(directory, element.get("Target")) for element in relationships
+                                if element.get("Type") == f"{_RELATIONSHIP_NAMESPACE}/styles")
+        self.styles = archive.read(self.styles_path).decode("utf-8")
+
+
+class XLSXWriter:
+    """
+    Write-only XLSX writer. Sheets are written one after another from DataFrame chunks, so the memory usage
+    doesn't depend on the number of rows.
+
+    Sheets can also be added to an existing workbook. The sheet parts are appended to the zip container and
+    only the small parts referencing the sheets are replaced, so the existing sheets are neither read nor
+    rewritten. If the writing fails, the original file is restored.
+    """
+
+    output_path: str
+    sheet_names: list
+
+    __file: IO[bytes]
+    __archive: zipfile.ZipFile
+    __styles: CellStyles
+    # Names and part names of the sheets added by this writer
+    __new_sheets: list
+    # The parts of the existing workbook, None for a new workbook
+    __parts: WorkbookParts | None
+    # Offset and content of the central directory of the existing workbook, used to restore it
+    __original_end: tuple | None
+
+    def __init__(self, output_path: str, append: bool = False):
+        """
+        Initialize the XLSXWriter and create or open the workbook file.
+
+        Args:
+            output_path (str): The path of the XLSX file.
+            append (bool): Add the sheets to the existing workbook instead of creating a new one.
+
+        Raises:
+            IOError: If the file can't be created or is no valid workbook.
+        """
+        self.output_path = output_path
+        self.__new_sheets = list()
+        self.__parts = None
+        self.__original_end = None
+        if not append:
+            self.sheet_names = list()
+            self.__styles = DEFAULT_STYLES
+            self.__file = open(output_path, "wb")
+            self.__archive = zipfile.ZipFile(self.__file, "w", compression=zipfile.ZIP_DEFLATED)
+            return
+
+        self.__file = open(output_path, "r+b")
+        try:
+            # Otherwise the append mode would add a new zip container to the end of the file
+            if not zipfile.is_zipfile(self.__file):
+                raise zipfile.BadZipFile("File is not a zip file")
+            self.__archive = zipfile.ZipFile(self.__file, "a", compression=zipfile.ZIP_DEFLATED)
+            try:
+                self.__parts = WorkbookParts(self.__archive)
+                self.__parts.styles, self.__styles = _add_cell_styles(self.__parts.styles)
+            except BaseException:
+                self.__archive.close()
+                raise
+        except (zipfile.BadZipFile, KeyError, StopIteration, ValueError, ET.ParseError) as e:
+            self.__file.close()
+            raise IOError(f"'{output_path}' is no valid XLSX file: {e}") from e
+        self.sheet_names = list(self.__parts.sheet_names)
+
+        # The central directory is overwritten by the new parts
+        start: int = self.__archive.start_dir
+        with open(output_path, "rb") as file:
+            file.seek(start)
+            self.__original_end = (start, file.read())
+
+    def __enter__(self) -> "XLSXWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write_sheet(self, sheet_name: str, dataframes: Iterable[pd.DataFrame], prettier: bool = False) -> int:
+        """
+        Write DataFrame chunks as a new sheet. The header contains the columns of all chunks in first-seen order.
+
+        Args:
+            sheet_name (str): The name of the sheet.
+            dataframes (Iterable[pd.DataFrame]): The chunks of rows in order.
+            prettier (bool): Adjust the column width to the content size. The widths are calculated while
+                writing the rows.
+
+        Returns:
+            int: The number of written rows.
+
+        Raises:
+            ValueError: If the sheet name is invalid or already used.
+            IOError: If the file can't be written.
+        """
+        validate_sheet_name(sheet_name)
+        if sheet_name.lower() in (name.lower() for name in self.sheet_names):
+            raise ValueError(f"Sheet '{sheet_name}' already exists")
+
+        sheet = SheetStream(prettier, self.__styles)
+        try:
+            # The rows are complete before the zip container is changed
+            for dataframe in dataframes:
+                sheet.write_dataframe(dataframe)
+            part_name = self.__next_sheet_part()
+            with self.__archive.open(part_name, "w", force_zip64=True) as target:
+                sheet.write_to(target)
+        finally:
+            sheet.close()
+        self.sheet_names.append(sheet_name)
+        self.__new_sheets.append((sheet_name, part_name))
+        return sheet.row_count
+
+    def close(self):
+        """
+        Write the workbook parts referencing the sheets and close the file.
+        """
+        if self.__file.closed:
+            return
+        try:
+            if self.__parts is None:
+                self.__write_workbook_parts()
+            elif self.__new_sheets:
+                self.__update_workbook_parts()
+            self.__archive.close()
+        except BaseException:
+            self.abort()
+            raise
+        self.__file.close()
+
+    def abort(self):
+        """
+        Close the file without finishing it. A new workbook is deleted, an existing workbook is restored.
+        """
+        if self.__file.closed:
+            return
+        try:
+            self.__archive.close()
+        except Exception:
+            # The file is restored or deleted anyway
+            pass
+        if self.__original_end is not None:
+            start, end = self.__original_end
+            self.__file.seek(start)
+            self.__file.truncate()
+            self.__file.write(end)
+            self.__file.close()
+        else:
+            self.__file.close()
+            os.remove(self.output_path)
+
+    def __next_sheet_part(self) -> str:
+        """
+        Find the name of the part of the next sheet.
+
+        Returns:
+            str: An unused part name like 'xl/worksheets/sheet2.xml'.
+        """
+        directory: str = posixpath.dirname(self.__parts.workbook_path) if self.__parts is not None else "xl"
+        names: set = set(self.__archive.namelist())
+        i: int = len(self.sheet_names) + 1
+        while posixpath.join(directory, "worksheets", f"sheet{i}.xml") in names:
+            i += 1
+        return posixpath.join(directory, "worksheets", f"sheet{i}.xml")
+
+    def __write_workbook_parts(self):
+        """
+        Write the parts of a new workbook.
+        """
+        sheets: str = "".join([f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+                               for i, (name, part_name) in enumerate(self.__new_sheets, 1)])
+        self.__archive.writestr("xl/workbook.xml", f'{_XML_DECLARATION}<workbook xmlns="{_MAIN_NAMESPACE}" '
+                                                   f'xmlns:r="{_RELATIONSHIP_NAMESPACE}"><sheets>{sheets}</sheets>'
+                                                   f'</workbook>')
+
+        relationships: str = "".join([f'<Relationship Id="rId{i}" Type="{_RELATIONSHIP_NAMESPACE}/worksheet" '
+                                      f'Target="{posixpath.relpath(part_name, "xl")}"/>'
+                                      for i, (name, part_name) in enumerate(self.__new_sheets, 1)])
+        relationships += (f'<Relationship Id="rId{len(self.__new_sheets) + 1}" '
+                          f'Type="{_RELATIONSHIP_NAMESPACE}/styles" Target="styles.xml"/>')
+        self.__archive.writestr("xl/_rels/workbook.xml.rels",
+                                f'{_XML_DECLARATION}<Relationships xmlns="{_PACKAGE_RELATIONSHIP_NAMESPACE}">'
+                                f'{relationships}</Relationships>')
+        self.__archive.writestr("xl/styles.xml", _STYLES)
+
+        self.__archive.writestr("_rels/.rels",
+                                f'{_XML_DECLARATION}<Relationships xmlns="{_PACKAGE_RELATIONSHIP_NAMESPACE}">'
+                                f'<Relationship Id="rId1" Type="{_RELATIONSHIP_NAMESPACE}/officeDocument" '
+                                f'Target="xl/workbook.xml"/></Relationships>')
+        self.__archive.writestr("[Content_Types].xml", _append_children(
+            f'{_XML_DECLARATION}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            '</Types>', "Types", self.__sheet_overrides("")))
+
+    def __update_workbook_parts(self):
+        """
+        Replace the parts of an existing workbook by versions referencing the added sheets.
+        The replaced parts stay unreferenced in the zip container, the existing sheets are not touched.
+        """
+        parts: WorkbookParts = self.__parts
+        workbook_directory: str = posixpath.dirname(parts.workbook_path)
+
+        # Use the prefix of the relationship namespace if it is declared by the root of the workbook
+        root_tag: str = re.search(r"<(?:[\w.-]+:)?workbook\b[^>]*>", parts.workbook).group(0)
+        match = re.search(rf'xmlns:([\w.-]+)="{re.escape(_RELATIONSHIP_NAMESPACE)}"', root_tag)
+        id_attribute: str = f"{match.group(1)}:id" if match else f'xmlns:r="{_RELATIONSHIP_NAMESPACE}" r:id'
+        workbook_prefix: str = re.search(r"<((?:[\w.-]+:)?)sheets\b", parts.workbook).group(1)
+        relationships_prefix: str = re.search(r"<((?:[\w.-]+:)?)Relationships\b", parts.relationships).group(1)
+
+        sheets: str = ""
+        relationships: str = ""
+        sheet_id: int = max(parts.sheet_ids + [0])
+        relationship_number: int = len(parts.relationship_ids)
+        for name, part_name in self.__new_sheets:
+            sheet_id += 1
+            relationship_number += 1
+            while f"rId{relationship_number}" in parts.relationship_ids:
+                relationship_number += 1
+            sheets += (f'<{workbook_prefix}sheet name={quoteattr(name)} sheetId="{sheet_id}" '
+                       f'{id_attribute}="rId{relationship_number}"/>')
+            relationships += (f'<{relationships_prefix}Relationship Id="rId{relationship_number}" '
+                              f'Type="{_RELATIONSHIP_NAMESPACE}/worksheet" '
+                              f'Target="{posixpath.relpath(part_name, workbook_directory)}"/>')
+
+        types_prefix: str = re.search(r"<((?:[\w.-]+:)?)Types\b", parts.content_types).group(1)
+        replaced_parts: dict = {
+            parts.workbook_path: _append_children(parts.workbook, "sheets", sheets),
+            parts.relationships_path: _append_children(parts.relationships, "Relationships", relationships),
+            "[Content_Types].xml": _append_children(parts.content_types, "Types",
+                                                    self.__sheet_overrides(types_prefix)),
+            parts.styles_path: parts.styles,
+        }
+        for part_name, content in replaced_parts.items():
+            # Drop the old version from the central directory
+            info = self.__archive.NameToInfo.pop(part_name)
+            self.__archive.filelist.remove(info)
+            self.__archive.writestr(part_name, content)
+
+    def __sheet_overrides(self, prefix: str) -> str:
+        """
+        Build the content types of the added sheets.
+
+        Args:
+            prefix (str): The namespace prefix of the content types document.
+
+        Returns:
+            str: The override elements of the sheet parts.
+        """
+        return "".join([f'<{prefix}Override PartName="/{part_name}" ContentType="{_SHEET_CONTENT_TYPE}"/>'
+                        for name, part_name in self.__new_sheets])
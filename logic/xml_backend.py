@@ -0,0 +1,162 @@
+"""
+Contains the XML parser backends. The lxml backend is used if lxml is installed, otherwise the
+ElementTree backend of the standard library.
+"""
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+
+class ElementTreeBackend:
+    """
+    Parser backend based on xml.etree.ElementTree of the standard library.
+    """
+
+    name: str = "etree"
+
+    def iterparse(self, source: IO[bytes], events: tuple) -> Iterator[tuple]:
+        """
+        Parse an XML source incrementally.
+
+        Args:
+            source (IO[bytes]): The binary XML source.
+            events (tuple): The events to report, like "start" and "end".
+
+        Returns:
+            Iterator[tuple]: Pairs of the event and the related element.
+
+        Raises:
+            ET.ParseError: If the XML source contains an error.
+        """
+        return ET.iterparse(source, events=events)
+
+    def parse(self, source: IO[bytes]) -> ET.Element:
+        """
+        Parse a whole XML source into an element tree.
+
+        Args:
+            source (IO[bytes]): The binary XML source.
+
+        Returns:
+            ET.Element: The root element.
+
+        Raises:
+            ET.ParseError: If the XML source contains an error.
+        """
+        return ET.parse(source).getroot()
+
+
+class LXMLBackend:
+    """
+    Parser backend based on the C parser of lxml (libxml2).
+    Comments and processing instructions are removed and only internal entities are resolved, so the elements
+    match the ones of ElementTree.
+    """
+
+    name: str = "lxml"
+
+    def iterparse(self, source: IO[bytes], events: tuple) -> Iterator[tuple]:
+        """
+        Parse an XML source incrementally.
+
+        Args:
+            source (IO[bytes]): The binary XML source.
+            events (tuple): The events to report, like "start" and "end".
+
+        Yields:
+            tuple: Pairs of the event and the related element.
+
+        Raises:
+            ET.ParseError: If the XML source contains an error.
+        """
+        try:
+            yield from lxml_etree.iterparse(source, events=events, huge_tree=True, remove_comments=True,
+                                            remove_pis=True, resolve_entities="internal")
+        except lxml_etree.XMLSyntaxError as e:
+            raise _to_parse_error(source, e) from e
+
+    def parse(self, source: IO[bytes]) -> ET.Element:
+        """
+        Parse a whole XML source into an element tree.
+
+        Args:
+            source (IO[bytes]): The binary XML source.
+
+        Returns:
+            ET.Element: The root element.
+
+        Raises:
+            ET.ParseError: If the XML source contains an error.
+        """
+        parser = lxml_etree.XMLParser(huge_tree=True, remove_comments=True, remove_pis=True,
+                                      resolve_entities="internal")
+        try:
+            return lxml_etree.parse(source, parser).getroot()
+        except lxml_etree.XMLSyntaxError as e:
+            raise _to_parse_error(source, e) from e
+
+
+def _to_parse_error(source: IO[bytes], error: Exception) -> ET.ParseError:
+    """
+    Convert an lxml syntax error to the ParseError of ElementTree.
+    libxml2 uses other error codes than expat, e.g. for empty documents. Therefore, the source is checked
+    again with expat to get the same error as the ElementTree backend.
+
+    Args:
+        source (IO[bytes]): The binary XML source that failed to parse.
+        error (Exception): The error raised by lxml.
+
+    Returns:
+        ET.ParseError: The error as it would be raised by ElementTree.
+    """
+    if source.seekable():
+        source.seek(0)
+        try:
+            root: ET.Element | None = None
+            for event, element in ET.iterparse(source, events=("start", "end")):
+                # Only the error is relevant, keep the memory usage flat
+                if root is None:
+                    root = element
+                elif event == "end":
+                    root.clear()
+        except ET.ParseError as e:
+            return e
+
+    # If expat accepts the document or the source can't be read again
+    parse_error = ET.ParseError(str(error))
+    parse_error.code = getattr(error, "code", 0)
+    parse_error.position = getattr(error, "position", (0, 0))
+    return parse_error
+
+
+# All available backends by their name
+backends: dict = {ElementTreeBackend.name: ElementTreeBackend()}
+if lxml_etree is not None:
+    backends[LXMLBackend.name] = LXMLBackend()
+
+
+def get_backend(name: str | None = None, streaming: bool = False) -> ElementTreeBackend | LXMLBackend:
+    """
+    Get a parser backend by its name.
+
+    Args:
+        name (str | None): The name of the backend. Defaults to lxml if installed and the whole document is
+            parsed at once, otherwise etree. For streaming, etree is faster, because lxml creates an element proxy
+            for every event.
+        streaming (bool): The backend is used to stream the document with iterparse.
+
+    Returns:
+        ElementTreeBackend | LXMLBackend: The parser backend.
+
+    Raises:
+        ValueError: If no backend with the name is available.
+    """
+    if name is None:
+        name = LXMLBackend.name if LXMLBackend.name in backends and not streaming else ElementTreeBackend.name
+    if name not in backends:
+        raise ValueError(f"XML parser backend '{name}' is not available. Available: {', '.join(backends)}")
+    return backends[name]
@@ -1,7 +1,38 @@
+import io
+import os
+import re
+import threading
 import xml.etree.ElementTree as ET
 import pandas as pd
 import logic.logging as log
-from typing import Callable
+import logic.type_inference as type_inference
+import logic.xml_backend as xml_backend
+import logic.xml_input as xml_input
+from logic.column_accumulator import ColumnAccumulator
+from logic.parse_cache import ParseCache, option_key
+from logic.record_filter import RecordFilter
+from logic.record_path import RecordPath
+from contextlib import nullcontext
+from typing import IO, Callable, Iterator
+
+
+# Number of records after which the progress is reported and the cancellation is checked
+PROGRESS_INTERVAL: int = 1000
+# Number of bytes before the end of the records which have to be unchanged to parse appended records only
+APPEND_CHECK_SIZE: int = 4096
+# Number of bytes searched for the start and the end tag of the root element
+_ROOT_SEARCH_SIZE: int = 64 * 1024
+# The declarations, comments and the start tag of the root element at the start of an XML file
+_ROOT_START = re.compile(rb"(?:\xef\xbb\xbf)?\s*(?:<\?.*?\?>\s*|<!--.*?-->\s*|<!DOCTYPE[^\[>]*(?:\[.*?\])?\s*>\s*)*"
+                         rb"<(?P<tag>[^\s/>!?]+)(?:\s+[^\s=/>]+\s*=\s*(?:\"[^\"]*\"|'[^']*'))*\s*>", re.DOTALL)
+# The end tag of the root element at the end of an XML file
+_ROOT_END = re.compile(rb"</(?P<tag>[^\s<>]+)\s*>\s*\Z")
+
+
+class ParseCanceledError(Exception):
+    """
+    Raised if the parsing of an XML file was canceled.
+    """
 
 
 class XMLParser:
@@ -10,46 +41,328 @@ class XMLParser:
     """
 
     dataframe: pd.DataFrame | None = None
+    schema: pd.DataFrame | None = None
     __listeners: list = list()
+    __schema_listeners: list = list()
+    __append_listeners: list = list()
+    # The end of the records of the last parsed file, so records appended to it can be parsed incrementally
+    __append_state: dict | None = None
 
     @classmethod
-    def parse_xml_to_dataframe(cls, file_path: str):
+    def parse_xml_to_dataframe(cls, file_path: str, cache: ParseCache | None = None, incremental: bool = False,
+                               **options):
         """
-        Parse an XML file and convert it to a pandas DataFrame.
+        Parse an XML file, store the DataFrame in the dataframe attribute and notify all listeners.
+        If the file can't be parsed, the dataframe attribute is set to None.
 
         Args:
             file_path (str): The path to the XML file to be parsed.
+            cache (ParseCache | None): Load the DataFrame of an unchanged file from the cache instead of parsing
+                it and store newly parsed DataFrames.
+            incremental (bool): If the file was parsed last with the same options and records were only appended
+                before the end tag of the root since, only parse the appended records. They are appended to the
+                dataframe attribute and only the append listeners are notified. Otherwise, the file is parsed
+                completely.
+            **options: Parse options passed to read_dataframe, like streaming or backend.
         """
-        log.log_event(f"Start parse XML to DataFrame of file: {file_path}")
+        try:
+            if incremental and cls.__parse_appended(file_path, cache, options):
+                return
+            cls.__append_state = None
+            # The end of the records is taken before parsing, so records appended meanwhile aren't skipped
+            state: dict | None = _append_state(file_path, options)
+            cls.dataframe = cache.load(file_path, **options) if cache is not None else None
+            if cls.dataframe is None:
+                # The fingerprint is taken before parsing, so a file changed meanwhile doesn't match the entry
+                fingerprint: dict | None = cache.fingerprint(file_path) if cache is not None else None
+                cls.dataframe = cls.read_dataframe(file_path, **options)
+                if cache is not None:
+                    cache.store(file_path, cls.dataframe, fingerprint, **options)
+            if state is not None and _file_changed(file_path, state):
+                log.log_event(f"{file_path} was changed while parsing, parse it completely the next time")
+                state = None
+            if state is not None:
+                state["rows"] = len(cls.dataframe)
+            cls.__append_state = state
+        except ET.ParseError as e:
+            # If a parse error other than an empty file, like a syntax error, was thrown
+            log.log_error(f"Error while parsing XML file: {e}")
+            cls.dataframe = None
+        except ParseCanceledError:
+            log.log_event("Parsing canceled")
+            cls.dataframe = None
+        except (OSError, ValueError) as e:
+            # If the file can't be read, e.g. a missing file or a ZIP archive without a single XML file
+            log.log_error(f"Error while reading XML file: {e}")
+            cls.dataframe = None
+            cls.__append_state = None
+        for listener in cls.__listeners:
+            listener(cls.dataframe)
+
+    @classmethod
+    def scan_xml_schema(cls, file_path: str, **options):
+        """
+        Scan the columns of an XML file, store them in the schema attribute and notify all schema listeners.
+        If the file can't be scanned, the schema attribute is set to None.
 
+        Args:
+            file_path (str): The path to the XML file to be scanned.
+            **options: Scan options passed to scan_schema, like backend or max_records.
+        """
         try:
-            tree: ET.ElementTree = ET.parse(file_path)
-            root: ET.Element = tree.getroot()
+            cls.schema = cls.scan_schema(file_path, **options)
         except ET.ParseError as e:
-            if e.code == 3:
-                # If the XML file contains no elements
-                root = ET.Element("root")
-            else:
-                # If another parse error, like a syntax error, was thrown
-                log.log_error(f"Error while parsing XML file: {e}")
-                cls.dataframe = None
-                for listener in cls.__listeners:
-                    listener(cls.dataframe)
-                return
+            log.log_error(f"Error while parsing XML file: {e}")
+            cls.schema = None
+        except ParseCanceledError:
+            log.log_event("Scanning canceled")
+            cls.schema = None
+        except (OSError, ValueError) as e:
+            log.log_error(f"Error while reading XML file: {e}")
+            cls.schema = None
+        for listener in cls.__schema_listeners:
+            listener(cls.schema)
+
+    @classmethod
+    def scan_schema(cls, file_path: str | IO[bytes], backend: str | None = None, max_records: int | None = None,
+                    progress: Callable[[int, int], None] | None = None,
+                    cancel_event: threading.Event | None = None, record_path: str | None = None) -> pd.DataFrame:
+        """
+        Stream an XML file and collect only the columns, without keeping any value. Much faster and leaner than
+        parsing the DataFrame, e.g. to show the columns of a large file before it is parsed.
+
+        Args:
+            file_path (str | IO[bytes]): The path to the XML file to be scanned or a binary stream of it.
+            backend (str | None): The name of the XML parser backend. Defaults to etree, which streams faster.
+            max_records (int | None): Stop after this number of records. Defaults to the whole file.
+            progress (Callable[[int, int], None] | None): Called regularly with the number of read bytes and
+                scanned records.
+            cancel_event (threading.Event | None): The scanning is canceled as soon as the event is set.
+            record_path (str | None): The path of the record elements, see read_dataframe.
+
+        Returns:
+            pd.DataFrame: A row for every column in first-seen order, indexed by the column name. The 'count'
+                column contains the number of records with a value and 'null_ratio' the share of records without.
+
+        Raises:
+            ET.ParseError: If the XML file contains a syntax error.
+            ParseCanceledError: If the cancel event was set.
+            ValueError: If the record path is invalid.
+        """
+        log.log_event(f"Start scan columns of file: {file_path}")
+        parser_backend = xml_backend.get_backend(backend, streaming=True)
+        records_path: RecordPath | None = RecordPath(record_path) if record_path is not None else None
+
+        # Maps every column to the number of records with a value in first-seen order
+        counts: dict = dict()
+        # Maps every column to the last record with a value, so repeated elements are counted once
+        last_records: dict = dict()
+        records: int = 0
+        try:
+            with _open_source(file_path) as source:
+                for record in cls.__iter_records(source, parser_backend, records_path):
+                    cls.__scan_columns(record, records, counts, last_records)
+                    records += 1
+                    if records % PROGRESS_INTERVAL == 0:
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise ParseCanceledError(f"Scanning of {file_path} canceled")
+                        if progress is not None:
+                            progress(_position(source), records)
+                    if max_records is not None and records >= max_records:
+                        break
+
+                if progress is not None:
+                    progress(_position(source), records)
+        except ET.ParseError as e:
+            if e.code != 3:
+                raise
+            # If the XML file contains no elements
+        log.log_event(f"{len(counts)} columns found in {records} records")
+
+        values: list = list(counts.values())
+        return pd.DataFrame({"count": values,
+                             "null_ratio": [1 - count / records if records else 0.0 for count in values]},
+                            index=pd.Index(list(counts), name="column", dtype=object))
+
+    @classmethod
+    def read_dataframe(cls, file_path: str | IO[bytes], streaming: bool = False, backend: str | None = None,
+                       workers: int = 1, progress: Callable[[int, int], None] | None = None,
+                       cancel_event: threading.Event | None = None, infer_types: bool = False,
+                       schema: dict | None = None, categorical: bool = False, columns: list | None = None,
+                       record_filter: str | RecordFilter | None = None,
+                       record_path: str | None = None) -> pd.DataFrame:
+        """
+        Parse an XML file and convert it to a pandas DataFrame.
+        In contrast to parse_xml_to_dataframe neither the dataframe attribute nor the listeners are touched.
+
+        Args:
+            file_path (str | IO[bytes]): The path to the XML file to be parsed or a binary stream of it.
+            streaming (bool): Parse the file record by record instead of loading the whole document tree.
+                Keeps the memory usage flat for large files and results in the same DataFrame.
+            backend (str | None): The name of the XML parser backend. Defaults to lxml if installed and the file
+                isn't streamed, otherwise etree.
+            workers (int): The number of worker processes. With more than one worker a large file is split on
+                the record boundaries and the parts are parsed in parallel.
+            progress (Callable[[int, int], None] | None): Called regularly with the number of read bytes and
+                parsed records. While parsing in parallel, it is called after every parsed part.
+            cancel_event (threading.Event | None): The parsing is canceled as soon as the event is set.
+            infer_types (bool): Convert numeric, boolean and date columns to native dtypes and repetitive text
+                columns to categories. Otherwise, every value is text.
+            schema (dict | None): Maps column names to their type, see type_inference.column_types.
+            categorical (bool): Store every distinct value of a column once while parsing and construct
+                categorical columns. Lowers the memory usage for repetitive values.
+            columns (list | None): Only extract these columns, the elements of other columns are skipped while
+                parsing. The found columns keep their first-seen order, columns not found are missing.
+            record_filter (str | RecordFilter | None): Only keep the records matching the filter expression, like
+                'state == "NEW"'. Rejected records are dropped while parsing.
+            record_path (str | None): The path of the record elements, like 'items/item' or a tag name, see
+                record_path.RecordPath. Defaults to the direct children of the root. Elements outside the records
+                are freed as soon as they are read.
+
+        Returns:
+            pd.DataFrame: The parsed XML data. Empty if the file contains no elements.
+
+        Raises:
+            ET.ParseError: If the XML file contains a syntax error.
+            ParseCanceledError: If the cancel event was set.
+            ValueError: If a type of the schema is unknown, the filter expression or the record path is invalid.
+        """
+        log.log_event(f"Start parse XML to DataFrame of file: {file_path}")
+        parser_backend = xml_backend.get_backend(backend, streaming=streaming)
+        log.log_event(f"Using XML parser backend: {parser_backend.name}")
+        if isinstance(record_filter, str):
+            record_filter = RecordFilter(record_filter)
+        records_path: RecordPath | None = RecordPath(record_path) if record_path is not None else None
+
+        if workers > 1 and record_path is not None:
+            # The file is split on the direct children of the root
+            log.log_event("Parse the XML file sequentially, because a record path is set")
+        elif workers > 1 and isinstance(file_path, str) and xml_input.detect_compression(file_path) is not None:
+            # A compressed file can only be read from the start
+            log.log_event("Parse the compressed XML file sequentially")
+        elif workers > 1 and isinstance(file_path, str):
+            # Imported here, because the parallel parsing uses the XMLParser in the worker processes
+            import logic.parallel_parse as parallel_parse
+
+            dataframe: pd.DataFrame | None = parallel_parse.read_dataframe_parallel(
+                file_path, workers, progress=progress, cancel_event=cancel_event, backend=backend,
+                categorical=categorical, columns=columns,
+                record_filter=record_filter.expression if record_filter is not None else None)
+            if dataframe is not None:
+                log.log_event(f"{len(dataframe.columns)} columns and {len(dataframe)} rows found")
+                log.log_event("Finished parsing XML file to DataFrame")
+                return cls.__convert_types(dataframe, infer_types, schema)
+            log.log_event("Parse the XML file sequentially")
+
+        selection: frozenset | None = frozenset(columns) if columns is not None else None
+        # The leaf values of the current record, which the filter is evaluated on
+        record_values: dict | None = dict() if record_filter is not None else None
+        accumulator: ColumnAccumulator = ColumnAccumulator(categorical=categorical)
+        record_count: int = 0
+        try:
+            with _open_source(file_path) as source:
+                if streaming:
+                    # Every direct child of the root is handled as soon as its end tag is read
+                    records = cls.__iter_records(source, parser_backend, records_path)
+                elif records_path is None:
+                    records = parser_backend.parse(source)
+                else:
+                    records = cls.__find_records(parser_backend.parse(source), list(), records_path)
 
-        columns: list = list()
-        rows: list = list()
-        for row in root:
-            row_data: dict = dict()
-            cls.__extract_columns_and_data(row, row_data, columns)
-            rows.append(row_data)
-        log.log_event(f"{len(columns)} columns and {len(rows)} rows found")
+                for row in records:
+                    cls.__extract_columns_and_data(row, accumulator, selection, record_values)
+                    cls.__end_record(accumulator, record_filter, record_values)
+                    record_count += 1
+                    if record_count % PROGRESS_INTERVAL == 0:
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise ParseCanceledError(f"Parsing of {file_path} canceled")
+                        if progress is not None:
+                            progress(_position(source), record_count)
+
+                if progress is not None:
+                    progress(_position(source), record_count)
+        except ET.ParseError as e:
+            if e.code != 3:
+                raise
+            # If the XML file contains no elements
+            accumulator = ColumnAccumulator(categorical=categorical)
+        if record_filter is not None:
+            log.log_event(f"{accumulator.row_count} of {record_count} records match the filter")
+        log.log_event(f"{len(accumulator.columns)} columns and {accumulator.row_count} rows found")
 
         # Construct the DataFrame
-        cls.dataframe = pd.DataFrame(rows, columns=columns)
+        dataframe = accumulator.to_dataframe()
         log.log_event("Finished parsing XML file to DataFrame")
-        for listener in cls.__listeners:
-            listener(cls.dataframe)
+        return cls.__convert_types(dataframe, infer_types, schema)
+
+    @classmethod
+    def iter_dataframes(cls, file_path: str | IO[bytes], chunk_size: int = 10000, columns: list | None = None,
+                        backend: str | None = None, schema: dict | None = None, categorical: bool = False,
+                        record_filter: str | RecordFilter | None = None,
+                        record_path: str | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Parse an XML file in a streaming way and yield DataFrames of at most chunk_size rows.
+        Only the rows of the current chunk are held in memory.
+
+        Without explicit columns the schema of every chunk contains all columns found so far in first-seen
+        order. Columns found in later chunks are only appended, so the columns of a chunk are always a prefix
+        of the columns of the following chunks.
+
+        Args:
+            file_path (str | IO[bytes]): The path to the XML file to be parsed or a binary stream of it.
+            chunk_size (int): The maximum number of rows per DataFrame.
+            columns (list | None): A fixed list of columns every chunk is built with. The elements of other columns
+                are skipped while parsing.
+            backend (str | None): The name of the XML parser backend. Defaults to etree, which streams faster.
+            schema (dict | None): Maps column names to their type, see type_inference.column_types. Types are not
+                inferred, because the chunks could get different types.
+            categorical (bool): Store every distinct value of a column once and yield categorical columns.
+            record_filter (str | RecordFilter | None): Only yield the records matching the filter expression.
+            record_path (str | None): The path of the record elements, see read_dataframe.
+
+        Yields:
+            pd.DataFrame: The next chunk of parsed rows.
+
+        Raises:
+            ET.ParseError: If the XML file contains a syntax error.
+            ValueError: If the filter expression or the record path is invalid.
+        """
+        log.log_event(f"Start parse XML to DataFrame chunks of {chunk_size} rows of file: {file_path}")
+        parser_backend = xml_backend.get_backend(backend, streaming=True)
+        log.log_event(f"Using XML parser backend: {parser_backend.name}")
+        if isinstance(record_filter, str):
+            record_filter = RecordFilter(record_filter)
+        records_path: RecordPath | None = RecordPath(record_path) if record_path is not None else None
+
+        selection: frozenset | None = frozenset(columns) if columns is not None else None
+        record_values: dict | None = dict() if record_filter is not None else None
+        accumulator: ColumnAccumulator = ColumnAccumulator(categorical=categorical)
+        row_count: int = 0
+        try:
+            with _open_source(file_path) as source:
+                for record in cls.__iter_records(source, parser_backend, records_path):
+                    cls.__extract_columns_and_data(record, accumulator, selection, record_values)
+                    cls.__end_record(accumulator, record_filter, record_values)
+                    if accumulator.row_count >= chunk_size:
+                        row_count += accumulator.row_count
+                        dataframe = accumulator.to_dataframe(list(accumulator.columns) if columns is None else columns)
+                        yield cls.__convert_types(dataframe, False, schema)
+                        accumulator.reset()
+        except ET.ParseError as e:
+            if e.code != 3 or row_count > 0:
+                # If the file contains a syntax error or ends after some chunks were already yielded
+                log.log_error(f"Error while parsing XML file: {e}")
+                raise
+            # If the XML file contains no elements
+            accumulator.reset()
+
+        if accumulator.row_count > 0:
+            # Yield the remaining rows
+            row_count += accumulator.row_count
+            dataframe = accumulator.to_dataframe(list(accumulator.columns) if columns is None else columns)
+            yield cls.__convert_types(dataframe, False, schema)
+        log.log_event(f"{len(accumulator.columns)} columns and {row_count} rows found")
+        log.log_event("Finished parsing XML file to DataFrame chunks")
 
     @classmethod
     def set_dataframe_none(cls):
@@ -57,30 +370,266 @@ class XMLParser:
         Set the dataframe attribute to None and notify all listeners.
         """
         cls.dataframe = None
+        cls.__append_state = None
         for listener in cls.__listeners:
             listener(cls.dataframe)
 
     @classmethod
-    def __extract_columns_and_data(cls, element: ET.Element, row_data: dict, columns: list):
+    def __parse_appended(cls, file_path: str, cache: ParseCache | None, options: dict) -> bool:
+        """
+        Parse the records appended to the last parsed XML file and append them to the dataframe attribute.
+        The start of the file and the bytes before the end of the previous records have to be unchanged.
+
+        Args:
+            file_path (str): The path to the XML file.
+            cache (ParseCache | None): Stores the DataFrame with the appended records.
+            options (dict): The parse options, see read_dataframe.
+
+        Returns:
+            bool: True if the appended records were parsed, False if the file has to be parsed completely.
+
+        Raises:
+            ParseCanceledError: If the cancel event was set.
+        """
+        state: dict | None = cls.__append_state
+        if state is None or cls.dataframe is None or state["path"] != file_path \
+                or state["options"] != option_key(options) or state["rows"] != len(cls.dataframe):
+            return False
+        # The fingerprint is taken before reading, so records appended meanwhile don't match the cache entry
+        fingerprint: dict | None = cache.fingerprint(file_path) if cache is not None else None
+        position: tuple | None = _find_append_position(file_path)
+        if position is None or position[1] < state["end"]:
+            return False
+        prefix_end, end, size = position
+        with open(file_path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            prefix: bytes = file.read(prefix_end)
+            file.seek(state["end"] - len(state["tail"]))
+            if stat.st_size != size or prefix != state["prefix"] \
+                    or file.read(len(state["tail"])) != state["tail"]:
+                log.log_event(f"{file_path} was changed, parse it completely")
+                return False
+            appended: bytes = file.read(end - state["end"])
+            closing: bytes = file.read(size - end)
+        if not appended.strip():
+            log.log_event(f"No records were appended to {file_path}")
+            state.update(size=size, mtime=stat.st_mtime_ns)
+            return True
+
+        # Parse the appended records as text and convert them to the types of the previous records
+        log.log_event(f"Parse {len(appended)} appended bytes of {file_path}")
+        try:
+            rows = cls.read_dataframe(io.BytesIO(prefix + appended + closing),
+                                      **{**options, "workers": 1, "infer_types": False, "schema": None,
+                                         "categorical": False})
+        except ET.ParseError as e:
+            log.log_event(f"Appended records of {file_path} can't be parsed separately: {e}")
+            return False
+        dataframe: pd.DataFrame | None = type_inference.append_rows(cls.dataframe, rows, options.get("schema"))
+        if dataframe is None:
+            log.log_event(f"Appended records of {file_path} change the column types, parse it completely")
+            return False
+
+        previous_rows: int = len(cls.dataframe)
+        cls.dataframe = dataframe
+        state.update(size=size, mtime=stat.st_mtime_ns, end=end, tail=(state["tail"] + appended)[-APPEND_CHECK_SIZE:],
+                     rows=len(dataframe))
+        log.log_event(f"{len(rows)} appended rows parsed")
+        if cache is not None:
+            cache.store(file_path, dataframe, fingerprint, **options)
+        for listener in cls.__append_listeners:
+            listener(dataframe.iloc[previous_rows:])
+        return True
+
+    @classmethod
+    def __convert_types(cls, dataframe: pd.DataFrame, infer_types: bool, schema: dict | None) -> pd.DataFrame:
+        """
+        Convert the text columns of a parsed DataFrame to the types of the schema or the inferred types.
+
+        Args:
+            dataframe (pd.DataFrame): The parsed XML data.
+            infer_types (bool): Infer the types of the columns that are not part of the schema.
+            schema (dict | None): Maps column names to their type.
+
+        Returns:
+            pd.DataFrame: The converted data or the given data if nothing has to be converted.
+        """
+        if not infer_types and not schema:
+            return dataframe
+        dataframe = type_inference.infer_types(dataframe, schema, infer=infer_types)
+        typed: int = sum(dtype != object for dtype in dataframe.dtypes)
+        log.log_event(f"{typed} of {len(dataframe.columns)} columns converted to native types")
+        return dataframe
+
+    @classmethod
+    def __iter_records(cls, source: IO[bytes], parser_backend: xml_backend.ElementTreeBackend | xml_backend.LXMLBackend,
+                       record_path: RecordPath | None = None) -> Iterator[ET.Element]:
+        """
+        Stream the record elements of an XML file.
+        Each record is yielded as soon as its end tag was read and is freed afterward. Elements outside the
+        records are freed as soon as their end tag was read.
+
+        Args:
+            source (IO[bytes]): The binary stream of the XML file.
+            parser_backend (ElementTreeBackend | LXMLBackend): The XML parser backend.
+            record_path (RecordPath | None): The path of the record elements or None for the direct children of
+                the root.
+
+        Yields:
+            ET.Element: The next completely parsed record element.
+        """
+        if record_path is None:
+            yield from cls.__iter_root_children(source, parser_backend)
+            return
+
+        # The open elements outside the records and their tags, from the root to the current record
+        elements: list = list()
+        tags: list = list()
+        # The depth inside the current record or 0 outside the records
+        nested: int = 0
+        for event, element in parser_backend.iterparse(source, ("start", "end")):
+            if event == "start":
+                if nested:
+                    nested += 1
+                    continue
+                elements.append(element)
+                tags.append(element.tag)
+                if record_path.matches(tags):
+                    nested = 1
+                continue
+
+            if nested:
+                nested -= 1
+                if nested:
+                    continue
+                # A record is complete
+                yield element
+            # Free the processed record or the skipped element and drop it from its parent
+            elements.pop()
+            tags.pop()
+            element.clear()
+            if elements:
+                elements[-1].clear()
+
+    @classmethod
+    def __iter_root_children(cls, source: IO[bytes],
+                             parser_backend: xml_backend.ElementTreeBackend | xml_backend.LXMLBackend
+                             ) -> Iterator[ET.Element]:
+        """
+        Stream the direct children of the root element of an XML file, the default records.
+        Each record is yielded as soon as its end tag was read and is freed afterward.
+
+        Args:
+            source (IO[bytes]): The binary stream of the XML file.
+            parser_backend (ElementTreeBackend | LXMLBackend): The XML parser backend.
+
+        Yields:
+            ET.Element: The next completely parsed record element.
+        """
+        root: ET.Element | None = None
+        depth: int = 0
+        for event, element in parser_backend.iterparse(source, ("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                # A direct child of the root is complete
+                yield element
+                # Free the processed record and drop it from the root
+                element.clear()
+                root.clear()
+
+    @classmethod
+    def __find_records(cls, element: ET.Element, tags: list, record_path: RecordPath) -> Iterator[ET.Element]:
+        """
+        Recursively find the record elements in a parsed document tree.
+
+        Args:
+            element (ET.Element): The element to search in, starting with the root.
+            tags (list): The tags of the ancestors of the element.
+            record_path (RecordPath): The path of the record elements.
+
+        Yields:
+            ET.Element: The next record element in document order.
+        """
+        tags.append(element.tag)
+        if record_path.matches(tags):
+            yield element
+        elif record_path.max_depth is None or len(tags) < record_path.max_depth:
+            for child in element:
+                yield from cls.__find_records(child, tags, record_path)
+        tags.pop()
+
+    @classmethod
+    def __scan_columns(cls, element: ET.Element, record: int, counts: dict, last_records: dict):
+        """
+        Recursively collect the columns of an XML element without keeping the values.
+
+        Args:
+            element (ET.Element): The XML element to collect the columns of.
+            record (int): The index of the record the element belongs to.
+            counts (dict): Maps the columns to the number of records with a value.
+            last_records (dict): Maps the columns to the last record with a value.
+        """
+        for child in element:
+            if len(child) == 0:
+                # Only nodes without child elements will be part of the columns
+                if child.tag not in counts:
+                    counts[child.tag] = 0
+                if child.text is not None and last_records.get(child.tag) != record:
+                    counts[child.tag] += 1
+                    last_records[child.tag] = record
+            else:
+                cls.__scan_columns(child, record, counts, last_records)
+
+    @classmethod
+    def __extract_columns_and_data(cls, element: ET.Element, accumulator: ColumnAccumulator,
+                                   selection: frozenset | None = None, record_values: dict | None = None):
         """
         Recursively extract columns and data from an XML element.
 
         Args:
             element (ET.Element): The XML element to extract data from.
-            row_data (dict): The dictionary to store the row data.
-            columns (list): The list to store the column names.
+            accumulator (ColumnAccumulator): The accumulator collecting the values of the current row.
+            selection (frozenset | None): The columns to extract or None for every column.
+            record_values (dict | None): Collects the values of all columns for a filter, also of columns that
+                are not selected.
         """
         for child in element:
             # Iterate as long as a node has children
-            if not list(child):
+            if len(child) == 0:
                 # Only nodes without child elements will be part of the columns
-                col_name: str = child.tag
-                if col_name not in columns:
-                    columns.append(col_name)
-                row_data[col_name] = child.text
+                if selection is None or child.tag in selection:
+                    accumulator.set_value(child.tag, child.text)
+                if record_values is not None:
+                    record_values[child.tag] = child.text
             else:
                 # If the node contains children, extract them until no child elements are found
-                cls.__extract_columns_and_data(child, row_data, columns)
+                cls.__extract_columns_and_data(child, accumulator, selection, record_values)
+
+    @classmethod
+    def __end_record(cls, accumulator: ColumnAccumulator, record_filter: RecordFilter | None,
+                     record_values: dict | None):
+        """
+        Finish the row of a record or discard it if it doesn't match the filter.
+
+        Args:
+            accumulator (ColumnAccumulator): The accumulator collecting the values of the current row.
+            record_filter (RecordFilter | None): The filter of the records.
+            record_values (dict | None): The values of the record, which are cleared for the next record.
+        """
+        if record_filter is None:
+            accumulator.end_row()
+            return
+        if record_filter.matches(record_values.get):
+            accumulator.end_row()
+        else:
+            accumulator.discard_row()
+        record_values.clear()
 
     @classmethod
     def add_listener(cls, listener: Callable):
@@ -91,3 +640,135 @@ class XMLParser:
             listener (Callable): The listener function to be added.
         """
         cls.__listeners.append(listener)
+
+    @classmethod
+    def add_append_listener(cls, listener: Callable):
+        """
+        Add a listener that will be notified when rows were appended to the dataframe by an incremental parse.
+        It gets the appended rows, the dataframe attribute contains all rows.
+
+        Args:
+            listener (Callable): The listener function to be added.
+        """
+        cls.__append_listeners.append(listener)
+
+    @classmethod
+    def add_schema_listener(cls, listener: Callable):
+        """
+        Add a listener that will be notified when the schema is updated.
+
+        Args:
+            listener (Callable): The listener function to be added.
+        """
+        cls.__schema_listeners.append(listener)
+
+
+def _open_source(file_path: str | IO[bytes]) -> IO[bytes]:
+    """
+    Open an XML file for binary reading. Compressed files are decompressed while they are read and large files
+    are memory-mapped, see xml_input.open_xml. Streams are used as they are and stay open.
+
+    Args:
+        file_path (str | IO[bytes]): The path to the XML file or a binary stream of it.
+
+    Returns:
+        IO[bytes]: A context manager of the binary stream.
+
+    Raises:
+        OSError: If the file can't be read.
+        ValueError: If a ZIP archive doesn't contain exactly one XML file.
+    """
+    if isinstance(file_path, str):
+        return xml_input.open_xml(file_path)
+    return nullcontext(file_path)
+
+
+def _find_append_position(file_path: str) -> tuple | None:
+    """
+    Find the positions between which records can be appended to an XML file.
+
+    Args:
+        file_path (str): The path to the XML file.
+
+    Returns:
+        tuple | None: The end of the start tag and the start of the end tag of the root element and the size of
+            the file or None if they can't be found, e.g. because of comments after the root or an encoding other
+            than UTF-8 and ASCII.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            head: bytes = file.read(_ROOT_SEARCH_SIZE)
+            size: int = os.fstat(file.fileno()).st_size
+            tail_start: int = max(0, size - _ROOT_SEARCH_SIZE)
+            file.seek(tail_start)
+            tail: bytes = file.read()
+    except OSError:
+        return None
+    start = _ROOT_START.match(head)
+    end = _ROOT_END.search(tail)
+    if start is None or end is None or start.group("tag") != end.group("tag") \
+            or tail_start + end.start() < start.end():
+        return None
+    return start.end(), tail_start + end.start(), size
+
+
+def _append_state(file_path: str | IO[bytes], options: dict) -> dict | None:
+    """
+    Remember the end of the records of an XML file before it is parsed, so appended records can be parsed
+    incrementally. The number of rows is added after parsing.
+
+    Args:
+        file_path (str | IO[bytes]): The path to the XML file or a binary stream of it.
+        options (dict): The parse options.
+
+    Returns:
+        dict | None: The path, the options, the size and modification time of the file, the bytes up to the end
+            of the start tag of the root and the end of the records with the bytes before it. None for streams,
+            files whose root can't be found and record paths, which don't select the children of the root.
+    """
+    if not isinstance(file_path, str) or options.get("record_path") is not None:
+        return None
+    position: tuple | None = _find_append_position(file_path)
+    if position is None:
+        return None
+    prefix_end, end, size = position
+    with open(file_path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        prefix: bytes = file.read(prefix_end)
+        tail_start: int = max(prefix_end, end - APPEND_CHECK_SIZE)
+        file.seek(tail_start)
+        tail: bytes = file.read(end - tail_start)
+    if stat.st_size != size:
+        # If the file was changed while the positions were searched
+        return None
+    return {"path": file_path, "options": option_key(options), "size": stat.st_size, "mtime": stat.st_mtime_ns,
+            "prefix": prefix, "end": end, "tail": tail}
+
+
+def _file_changed(file_path: str, state: dict) -> bool:
+    """
+    Args:
+        file_path (str): The path to the XML file.
+        state (dict): The state of the file taken before parsing it, see _append_state.
+
+    Returns:
+        bool: True if the size or the modification time of the file differ from the state or it can't be read.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return True
+    return stat.st_size != state["size"] or stat.st_mtime_ns != state["mtime"]
+
+
+def _position(source: IO[bytes]) -> int:
+    """
+    Get the number of bytes read from a stream.
+
+    Args:
+        source (IO[bytes]): The binary stream.
+
+    Returns:
+        int: The current position or 0 if the stream doesn't support it.
+    """
+    return source.tell() if source.seekable() else 0
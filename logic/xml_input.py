@@ -0,0 +1,348 @@
+"""
+Contains the input adapters, which open XML files for the parser without extracting them to disk.
+
+Compressed files are detected by their content, not their extension, and decompressed while they are read:
+gzip (.xml.gz), bzip2 (.xml.bz2), xz (.xml.xz) and ZIP archives (.zip) containing a single XML file.
+Large uncompressed files are memory-mapped, so reading them doesn't copy every block through a file buffer.
+"""
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import os
+import zipfile
+import zlib
+from typing import IO
+
+# Uncompressed files of at least this size are memory-mapped
+MEMORY_MAP_SIZE: int = 64 * 1024 * 1024
+
+# The compression formats by their magic bytes
+GZIP: str = "gzip"
+BZIP2: str = "bzip2"
+XZ: str = "xz"
+ZIP: str = "zip"
+_MAGIC_BYTES: dict = {b"\x1f\x8b": GZIP, b"BZh": BZIP2, b"\xfd7zXZ\x00": XZ, b"PK\x03\x04": ZIP}
+# The extensions of compressed files, which are removed from the file name next to the XML extension
+compressed_extensions: list = [".gz", ".bz2", ".xz", ".zip"]
+# Errors of truncated or damaged compressed files, which are no OSError
+_DECOMPRESSION_ERRORS: tuple = (EOFError, lzma.LZMAError, zlib.error, zipfile.BadZipFile)
+
+
+class MappedReader(io.RawIOBase):
+    """
+    Readable stream of a memory-mapped file. The pages are read by the operating system on access.
+    """
+
+    __file: io.BufferedReader
+    __data: mmap.mmap
+    __position: int
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the MappedReader.
+
+        Args:
+            file_path (str): The path of the file, which must not be empty.
+
+        Raises:
+            OSError: If the file can't be opened.
+            ValueError: If the file is empty.
+        """
+        super().__init__()
+        self.__file = open(file_path, "rb")
+        try:
+            self.__data = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.__file.close()
+            raise
+        self.__position = 0
+
+    def readable(self) -> bool:
+        """
+        Returns:
+            bool: Always True, the stream is readable.
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """
+        Returns:
+            bool: Always True, the stream is seekable.
+        """
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next bytes with a single copy from the mapped pages.
+
+        Args:
+            size (int): The maximum number of bytes. Negative to read until the end.
+
+        Returns:
+            bytes: The read bytes. Empty at the end of the stream.
+        """
+        end: int = len(self.__data) if size is None or size < 0 else min(self.__position + size, len(self.__data))
+        data: bytes = self.__data[self.__position:end]
+        self.__position = max(self.__position, end)
+        return data
+
+    def readinto(self, buffer) -> int:
+        """
+        Read the next bytes into the buffer.
+
+        Args:
+            buffer: The writable buffer.
+
+        Returns:
+            int: The number of read bytes. Zero at the end of the stream.
+        """
+        data: bytes = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """
+        Change the position of the stream.
+
+        Args:
+            offset (int): The offset relative to whence.
+            whence (int): The start, current position or end of the stream.
+
+        Returns:
+            int: The new position.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self.__position
+        elif whence == os.SEEK_END:
+            offset += len(self.__data)
+        self.__position = max(0, offset)
+        return self.__position
+
+    def tell(self) -> int:
+        """
+        Returns:
+            int: The current position.
+        """
+        return self.__position
+
+    def close(self):
+        """
+        Close the stream, the mapping and the underlying file.
+        """
+        if not self.closed:
+            self.__data.close()
+            self.__file.close()
+        super().close()
+
+
+class DecompressedReader(io.RawIOBase):
+    """
+    Readable stream of a decompressed file, which raises an OSError for truncated or damaged content.
+    The decompressors raise EOFError, lzma.LZMAError or zlib.error instead, which the callers don't expect from
+    reading a file.
+    """
+
+    __stream: IO[bytes]
+    __name: str
+
+    def __init__(self, stream: IO[bytes], name: str):
+        """
+        Initialize the DecompressedReader.
+
+        Args:
+            stream (IO[bytes]): The decompressing stream, which is closed with the reader.
+            name (str): The name of the file used in error messages.
+        """
+        super().__init__()
+        self.__stream = stream
+        self.__name = name
+
+    def readable(self) -> bool:
+        """
+        Returns:
+            bool: Always True, the stream is readable.
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """
+        Returns:
+            bool: True if the decompressing stream is seekable.
+        """
+        return self.__stream.seekable()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next decompressed bytes.
+
+        Args:
+            size (int): The maximum number of bytes. Negative to read until the end.
+
+        Returns:
+            bytes: The read bytes. Empty at the end of the stream.
+
+        Raises:
+            OSError: If the file can't be read or is truncated or damaged.
+        """
+        try:
+            return self.__stream.read(size)
+        except _DECOMPRESSION_ERRORS as e:
+            raise OSError(f"{self.__name} is truncated or damaged: {e}") from e
+
+    def readinto(self, buffer) -> int:
+        """
+        Read the next decompressed bytes into the buffer.
+
+        Args:
+            buffer: The writable buffer.
+
+        Returns:
+            int: The number of read bytes. Zero at the end of the stream.
+
+        Raises:
+            OSError: If the file can't be read or is truncated or damaged.
+        """
+        data: bytes = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """
+        Change the position of the stream, which decompresses the content up to the position.
+
+        Args:
+            offset (int): The offset relative to whence.
+            whence (int): The start, current position or end of the stream.
+
+        Returns:
+            int: The new position.
+
+        Raises:
+            OSError: If the file can't be read or is truncated or damaged.
+        """
+        try:
+            return self.__stream.seek(offset, whence)
+        except _DECOMPRESSION_ERRORS as e:
+            raise OSError(f"{self.__name} is truncated or damaged: {e}") from e
+
+    def tell(self) -> int:
+        """
+        Returns:
+            int: The number of decompressed bytes read.
+        """
+        return self.__stream.tell()
+
+    def close(self):
+        """
+        Close the stream and the decompressing stream.
+        """
+        if not self.closed:
+            self.__stream.close()
+        super().close()
+
+
+def detect_compression(file_path: str) -> str | None:
+    """
+    Detect the compression of a file by its magic bytes.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        str | None: The compression format, like 'gzip', or None for uncompressed files.
+
+    Raises:
+        OSError: If the file can't be read.
+    """
+    with open(file_path, "rb") as file:
+        head: bytes = file.read(6)
+    for magic, compression in _MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_xml(file_path: str | IO[bytes], memory_map: bool | None = None) -> IO[bytes]:
+    """
+    Open an XML file for binary reading, decompressing it while it is read.
+
+    Args:
+        file_path (str | IO[bytes]): The path of the XML file, which can be compressed, or a binary stream, which
+            is returned as it is.
+        memory_map (bool | None): Memory-map an uncompressed file. Defaults to files of at least MEMORY_MAP_SIZE.
+
+    Returns:
+        IO[bytes]: The binary stream of the XML content. The position of compressed files is the number of
+            decompressed bytes. Reading a truncated or damaged compressed file raises an OSError.
+
+    Raises:
+        OSError: If the file can't be read or is no valid archive.
+        ValueError: If a ZIP archive doesn't contain exactly one XML file.
+    """
+    if not isinstance(file_path, str):
+        return file_path
+
+    compression: str | None = detect_compression(file_path)
+    if compression == GZIP:
+        return DecompressedReader(gzip.open(file_path, "rb"), file_path)
+    if compression == BZIP2:
+        return DecompressedReader(bz2.open(file_path, "rb"), file_path)
+    if compression == XZ:
+        return DecompressedReader(lzma.open(file_path, "rb"), file_path)
+    if compression == ZIP:
+        return DecompressedReader(_open_zip_member(file_path), file_path)
+
+    if memory_map is None:
+        memory_map = os.path.getsize(file_path) >= MEMORY_MAP_SIZE
+    if memory_map and os.path.getsize(file_path) > 0:
+        return MappedReader(file_path)
+    return open(file_path, "rb")
+
+
+def strip_extensions(file_name: str) -> str:
+    """
+    Remove the compression extension and the extension of the XML file from a file name.
+
+    Args:
+        file_name (str): The file name, like 'items.xml.gz'.
+
+    Returns:
+        str: The file name without extensions, like 'items'.
+    """
+    name, extension = os.path.splitext(file_name)
+    if extension.lower() in compressed_extensions and os.path.splitext(name)[1]:
+        name = os.path.splitext(name)[0]
+    return name
+
+
+def _open_zip_member(file_path: str) -> IO[bytes]:
+    """
+    Open the XML file of a ZIP archive. It is decompressed while it is read.
+
+    Args:
+        file_path (str): The path of the ZIP archive.
+
+    Returns:
+        IO[bytes]: The binary stream of the XML file. Closing it closes the file of the archive.
+
+    Raises:
+        OSError: If the archive can't be read.
+        ValueError: If the archive doesn't contain exactly one XML file.
+    """
+    try:
+        archive = zipfile.ZipFile(file_path)
+    except zipfile.BadZipFile as e:
+        raise OSError(f"{file_path} is no valid ZIP archive: {e}") from e
+    members: list = [info for info in archive.infolist() if not info.is_dir()]
+    xml_members: list = [info for info in members if info.filename.lower().endswith(".xml")]
+    if len(xml_members) != 1 and len(members) == 1:
+        # A single file is used independent of its extension
+        xml_members = members
+    if len(xml_members) != 1:
+        archive.close()
+        raise ValueError(f"{file_path} has to contain exactly one XML file, but contains {len(xml_members)}")
+    # The file of the archive stays open until the member is closed
+    with archive:
+        return archive.open(xml_members[0])
@@ -1,5 +1,11 @@
-from gui.gui import MainGUI
+import sys
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        # Convert headless if arguments are given, without loading the GUI
+        from logic.cli import main
+        sys.exit(main())
+
+    from gui.gui import MainGUI
     gui = MainGUI()
-    gui.mainloop()
\ No newline at end of file
+    gui.mainloop()
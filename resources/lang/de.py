@@ -6,22 +6,40 @@ translations: dict = {
     "title": "XML to Excel Parser",
     "greeting": "Willkommen bei dem XML-Parser. Bitte wählen Sie eine XML-Datei aus!",
     "preview": "Spalten Vorschau:",
+    "preview.rows": "Zeilen {} bis {} von {:,}",
+    "preview.columns.search": "Suche:",
+    "preview.columns.regex": "Regex",
+    "preview.columns.all": "Alle",
+    "preview.columns.none": "Keine",
+    "preview.columns.count": "{:,} von {:,} ausgewählt",
     "file.select.button": "Datei auswählen",
     "file.select.none": "Klicken Sie links auf den Button um eine XML Datei auszuwählen",
     "file.select.xml": "XML-Datei",
+    "file.select.compressed": "Komprimierte XML-Datei",
     "file.select.title": "XML-Datei öffnen",
     "file.select.success": "XML-Datei '{}' geladen",
     "file.select.error": "Ein Fehler ist beim laden der XML-Datei '{}' aufgetreten",
     "file.select.error.syntax": "Ein Fehler ist aufgetreten. XML-Datei '{}' weißt Syntaxfehler auf.",
+    "file.select.loading": "XML-Datei '{}' wird geladen ...",
+    "file.select.canceled": "Das Laden der XML-Datei '{}' wurde abgebrochen",
+    "file.cancel.button": "Abbrechen",
+    "file.refresh.button": "Aktualisieren",
+    "file.progress": "{:.1f} MB gelesen, {} Datensätze verarbeitet",
     "file.output.button": "Als Excel-Tabelle exportieren",
     "file.output.none": "Klicken Sie links auf den Button um die XML-Daten in eine Excel-Datei zu speichern",
     "file.output.prettier": "Spaltenbreite an Inhalt anpassen",
     "file.output.xlsx": "Excel-Datei",
+    "file.output.csv": "CSV-Datei",
+    "file.output.parquet": "Parquet-Datei",
+    "file.output.feather": "Feather-Datei (Arrow IPC)",
     "file.output.title": "Excel-Datei speichern",
     "file.output.error.io": "Ein Fehler ist aufgetreten. Die Datei '{}' kann nicht gespeichert werden",
     "file.output.error.open": "Ein Fehler ist aufgetreten. Die Datei '{}' ist bereits in einer anderen App geöffnet",
+    "file.output.progress": "{:,} von {:,} Zeilen exportiert",
+    "file.output.canceled": "Der Export nach '{}' wurde abgebrochen",
     "file.output.success": "XML-Daten erfolgreich exportiert. '{}'",
     "log.title": "Logs:",
+    "log.dropped": "... {:,} Log-Einträge übersprungen, gespeicherte Logs enthalten alle Einträge",
     "log.save": "Logs speichern",
     "log.save.file": "Text-Datei",
     "log.save.title": "Log-Datei speichern"
@@ -6,22 +6,40 @@ translations: dict = {
     "title": "XML to Excel Parser",
     "greeting": "Welcome to the XML Parser. Please select an XML file!",
     "preview": "Column Preview:",
+    "preview.rows": "Rows {} to {} of {:,}",
+    "preview.columns.search": "Search:",
+    "preview.columns.regex": "Regex",
+    "preview.columns.all": "All",
+    "preview.columns.none": "None",
+    "preview.columns.count": "{:,} of {:,} selected",
     "file.select.button": "Select File",
     "file.select.none": "Click the button on the left to select an XML file",
     "file.select.xml": "XML File",
+    "file.select.compressed": "Compressed XML File",
     "file.select.title": "Open XML File",
     "file.select.success": "XML file '{}' loaded",
     "file.select.error": "An error occurred while loading the XML file '{}'",
     "file.select.error.syntax": "An error occurred. XML file '{}' contains syntax errors.",
+    "file.select.loading": "Loading XML file '{}' ...",
+    "file.select.canceled": "Loading the XML file '{}' was canceled",
+    "file.cancel.button": "Cancel",
+    "file.refresh.button": "Refresh",
+    "file.progress": "{:.1f} MB read, {} records parsed",
     "file.output.button": "Export as Excel Table",
     "file.output.none": "Click the button on the left save the XML data to an Excel file",
     "file.output.prettier": "Adjust column width to content",
     "file.output.xlsx": "Excel File",
+    "file.output.csv": "CSV File",
+    "file.output.parquet": "Parquet File",
+    "file.output.feather": "Feather File (Arrow IPC)",
     "file.output.title": "Save Excel File",
     "file.output.error.io": "An error occurred. Can't save file '{}'",
     "file.output.error.open": "An error occurred. The file '{}' is already opened by another app",
+    "file.output.progress": "{:,} of {:,} rows exported",
+    "file.output.canceled": "Exporting to '{}' was canceled",
     "file.output.success": "XML file successfully exported. '{}'",
     "log.title": "Logs:",
+    "log.dropped": "... {:,} log entries skipped, saved logs contain every entry",
     "log.save": "Save Logs",
     "log.save.file": "Text File",
     "log.save.title": "Save Log File"
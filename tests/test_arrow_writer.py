@@ -0,0 +1,75 @@
+import unittest
+import os
+import numpy as np
+import pandas as pd
+import logic.arrow_writer as arrow_writer
+
+
+@unittest.skipUnless(arrow_writer.pyarrow_available, "pyarrow is not installed")
+class TestArrowWriter(unittest.TestCase):
+    """
+    Test suite for the streaming Parquet and Feather writer.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        cls.output_files = {arrow_writer.PARQUET: "arrow_writer_test.parquet",
+                            arrow_writer.FEATHER: "arrow_writer_test.feather"}
+
+    def tearDown(self):
+        """
+        Clean up the output files after each test.
+        """
+        for output_file in self.output_files.values():
+            if os.path.exists(output_file):
+                os.remove(output_file)
+
+    def test_write_chunks(self):
+        """
+        Test writing chunks with columns found in later chunks and columns without values.
+        """
+        chunks = [pd.DataFrame({'name': ['Item1', 'Item2'], 'value': [np.nan, np.nan]}),
+                  pd.DataFrame({'name': ['Item3'], 'value': ['30'], 'count': [3]}),
+                  pd.DataFrame({'name': ['Item4'], 'value': ['40'], 'count': [4.5]})]
+        for file_format, output_file in self.output_files.items():
+            with self.subTest(file_format=file_format):
+                self.assertEqual(4, arrow_writer.write_arrow(iter(chunks), output_file, file_format))
+
+                dataframe = pd.read_parquet(output_file) if file_format == arrow_writer.PARQUET \
+                    else pd.read_feather(output_file)
+                self.assertEqual(['name', 'value', 'count'], list(dataframe.columns))
+                self.assertEqual(['Item1', 'Item2', 'Item3', 'Item4'], list(dataframe['name']))
+                self.assertEqual(['30', '40'], list(dataframe['value'].dropna()))
+                self.assertEqual([3.0, 4.5], list(dataframe['count'].dropna()))
+
+    def test_write_categorical_chunks(self):
+        """
+        Test writing categorical chunks with different categories.
+        """
+        chunks = [pd.DataFrame({'state': pd.Categorical(['NEW', 'NEW'])}),
+                  pd.DataFrame({'state': pd.Categorical(['DONE', np.nan])})]
+        for file_format, output_file in self.output_files.items():
+            with self.subTest(file_format=file_format):
+                self.assertEqual(4, arrow_writer.write_arrow(iter(chunks), output_file, file_format))
+
+                dataframe = pd.read_parquet(output_file) if file_format == arrow_writer.PARQUET \
+                    else pd.read_feather(output_file)
+                self.assertEqual(['NEW', 'NEW', 'DONE'], dataframe['state'].astype(object).tolist()[:3])
+                self.assertTrue(pd.isna(dataframe['state'][3]))
+
+        arrow_writer.write_arrow(chunks[:1], self.output_files[arrow_writer.FEATHER], arrow_writer.FEATHER)
+        self.assertEqual('category', str(pd.read_feather(self.output_files[arrow_writer.FEATHER])['state'].dtype))
+
+    def test_write_unknown_format(self):
+        """
+        Test writing a format that is not supported.
+        """
+        with self.assertRaises(ValueError):
+            arrow_writer.write_arrow([], "arrow_writer_test.txt", "txt")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+import os
+import shutil
+import pandas as pd
+import logic.batch_conversion as batch_conversion
+
+
+class TestBatchConversion(unittest.TestCase):
+    """
+    Test suite for the parallel batch conversion.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        cls.input_directory = "batch_test_input"
+        cls.output_directory = "batch_test_output"
+        cls.output_file = "batch_test.xlsx"
+        os.makedirs(cls.input_directory, exist_ok=True)
+
+        cls.xml_files = list()
+        for i in range(1, 3):
+            xml_file = os.path.join(cls.input_directory, f"items{i}.xml")
+            with open(xml_file, 'w') as file:
+                file.write(f"""<?xml version="1.0"?>
+                <root>
+                    <item>
+                        <name>Item{i}</name>
+                        <value>{i}0</value>
+                    </item>
+                </root>""")
+            cls.xml_files.append(xml_file)
+
+        #  Create XML with a syntax error
+        cls.xml_file_syntax = os.path.join(cls.input_directory, "syntax.xml")
+        with open(cls.xml_file_syntax, 'w') as file:
+            file.write("Syntax Error")
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the test environment.
+        """
+        shutil.rmtree(cls.input_directory, ignore_errors=True)
+
+    def tearDown(self):
+        """
+        Clean up the output after each test.
+        """
+        shutil.rmtree(self.output_directory, ignore_errors=True)
+        if os.path.exists(self.output_file):
+            os.remove(self.output_file)
+
+    def test_expand_paths(self):
+        """
+        Test expanding a glob pattern to the sorted matching files.
+        """
+        paths = batch_conversion.expand_paths(os.path.join(self.input_directory, "items*.xml"))
+        self.assertEqual(self.xml_files, paths)
+
+    def test_convert_to_sheets(self):
+        """
+        Test converting multiple XML files to sheets of one workbook.
+        """
+        results = batch_conversion.convert_files(self.xml_files + [self.xml_file_syntax], self.output_file,
+                                                 prettier=False, workers=2)
+
+        self.assertEqual(3, len(results))
+        self.assertEqual(["items1", "items2", None], [result.sheet_name for result in results])
+        self.assertIsNone(results[0].error)
+        self.assertIsNotNone(results[2].error)
+
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual(["items1", "items2"], list(sheets))
+        self.assertEqual({'name': ['Item2'], 'value': ['20']}, sheets["items2"].to_dict(orient='list'))
+
+    def test_convert_to_files(self):
+        """
+        Test converting multiple XML files to separate workbooks.
+        """
+        results = batch_conversion.convert_files(os.path.join(self.input_directory, "items*.xml"),
+                                                 self.output_directory, separate_files=True, prettier=False,
+                                                 workers=2)
+
+        self.assertEqual(2, len(results))
+        for i, result in enumerate(results, 1):
+            self.assertIsNone(result.error)
+            self.assertEqual(1, result.rows)
+            self.assertEqual(os.path.join(self.output_directory, f"items{i}.xlsx"), result.output_path)
+            sheet = pd.read_excel(result.output_path, sheet_name=f"items{i}", dtype=str)
+            self.assertEqual({'name': [f'Item{i}'], 'value': [f'{i}0']}, sheet.to_dict(orient='list'))
+
+    def test_invalid_sheet_name(self):
+        """
+        Test that a file name that is no valid sheet name fails only the conversion of this file.
+        """
+        invalid_file = os.path.join(self.input_directory, "data[1].xml")
+        shutil.copyfile(self.xml_files[0], invalid_file)
+        for separate_files, output_path in ((False, self.output_file), (True, self.output_directory)):
+            with self.subTest(separate_files=separate_files):
+                results = batch_conversion.convert_files([invalid_file] + self.xml_files, output_path,
+                                                         separate_files=separate_files, prettier=False, workers=2)
+                self.assertEqual(3, len(results))
+                self.assertIn("sheet name", results[0].error)
+                self.assertEqual([None, None], [result.error for result in results[1:]])
+        os.remove(invalid_file)
+
+    def test_duplicate_file_names(self):
+        """
+        Test that files with the same name in different directories are written to separate workbooks.
+        """
+        xml_files: list = list()
+        for i, directory in enumerate(("a", "b", "c"), 1):
+            os.makedirs(os.path.join(self.input_directory, directory), exist_ok=True)
+            xml_file = os.path.join(self.input_directory, directory, "dup.xml")
+            shutil.copyfile(self.xml_files[i % 2], xml_file)
+            xml_files.append(xml_file)
+
+        results = batch_conversion.convert_files(xml_files, self.output_directory, separate_files=True,
+                                                 prettier=False, workers=3)
+        self.assertEqual([None, None, None], [result.error for result in results])
+        expected_paths = [os.path.join(self.output_directory, name)
+                          for name in ("dup.xlsx", "dup_1.xlsx", "dup_2.xlsx")]
+        self.assertEqual(expected_paths, [result.output_path for result in results])
+        for i, result in enumerate(results, 1):
+            sheet = pd.read_excel(result.output_path, sheet_name="dup", dtype=str)
+            self.assertEqual([f'Item{i % 2 + 1}'], sheet['name'].tolist())
+
+    def test_more_files_than_in_flight(self):
+        """
+        Test that a batch larger than the files in flight is converted completely and in order.
+        """
+        xml_files: list = list()
+        for i in range(0, 5):
+            xml_file = os.path.join(self.input_directory, f"window{i}.xml")
+            shutil.copyfile(self.xml_files[i % 2], xml_file)
+            xml_files.append(xml_file)
+
+        results = batch_conversion.convert_files(xml_files, self.output_file, prettier=False, workers=1)
+        self.assertEqual([f"window{i}" for i in range(0, 5)], [result.sheet_name for result in results])
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual([f"window{i}" for i in range(0, 5)], list(sheets))
+        self.assertEqual(['Item2'], sheets["window3"]['name'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
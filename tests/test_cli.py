@@ -0,0 +1,170 @@
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import openpyxl
+import pandas as pd
+import logic.cli as cli
+
+
+class TestCLI(unittest.TestCase):
+    """
+    Test suite for the command line interface.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        cls.input_directory = "cli_test_input"
+        cls.output_file = "cli_test.xlsx"
+        os.makedirs(cls.input_directory, exist_ok=True)
+
+        cls.xml_files = list()
+        for i in range(1, 3):
+            xml_file = os.path.join(cls.input_directory, f"items{i}.xml")
+            with open(xml_file, 'w') as file:
+                file.write(f"""<?xml version="1.0"?>
+                <root>
+                    <item>
+                        <name>Item{i}</name>
+                        <value>{i}0</value>
+                        <unit>kg</unit>
+                    </item>
+                </root>""")
+            cls.xml_files.append(xml_file)
+
+        #  Create XML with a syntax error
+        cls.xml_file_syntax = os.path.join(cls.input_directory, "syntax.xml")
+        with open(cls.xml_file_syntax, 'w') as file:
+            file.write("Syntax Error")
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the test environment.
+        """
+        shutil.rmtree(cls.input_directory, ignore_errors=True)
+
+    def tearDown(self):
+        """
+        Clean up the output file after each test.
+        """
+        if os.path.exists(self.output_file):
+            os.remove(self.output_file)
+
+    def test_parse_columns(self):
+        """
+        Test splitting the column arguments.
+        """
+        self.assertIsNone(cli.parse_columns(None))
+        self.assertEqual(["name", "value", "unit"], cli.parse_columns(["name, value", "unit,name"]))
+
+    def test_convert_files(self):
+        """
+        Test converting multiple XML files with selected columns and a sheet name pattern.
+        """
+        exit_code = cli.main([os.path.join(self.input_directory, "items*.xml"), "-o", self.output_file,
+                              "-c", "value,name", "-s", "data_{name}", "--no-prettier", "-q"])
+
+        self.assertEqual(cli.EXIT_SUCCESS, exit_code)
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual(["data_items1", "data_items2"], list(sheets))
+        self.assertEqual({'value': ['20'], 'name': ['Item2']}, sheets["data_items2"].to_dict(orient='list'))
+
+    def test_convert_csv(self):
+        """
+        Test converting an XML file to the format of the output extension.
+        """
+        csv_file = "cli_test.csv"
+        try:
+            self.assertEqual(cli.EXIT_SUCCESS, cli.main([self.xml_files[0], "-o", csv_file, "-c", "name", "-q"]))
+            self.assertEqual({'name': ['Item1']}, pd.read_csv(csv_file, dtype=str).to_dict(orient='list'))
+        finally:
+            if os.path.exists(csv_file):
+                os.remove(csv_file)
+
+    def test_convert_types(self):
+        """
+        Test exporting numbers as numeric cells unless the inference is disabled.
+        """
+        self.assertEqual(cli.EXIT_SUCCESS, cli.main([self.xml_files[0], "-o", self.output_file, "-q"]))
+        self.assertEqual(10, openpyxl.load_workbook(self.output_file)["items1"]["B2"].value)
+        os.remove(self.output_file)
+
+        self.assertEqual(cli.EXIT_SUCCESS, cli.main([self.xml_files[0], "-o", self.output_file, "-q",
+                                                     "--no-infer-types", "--schema", "unit:category"]))
+        self.assertEqual('10', openpyxl.load_workbook(self.output_file)["items1"]["B2"].value)
+
+        self.assertEqual(cli.EXIT_USAGE, cli.main([self.xml_files[0], "-o", self.output_file, "-q",
+                                                   "--schema", "value:decimal"]))
+
+    def test_convert_filter(self):
+        """
+        Test exporting only the records matching a filter.
+        """
+        exit_code = cli.main([os.path.join(self.input_directory, "items*.xml"), "-o", self.output_file, "-q",
+                              "--filter", "value > 15"])
+        self.assertEqual(cli.EXIT_SUCCESS, exit_code)
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual(0, len(sheets["items1"]))
+        self.assertEqual(['Item2'], sheets["items2"]['name'].tolist())
+
+        self.assertEqual(cli.EXIT_USAGE, cli.main([self.xml_files[0], "-o", self.output_file, "-q",
+                                                   "--filter", "value >"]))
+
+    def test_convert_record_path(self):
+        """
+        Test exporting the records of a record path.
+        """
+        exit_code = cli.main([self.xml_files[0], "-o", self.output_file, "-q", "--no-infer-types",
+                              "--record-path", "/root"])
+        self.assertEqual(cli.EXIT_SUCCESS, exit_code)
+        sheet = pd.read_excel(self.output_file, dtype=str)
+        self.assertEqual({'name': ['Item1'], 'value': ['10'], 'unit': ['kg']}, sheet.to_dict(orient='list'))
+
+        self.assertEqual(cli.EXIT_USAGE, cli.main([self.xml_files[0], "-o", self.output_file, "-q",
+                                                   "--record-path", "items//item"]))
+
+    def test_convert_failures(self):
+        """
+        Test the exit code if a file contains syntax errors or lacks a selected column.
+        """
+        exit_code = cli.main([self.xml_file_syntax, self.xml_files[0], "-o", self.output_file, "-q"])
+        self.assertEqual(cli.EXIT_FAILURE, exit_code)
+        self.assertEqual(["items1"], list(pd.read_excel(self.output_file, sheet_name=None)))
+
+        exit_code = cli.main([self.xml_files[0], "-o", self.output_file, "-c", "missing", "-q"])
+        self.assertEqual(cli.EXIT_FAILURE, exit_code)
+
+    def test_invalid_arguments(self):
+        """
+        Test the exit code of missing arguments and unmatched inputs.
+        """
+        with open(os.devnull, 'w') as devnull:
+            stderr = sys.stderr
+            sys.stderr = devnull
+            try:
+                self.assertEqual(cli.EXIT_USAGE, cli.main([self.xml_files[0]]))
+                self.assertEqual(cli.EXIT_USAGE, cli.main([self.xml_files[0], "-o", self.output_file,
+                                                           "--workers", "0"]))
+                self.assertEqual(cli.EXIT_FAILURE, cli.main([os.path.join(self.input_directory, "*.none"),
+                                                             "-o", self.output_file]))
+                self.assertEqual(cli.EXIT_USAGE, cli.main(self.xml_files + ["-o", self.output_file, "-f", "csv"]))
+            finally:
+                sys.stderr = stderr
+        self.assertFalse(os.path.exists(self.output_file))
+
+    def test_no_gui_import(self):
+        """
+        Test the command line interface doesn't load the GUI libraries.
+        """
+        code = "import sys, logic.cli; print('tkinter' in sys.modules or 'PIL.Image' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual("False", output.strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
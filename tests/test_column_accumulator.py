@@ -0,0 +1,152 @@
+import unittest
+import numpy as np
+import logic.column_accumulator as column_accumulator
+from logic.column_accumulator import ColumnAccumulator
+
+
+class TestColumnAccumulator(unittest.TestCase):
+    """
+    Test suite for the ColumnAccumulator class.
+    """
+
+    def setUp(self):
+        """
+        Create a new accumulator before each test.
+        """
+        self.accumulator = ColumnAccumulator()
+
+    def test_dense_rows(self):
+        """
+        Test accumulating rows that contain every column.
+        """
+        for i in range(0, 3):
+            self.accumulator.set_value("name", f"Item{i}")
+            self.accumulator.set_value("value", str(i))
+            self.accumulator.end_row()
+        dataframe = self.accumulator.to_dataframe()
+
+        self.assertEqual(['name', 'value'], list(dataframe.columns))
+        self.assertEqual({'name': ['Item0', 'Item1', 'Item2'], 'value': ['0', '1', '2']},
+                         dataframe.to_dict(orient='list'))
+
+    def test_sparse_rows(self):
+        """
+        Test back-filling columns that are missing in some rows.
+        """
+        self.accumulator.set_value("name", "Item0")
+        self.accumulator.end_row()
+        self.accumulator.set_value("state", "NEW")
+        self.accumulator.end_row()
+        self.accumulator.set_value("name", "Item2")
+        self.accumulator.end_row()
+        dataframe = self.accumulator.to_dataframe()
+
+        self.assertEqual(['name', 'state'], list(dataframe.columns))
+        self.assertEqual({'name': ['Item0', np.nan, 'Item2'], 'state': [np.nan, 'NEW', np.nan]},
+                         dataframe.to_dict(orient='list'))
+
+    def test_repeated_column_in_row(self):
+        """
+        Test the last value wins if a column is set multiple times in one row.
+        """
+        self.accumulator.set_value("name", "First")
+        self.accumulator.set_value("name", "Last")
+        self.accumulator.end_row()
+
+        self.assertEqual({'name': ['Last']}, self.accumulator.to_dataframe().to_dict(orient='list'))
+
+    def test_rows_without_columns(self):
+        """
+        Test accumulating rows without any value.
+        """
+        self.accumulator.end_row()
+        self.accumulator.end_row()
+        dataframe = self.accumulator.to_dataframe()
+
+        self.assertEqual(2, len(dataframe))
+        self.assertEqual(list(), list(dataframe.columns))
+
+    def test_reset(self):
+        """
+        Test resetting the rows keeps the known columns.
+        """
+        self.accumulator.set_value("name", "Item0")
+        self.accumulator.set_value("value", "0")
+        self.accumulator.end_row()
+        self.accumulator.reset()
+        self.accumulator.set_value("value", "1")
+        self.accumulator.end_row()
+        dataframe = self.accumulator.to_dataframe()
+
+        self.assertEqual(['name', 'value'], list(dataframe.columns))
+        self.assertTrue(dataframe['name'].isna().all())
+        self.assertEqual(['1'], dataframe['value'].tolist())
+
+    def test_discard_row(self):
+        """
+        Test discarding the values of the current row.
+        """
+        self.accumulator.set_value("name", "Item0")
+        self.accumulator.end_row()
+        self.accumulator.set_value("name", "Item1")
+        self.accumulator.set_value("state", "NEW")
+        self.accumulator.discard_row()
+        self.accumulator.set_value("name", "Item2")
+        self.accumulator.end_row()
+        dataframe = self.accumulator.to_dataframe()
+
+        self.assertEqual(['name', 'state'], list(dataframe.columns))
+        self.assertEqual(['Item0', 'Item2'], dataframe['name'].tolist())
+        self.assertTrue(dataframe['state'].isna().all())
+
+    def test_categorical(self):
+        """
+        Test accumulating codes of the values and constructing categorical columns.
+        """
+        accumulator = ColumnAccumulator(categorical=True)
+        for state in ["NEW", "DONE", None, "NEW"]:
+            accumulator.set_value("state", state)
+            accumulator.end_row()
+        accumulator.set_value("unit", "kg")
+        accumulator.set_value("unit", "g")
+        accumulator.end_row()
+        dataframe = accumulator.to_dataframe()
+
+        self.assertEqual(['state', 'unit'], list(dataframe.columns))
+        self.assertEqual('category', str(dataframe['state'].dtype))
+        self.assertEqual(['NEW', 'DONE'], list(dataframe['state'].cat.categories))
+        self.assertEqual({'state': ['NEW', 'DONE', np.nan, 'NEW', np.nan], 'unit': [np.nan] * 4 + ['g']},
+                         dataframe.astype(object).to_dict(orient='list'))
+
+        accumulator.reset()
+        accumulator.set_value("unit", "kg")
+        accumulator.end_row()
+        dataframe = accumulator.to_dataframe()
+        self.assertEqual(['kg'], list(dataframe['unit'].cat.categories))
+        self.assertEqual(0, len(dataframe['state'].cat.categories))
+
+    def test_categorical_distinct_values(self):
+        """
+        Test columns with mostly distinct values switch back to storing the values in the categorical mode.
+        """
+        check_interval = column_accumulator.DICTIONARY_CHECK_INTERVAL
+        column_accumulator.DICTIONARY_CHECK_INTERVAL = 2
+        try:
+            accumulator = ColumnAccumulator(categorical=True)
+            for i in range(0, 5):
+                accumulator.set_value("name", f"Item{i}")
+                if i != 3:
+                    accumulator.set_value("state", "NEW")
+                accumulator.end_row()
+            dataframe = accumulator.to_dataframe()
+        finally:
+            column_accumulator.DICTIONARY_CHECK_INTERVAL = check_interval
+
+        self.assertEqual(object, dataframe['name'].dtype)
+        self.assertEqual([f"Item{i}" for i in range(0, 5)], dataframe['name'].tolist())
+        self.assertEqual('category', str(dataframe['state'].dtype))
+        self.assertEqual(['NEW', 'NEW', 'NEW', np.nan, 'NEW'], dataframe['state'].astype(object).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
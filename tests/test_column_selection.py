@@ -0,0 +1,91 @@
+import unittest
+from logic.column_selection import ColumnSelection
+
+
+class TestColumnSelection(unittest.TestCase):
+    """
+    Test suite for the selection of the exported columns.
+    """
+
+    def test_default(self):
+        """
+        Test that every column is selected initially.
+        """
+        selection = ColumnSelection(['id', 'name', 'price'])
+        self.assertEqual(['id', 'name', 'price'], selection.selected_columns())
+        self.assertEqual(3, selection.selected_count())
+        self.assertTrue(selection.is_selected('name'))
+        self.assertFalse(selection.is_selected('unknown'))
+        self.assertEqual([], ColumnSelection().selected_columns())
+
+    def test_toggle(self):
+        """
+        Test toggling single columns.
+        """
+        selection = ColumnSelection(['id', 'name', 'price'])
+        self.assertFalse(selection.toggle('name'))
+        self.assertEqual(['id', 'price'], selection.selected_columns())
+        self.assertTrue(selection.toggle('name'))
+        self.assertEqual(3, selection.selected_count())
+        with self.assertRaises(KeyError):
+            selection.toggle('unknown')
+
+    def test_select(self):
+        """
+        Test selecting and unselecting every column or a part of them.
+        """
+        selection = ColumnSelection(['id', 'name', 'price'])
+        self.assertEqual(3, selection.select(selected=False))
+        self.assertEqual([], selection.selected_columns())
+        self.assertEqual(0, selection.select(selected=False))
+        self.assertEqual(2, selection.select(['price', 'id', 'unknown']))
+        self.assertEqual(['id', 'price'], selection.selected_columns())
+        self.assertEqual(1, selection.select())
+
+    def test_set_columns(self):
+        """
+        Test that replaced columns keep their states and new columns are selected.
+        """
+        selection = ColumnSelection(['id', 'name', 'price'])
+        selection.toggle('name')
+        selection.set_columns(['price', 'name', 'stock'])
+        self.assertEqual(['price', 'name', 'stock'], selection.columns)
+        self.assertEqual(['price', 'stock'], selection.selected_columns())
+        selection.set_columns(None)
+        self.assertEqual([], selection.columns)
+        self.assertEqual(0, selection.selected_count())
+
+    def test_search(self):
+        """
+        Test searching columns by text and by regular expression.
+        """
+        selection = ColumnSelection(['id', 'Name', 'name_de', 'price'])
+        self.assertEqual(['id', 'Name', 'name_de', 'price'], selection.search(''))
+        self.assertEqual(['Name', 'name_de'], selection.search('NAME'))
+        self.assertEqual(['id', 'price'], selection.search('^(id|price)$', regex=True))
+        self.assertEqual([], selection.search('[', regex=False))
+        with self.assertRaises(ValueError):
+            selection.search('[', regex=True)
+
+    def test_listeners(self):
+        """
+        Test that the listeners are notified of changed columns and states only.
+        """
+        selection = ColumnSelection(['id', 'name'])
+        notified: list = list()
+        selection.add_listener(lambda changed: notified.append(changed.selected_columns()))
+        selection.toggle('id')
+        selection.select(['name'])
+        selection.select(selected=False)
+        selection.set_columns(['name', 'price'])
+        self.assertEqual([['name'], [], ['price']], notified)
+
+    def test_many_columns(self):
+        """
+        Test that thousands of columns are selected by search matches.
+        """
+        columns: list = [f'column_{i}' for i in range(5000)]
+        selection = ColumnSelection(columns)
+        selection.select(selected=False)
+        self.assertEqual(500, selection.select(selection.search(r'1$', regex=True)))
+        self.assertEqual(500, selection.selected_count())
@@ -0,0 +1,54 @@
+import unittest
+import os
+import pandas as pd
+from logic.csv_writer import write_csv
+
+
+class TestCSVWriter(unittest.TestCase):
+    """
+    Test suite for the streaming CSV writer.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        cls.output_file = "csv_writer_test.csv"
+
+    def tearDown(self):
+        """
+        Clean up the output file after each test.
+        """
+        if os.path.exists(self.output_file):
+            os.remove(self.output_file)
+
+    def test_write_chunks(self):
+        """
+        Test writing chunks with columns found in later chunks and special characters.
+        """
+        chunks = [pd.DataFrame({'name': ['Item1', 'Item, "2"'], 'value': ['10', None]}),
+                  pd.DataFrame({'name': ['Item3'], 'unit': ['kg']})]
+        self.assertEqual(3, write_csv(iter(chunks), self.output_file))
+
+        dataframe = pd.read_csv(self.output_file, dtype=str)
+        self.assertEqual(['name', 'value', 'unit'], list(dataframe.columns))
+        self.assertEqual(['Item1', 'Item, "2"', 'Item3'], list(dataframe['name']))
+        self.assertEqual(['10'], list(dataframe['value'].dropna()))
+        self.assertEqual(['kg'], list(dataframe['unit'].dropna()))
+
+    def test_write_failure_removes_file(self):
+        """
+        Test no file is left if the chunks can't be written.
+        """
+        def chunks():
+            yield pd.DataFrame({'name': ['Item1']})
+            raise OSError("Read error")
+
+        with self.assertRaises(OSError):
+            write_csv(chunks(), self.output_file)
+        self.assertFalse(os.path.exists(self.output_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
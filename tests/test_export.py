@@ -0,0 +1,208 @@
+import threading
+import unittest
+import os
+import openpyxl
+import pandas as pd
+import logic.export as export
+import logic.xlsx_writer as xlsx_writer
+
+
+class TestExport(unittest.TestCase):
+    """
+    Test suite for the export of DataFrames.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        cls.output_file = "export_test.xlsx"
+        cls.dataframe = pd.DataFrame({'name': ['Item1', 'Item2'], 'value': ['10', '20']})
+
+    def tearDown(self):
+        """
+        Clean up the output file after each test.
+        """
+        if os.path.exists(self.output_file):
+            os.remove(self.output_file)
+
+    def test_default_sheet_name(self):
+        """
+        Test the sheet name is the file name without extension.
+        """
+        self.assertEqual("items", export.default_sheet_name(os.path.join("data", "items.xml")))
+        self.assertEqual("items", export.default_sheet_name(os.path.join("data", "items.xml.gz")))
+
+    def test_find_unused_sheet_name(self):
+        """
+        Test finding the next unused sheet name.
+        """
+        self.assertEqual("items", export.find_unused_sheet_name(["other"], "items"))
+        self.assertEqual("items_2", export.find_unused_sheet_name(["items", "items_1"], "items"))
+        self.assertEqual("items_1", export.find_unused_sheet_name(["Items"], "items"))
+
+    def test_get_export_format(self):
+        """
+        Test the export format is chosen by the file extension.
+        """
+        self.assertEqual(export.CSV, export.get_export_format("items.CSV"))
+        self.assertEqual(export.FEATHER, export.get_export_format("items.arrow"))
+        self.assertEqual(export.XLSX, export.get_export_format("items.txt"))
+        self.assertIn(export.CSV, export.available_export_formats())
+
+    def test_export_csv(self):
+        """
+        Test exporting a DataFrame to a CSV file.
+        """
+        csv_file = "export_test.csv"
+        try:
+            sheet_name = export.export_dataframe(self.dataframe, csv_file, "items")
+            self.assertIsNone(sheet_name)
+            self.assertEqual(self.dataframe.to_dict(orient='list'),
+                             pd.read_csv(csv_file, dtype=str).to_dict(orient='list'))
+            with self.assertRaises(ValueError):
+                export.export_dataframe(self.dataframe, csv_file, "items", export_format="txt")
+        finally:
+            if os.path.exists(csv_file):
+                os.remove(csv_file)
+
+    def test_export_new_workbook(self):
+        """
+        Test exporting a DataFrame to a new workbook.
+        """
+        sheet_name = export.export_dataframe(self.dataframe, self.output_file, "items")
+
+        self.assertEqual("items", sheet_name)
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual(["items"], list(sheets))
+        self.assertEqual(self.dataframe.to_dict(orient='list'), sheets["items"].to_dict(orient='list'))
+
+    def test_export_existing_workbook(self):
+        """
+        Test exporting a DataFrame to an existing workbook with the same sheet name.
+        """
+        export.export_dataframe(self.dataframe, self.output_file, "items", prettier=False)
+        sheet_name = export.export_dataframe(self.dataframe, self.output_file, "items", prettier=False)
+
+        self.assertEqual("items_1", sheet_name)
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual(["items", "items_1"], list(sheets))
+        self.assertEqual(self.dataframe.to_dict(orient='list'), sheets["items_1"].to_dict(orient='list'))
+
+    def test_export_prettier(self):
+        """
+        Test the column widths of a new and an appended sheet are adjusted to the content size.
+        """
+        export.export_dataframe(self.dataframe, self.output_file, "items")
+        export.export_dataframe(self.dataframe, self.output_file, "items")
+
+        workbook = openpyxl.load_workbook(self.output_file)
+        for sheet_name in ["items", "items_1"]:
+            with self.subTest(sheet_name=sheet_name):
+                dimensions = workbook[sheet_name].column_dimensions
+                self.assertEqual([7, 7], [dimensions["A"].width, dimensions["B"].width])
+
+    def test_export_chunks(self):
+        """
+        Test exporting DataFrame chunks as one sheet of a new workbook.
+        """
+        chunks = [self.dataframe, pd.DataFrame({'name': ['Item3'], 'value': ['30']})]
+        sheet_name = export.export_dataframes(iter(chunks), self.output_file, "items", prettier=False)
+
+        self.assertEqual("items", sheet_name)
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual({'name': ['Item1', 'Item2', 'Item3'], 'value': ['10', '20', '30']},
+                         sheets["items"].to_dict(orient='list'))
+
+    def test_export_failure_removes_file(self):
+        """
+        Test a new workbook is removed if the chunks can't be written.
+        """
+        def chunks():
+            yield self.dataframe
+            raise OSError("Read error")
+
+        with self.assertRaises(OSError):
+            export.export_dataframes(chunks(), self.output_file, "items", prettier=False)
+        self.assertFalse(os.path.exists(self.output_file))
+
+    def test_export_progress_and_cancel(self):
+        """
+        Test reporting the written rows and canceling the export before the next chunk.
+        """
+        export_chunk_rows = export.EXPORT_CHUNK_ROWS
+        export.EXPORT_CHUNK_ROWS = 2
+        dataframe = pd.DataFrame({'name': [f"Item{i}" for i in range(5)]})
+        csv_file = "export_test.csv"
+        try:
+            for output_file in (self.output_file, csv_file):
+                with self.subTest(output_file=output_file):
+                    progress = list()
+                    export.export_dataframe(dataframe, output_file, "items", prettier=False,
+                                            progress=progress.append)
+                    self.assertEqual([2, 4, 5], progress)
+                    self.assertEqual(dataframe.to_dict(orient='list'),
+                                     pd.read_csv(output_file, dtype=str).to_dict(orient='list')
+                                     if output_file == csv_file else
+                                     pd.read_excel(output_file, dtype=str).to_dict(orient='list'))
+                    os.remove(output_file)
+
+                    # The export is canceled after the first chunk, no incomplete file is left behind
+                    cancel_event = threading.Event()
+                    with self.assertRaises(export.ExportCanceledError):
+                        export.export_dataframe(dataframe, output_file, "items", prettier=False,
+                                                progress=lambda rows: cancel_event.set(), cancel_event=cancel_event)
+                    self.assertFalse(os.path.exists(output_file))
+
+            # A canceled sheet isn't added to an existing workbook
+            export.export_dataframe(self.dataframe, self.output_file, "items", prettier=False)
+            cancel_event = threading.Event()
+            cancel_event.set()
+            with self.assertRaises(export.ExportCanceledError):
+                export.export_dataframe(dataframe, self.output_file, "items", cancel_event=cancel_event)
+            self.assertEqual(["items"], list(pd.read_excel(self.output_file, sheet_name=None)))
+        finally:
+            export.EXPORT_CHUNK_ROWS = export_chunk_rows
+            if os.path.exists(csv_file):
+                os.remove(csv_file)
+
+    def test_export_split(self):
+        """
+        Test splitting rows beyond the row limit into sheets or workbooks.
+        """
+        max_sheet_rows = xlsx_writer.MAX_SHEET_ROWS
+        xlsx_writer.MAX_SHEET_ROWS = 3
+        dataframe = pd.DataFrame({'name': [f"Item{i}" for i in range(5)]})
+        output_files = [self.output_file, "export_test_1.xlsx", "export_test_2.xlsx"]
+        try:
+            sheet_name = export.export_dataframe(dataframe, self.output_file, "items")
+            self.assertEqual("items", sheet_name)
+            sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+            self.assertEqual(["items", "items_1", "items_2"], list(sheets))
+            self.assertEqual(['Item4'], list(sheets["items_2"]['name']))
+            os.remove(self.output_file)
+
+            export.export_dataframes(iter([dataframe]), self.output_file, "items", split=export.SPLIT_WORKBOOKS)
+            for i, output_file in enumerate(output_files):
+                with self.subTest(output_file=output_file):
+                    sheets = pd.read_excel(output_file, sheet_name=None, dtype=str)
+                    self.assertEqual(["items"], list(sheets))
+                    self.assertEqual([f"Item{i * 2}"], list(sheets["items"]['name'][:1]))
+            for output_file in output_files:
+                os.remove(output_file)
+
+            with self.assertRaises(ValueError):
+                export.export_dataframe(dataframe, self.output_file, "items", split=None)
+            with self.assertRaises(ValueError):
+                export.export_dataframes(iter([dataframe]), self.output_file, "items", split=None)
+            self.assertFalse(os.path.exists(self.output_file))
+        finally:
+            xlsx_writer.MAX_SHEET_ROWS = max_sheet_rows
+            for output_file in output_files:
+                if os.path.exists(output_file):
+                    os.remove(output_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
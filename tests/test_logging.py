@@ -89,6 +89,41 @@ class TestLogging(unittest.TestCase):
 
         self.assertEqual(log.log_entries, listened_entries)
 
+    def test_remove_log_listener(self):
+        """
+        Test a removed log listener is not notified anymore.
+        """
+        listened_entries = list()
+        listener = lambda entry: listened_entries.append(entry)
+        log.add_log_listener(listener)
+        log.log_event("Event 0")
+        log.remove_log_listener(listener)
+        log.log_event("Event 1")
+
+        self.assertEqual(log.log_entries[:1], listened_entries)
+
+    def test_log_buffer(self):
+        """
+        Test taking the buffered entries in batches.
+        """
+        buffer = log.LogBuffer(max_entries=10)
+        self.assertEqual(([], 0), buffer.take())
+        for i in range(0, 3):
+            buffer.append(f"Event {i}")
+        self.assertEqual((["Event 0", "Event 1", "Event 2"], 0), buffer.take())
+        self.assertEqual(([], 0), buffer.take())
+
+    def test_log_buffer_overflow(self):
+        """
+        Test that a full log buffer drops and counts its oldest entries.
+        """
+        buffer = log.LogBuffer(max_entries=3)
+        for i in range(0, 5):
+            buffer.append(f"Event {i}")
+        self.assertEqual((["Event 2", "Event 3", "Event 4"], 2), buffer.take())
+        buffer.append("Event 5")
+        self.assertEqual((["Event 5"], 0), buffer.take())
+
     def test_save_filled_log(self):
         """
         Test saving a log file with multiple log entries.
@@ -0,0 +1,125 @@
+import threading
+import unittest
+import os
+import logic.parallel_parse as parallel_parse
+from logic.xml_dataframe import ParseCanceledError, XMLParser
+
+
+class TestParallelParse(unittest.TestCase):
+    """
+    Test suite for the parallel parsing of a single XML file.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        #  Create XML file with a prolog, namespaces and records with different columns
+        records = list()
+        for i in range(0, 200):
+            state = f"<properties><ns:state>NEW{i}</ns:state></properties>" if i % 7 == 0 else ""
+            extra = f"<extra>{i}</extra>" if i == 150 else ""
+            records.append(f"<item><name>Item{i}</name><!-- comment --><value>{i}</value>{state}{extra}</item>")
+        cls.xml_data = f"""<?xml version="1.0" encoding="UTF-8"?>
+        <!DOCTYPE root [<!ENTITY unit "kg">]>
+        <root xmlns:ns="urn:test">
+            {"".join(records)}
+            <other><unit>&unit;</unit></other>
+        </root>
+        """
+        cls.xml_file = 'parallel_test.xml'
+        with open(cls.xml_file, 'w') as file:
+            file.write(cls.xml_data)
+
+        #  Create XML file with records nested in elements of the same name
+        records = [f"<item><item><name>Item{i}</name></item><value>{i}</value></item>" for i in range(0, 200)]
+        cls.xml_file_nested = 'parallel_nested_test.xml'
+        with open(cls.xml_file_nested, 'w') as file:
+            file.write(f"<root>{''.join(records)}</root>")
+
+        cls.min_part_size = parallel_parse.MIN_PART_SIZE
+        parallel_parse.MIN_PART_SIZE = 1
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the test environment.
+        """
+        parallel_parse.MIN_PART_SIZE = cls.min_part_size
+        for file in [cls.xml_file, cls.xml_file_nested]:
+            if os.path.exists(file):
+                os.remove(file)
+
+    def test_find_record_ranges(self):
+        """
+        Test the ranges cover all records and start with a record.
+        """
+        record_ranges = parallel_parse.find_record_ranges(self.xml_file, 4)
+
+        self.assertEqual(4, len(record_ranges.ranges))
+        self.assertTrue(record_ranges.header.endswith(b'<root xmlns:ns="urn:test">'))
+        self.assertEqual(b"</root>", record_ranges.footer)
+        with open(self.xml_file, "rb") as file:
+            data = file.read()
+        for (start, end), (next_start, _) in zip(record_ranges.ranges, record_ranges.ranges[1:]):
+            self.assertEqual(end, next_start)
+            self.assertTrue(data[next_start:].startswith(b"<item>"))
+        self.assertEqual(data.rfind(b"</root>"), record_ranges.ranges[-1][1])
+
+    def test_parallel_same_dataframe(self):
+        """
+        Test parsing in parallel results in the same DataFrame as parsing sequentially.
+        """
+        expected_dataframe = XMLParser.read_dataframe(self.xml_file)
+        dataframe = parallel_parse.read_dataframe_parallel(self.xml_file, 2)
+
+        self.assertEqual(['name', 'value', '{urn:test}state', 'extra', 'unit'], list(dataframe.columns))
+        self.assertTrue(expected_dataframe.equals(dataframe))
+
+    def test_parallel_categorical(self):
+        """
+        Test parsing in parallel keeps the categorical mode with the categories in first-seen order.
+        """
+        for infer_types in (False, True):
+            with self.subTest(infer_types=infer_types):
+                expected_dataframe = XMLParser.read_dataframe(self.xml_file, categorical=True,
+                                                              infer_types=infer_types)
+                dataframe = XMLParser.read_dataframe(self.xml_file, workers=2, categorical=True,
+                                                     infer_types=infer_types)
+                self.assertEqual(list(expected_dataframe.dtypes), list(dataframe.dtypes))
+                self.assertTrue(expected_dataframe.equals(dataframe))
+
+        dataframe = parallel_parse.read_dataframe_parallel(self.xml_file, 2, categorical=True)
+        self.assertEqual('category', str(dataframe['{urn:test}state'].dtype))
+        self.assertEqual(['NEW0', 'NEW7'], list(dataframe['{urn:test}state'].cat.categories[:2]))
+
+    def test_parallel_progress_and_cancel(self):
+        """
+        Test the progress is reported for the parsed parts and a set cancel event cancels the parsing.
+        """
+        progress = list()
+        dataframe = XMLParser.read_dataframe(self.xml_file, workers=2,
+                                             progress=lambda read_bytes, records: progress.append(records))
+        self.assertTrue(progress)
+        self.assertEqual(sorted(progress), progress)
+        self.assertEqual(len(dataframe), progress[-1])
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with self.assertRaises(ParseCanceledError):
+            XMLParser.read_dataframe(self.xml_file, workers=2, cancel_event=cancel_event)
+
+    def test_parallel_nested_fallback(self):
+        """
+        Test splitting inside a record fails and results in the same DataFrame sequentially.
+        """
+        expected_dataframe = XMLParser.read_dataframe(self.xml_file_nested)
+        dataframe = XMLParser.read_dataframe(self.xml_file_nested, workers=2)
+
+        self.assertIsNone(parallel_parse.read_dataframe_parallel(self.xml_file_nested, 2))
+        self.assertTrue(expected_dataframe.equals(dataframe))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+from unittest import mock
+import os
+import shutil
+import logic.parse_cache as parse_cache
+from logic.parse_cache import ParseCache
+from logic.xml_dataframe import XMLParser
+
+
+@unittest.skipUnless(parse_cache.pyarrow_available, "pyarrow is not installed")
+class TestParseCache(unittest.TestCase):
+    """
+    Test suite for the on-disk cache of parsed XML files.
+    """
+
+    def setUp(self):
+        """
+        Create the XML file and an empty cache before each test.
+        """
+        self.directory = "parse_cache_test"
+        self.xml_file = os.path.join(self.directory, "items.xml")
+        os.makedirs(self.directory, exist_ok=True)
+        self.write_xml(["Item1", "Item2"])
+        self.cache = ParseCache(os.path.join(self.directory, "cache"))
+
+    def tearDown(self):
+        """
+        Remove the XML file and the cache after each test.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_xml(self, names: list, mtime: int | None = None):
+        """
+        Write the XML file.
+
+        Args:
+            names (list): The names of the items.
+            mtime (int | None): The modification time in nanoseconds. Defaults to the current time.
+        """
+        with open(self.xml_file, 'w') as file:
+            file.write("<root>" + "".join(f"<item><name>{name}</name><value>{i}</value></item>"
+                                          for i, name in enumerate(names)) + "</root>")
+        if mtime is not None:
+            os.utime(self.xml_file, ns=(mtime, mtime))
+
+    def test_store_and_load(self):
+        """
+        Test loading a stored DataFrame with its types.
+        """
+        dataframe = XMLParser.read_dataframe(self.xml_file, infer_types=True, categorical=True)
+        self.assertIsNone(self.cache.load(self.xml_file, infer_types=True))
+        self.assertTrue(self.cache.store(self.xml_file, dataframe, infer_types=True, progress=print))
+
+        self.assertTrue(self.cache.contains(self.xml_file, infer_types=True))
+        loaded = self.cache.load(self.xml_file, infer_types=True, streaming=True)
+        self.assertTrue(dataframe.equals(loaded))
+        self.assertEqual(list(dataframe.dtypes), list(loaded.dtypes))
+
+        # Other options parse another DataFrame
+        self.assertFalse(self.cache.contains(self.xml_file, infer_types=False))
+        self.assertIsNone(self.cache.load(self.xml_file, infer_types=False))
+
+    def test_changed_file(self):
+        """
+        Test that an entry is only valid while the content of the file is unchanged.
+        """
+        mtime: int = os.stat(self.xml_file).st_mtime_ns
+        self.cache.store(self.xml_file, XMLParser.read_dataframe(self.xml_file))
+
+        # A touched file with the same content stays valid
+        self.write_xml(["Item1", "Item2"], mtime + 10 ** 9)
+        self.assertFalse(self.cache.contains(self.xml_file))
+        self.assertEqual(['Item1', 'Item2'], self.cache.load(self.xml_file)['name'].tolist())
+        self.assertTrue(self.cache.contains(self.xml_file))
+
+        # Changed content of the same size and modification time is detected by the hash
+        self.write_xml(["Item3", "Item4"], mtime + 10 ** 9)
+        self.assertIsNone(self.cache.load(self.xml_file))
+        self.assertFalse(self.cache.contains(self.xml_file))
+
+        self.cache.store(self.xml_file, XMLParser.read_dataframe(self.xml_file))
+        self.write_xml(["Item3", "Item4", "Item5"])
+        self.assertIsNone(self.cache.load(self.xml_file))
+        os.remove(self.xml_file)
+        self.assertIsNone(self.cache.load(self.xml_file))
+
+    def test_changed_while_parsing(self):
+        """
+        Test that an entry of a file changed while it was parsed is not loaded.
+        """
+        fingerprint = self.cache.fingerprint(self.xml_file)
+        dataframe = XMLParser.read_dataframe(self.xml_file)
+        self.write_xml(["Item1", "Item2", "Item3"])
+        self.assertTrue(self.cache.store(self.xml_file, dataframe, fingerprint))
+        self.assertIsNone(self.cache.load(self.xml_file))
+
+        read_dataframe = XMLParser.read_dataframe
+
+        def read_and_change(file_path, **options):
+            parsed = read_dataframe(file_path, **options)
+            self.write_xml(["Item1", "Item2", "Item3", "Item4"])
+            return parsed
+
+        with mock.patch.object(XMLParser, 'read_dataframe', side_effect=read_and_change):
+            XMLParser.parse_xml_to_dataframe(self.xml_file, cache=self.cache)
+        XMLParser.parse_xml_to_dataframe(self.xml_file, cache=self.cache)
+        self.assertEqual(4, len(XMLParser.dataframe))
+        XMLParser.set_dataframe_none()
+
+    def test_changed_large_file(self):
+        """
+        Test that a large file with a changed modification time is parsed again, even if the hash samples miss
+        the edit.
+        """
+        dataframe = XMLParser.read_dataframe(self.xml_file)
+        size: int = parse_cache.FULL_HASH_SIZE + 1024 ** 2
+        with open(self.xml_file, 'wb') as file:
+            file.write(b"a" * size)
+        mtime: int = os.stat(self.xml_file).st_mtime_ns
+        self.cache.store(self.xml_file, dataframe)
+
+        # The edit lies between two samples, so the sampled hash is unchanged
+        sampled_hash: str = parse_cache.content_hash(self.xml_file)
+        with open(self.xml_file, 'r+b') as file:
+            file.seek(parse_cache.HASH_SAMPLE_SIZE + 1)
+            file.write(b"b")
+        os.utime(self.xml_file, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+        self.assertEqual(sampled_hash, parse_cache.content_hash(self.xml_file))
+        self.assertIsNone(self.cache.load(self.xml_file))
+        self.assertFalse(self.cache.contains(self.xml_file))
+
+    def test_content_hash(self):
+        """
+        Test hashing small files completely and large files by samples.
+        """
+        first: str = parse_cache.content_hash(self.xml_file)
+        self.assertEqual(first, parse_cache.content_hash(self.xml_file))
+        self.write_xml(["Item1", "Item3"])
+        self.assertNotEqual(first, parse_cache.content_hash(self.xml_file))
+
+        size: int = parse_cache.FULL_HASH_SIZE + 1
+        with open(self.xml_file, 'wb') as file:
+            file.write(b"a" * size)
+        first = parse_cache.content_hash(self.xml_file)
+        with open(self.xml_file, 'r+b') as file:
+            file.seek(size - 1)
+            file.write(b"b")
+        self.assertNotEqual(first, parse_cache.content_hash(self.xml_file))
+
+    def test_eviction(self):
+        """
+        Test removing the least recently used entries beyond the maximum size.
+        """
+        dataframe = XMLParser.read_dataframe(self.xml_file)
+        self.cache.store(self.xml_file, dataframe, columns=['name'])
+        entry_size: int = self.cache.size()
+        self.cache.max_size = entry_size * 5 // 2
+
+        self.cache.store(self.xml_file, dataframe, columns=['value'])
+        # Use the first entry after both were stored, so the second one is the least recently used
+        for file_name in os.listdir(self.cache.directory):
+            os.utime(os.path.join(self.cache.directory, file_name), (0, 0))
+        self.assertIsNotNone(self.cache.load(self.xml_file, columns=['name']))
+        self.cache.store(self.xml_file, dataframe, columns=['name', 'value'])
+
+        self.assertLessEqual(self.cache.size(), self.cache.max_size)
+        self.assertTrue(self.cache.contains(self.xml_file, columns=['name']))
+        self.assertFalse(self.cache.contains(self.xml_file, columns=['value']))
+        self.assertTrue(self.cache.contains(self.xml_file, columns=['name', 'value']))
+
+        self.cache.max_size = 0
+        self.assertFalse(self.cache.store(self.xml_file, dataframe))
+        self.cache.clear()
+        self.assertEqual(0, self.cache.size())
+
+    def test_damaged_entry(self):
+        """
+        Test that damaged entries are removed instead of failing.
+        """
+        self.cache.store(self.xml_file, XMLParser.read_dataframe(self.xml_file))
+        for file_name in os.listdir(self.cache.directory):
+            if file_name.endswith(".feather"):
+                with open(os.path.join(self.cache.directory, file_name), 'w') as file:
+                    file.write("damaged")
+        self.assertIsNone(self.cache.load(self.xml_file))
+        self.assertEqual([], os.listdir(self.cache.directory))
+
+    def test_parse_xml_to_dataframe(self):
+        """
+        Test that parsing a file again loads it from the cache.
+        """
+        XMLParser.parse_xml_to_dataframe(self.xml_file, cache=self.cache, infer_types=True)
+        self.assertTrue(self.cache.contains(self.xml_file, infer_types=True))
+        parsed = XMLParser.dataframe
+
+        XMLParser.parse_xml_to_dataframe(self.xml_file, cache=self.cache, infer_types=True)
+        self.assertTrue(parsed.equals(XMLParser.dataframe))
+        XMLParser.set_dataframe_none()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from logic.record_filter import RecordFilter
+
+
+class TestRecordFilter(unittest.TestCase):
+    """
+    Test suite for the filter expressions of records.
+    """
+
+    def setUp(self):
+        """
+        Create the records before each test.
+        """
+        self.records = [{'name': 'Item1', 'state': 'NEW', 'value': '10', 'date': '2024-01-15'},
+                        {'name': 'Item2', 'state': 'DONE', 'value': '2.5', 'date': '2023-12-31'},
+                        {'name': 'Item3', 'state': 'NEW', 'value': 'n/a', 'date': ''},
+                        {'name': 'Item 4'}]
+
+    def matching(self, expression: str) -> list:
+        """
+        Filter the records.
+
+        Args:
+            expression (str): The filter expression.
+
+        Returns:
+            list: The names of the matching records.
+        """
+        record_filter = RecordFilter(expression)
+        return [record['name'] for record in self.records if record_filter.matches(record.get)]
+
+    def test_comparisons(self):
+        """
+        Test comparing columns with texts and numbers.
+        """
+        self.assertEqual(['Item1', 'Item3'], self.matching('state == "NEW"'))
+        self.assertEqual(['Item1', 'Item3'], self.matching("state = NEW"))
+        self.assertEqual(['Item2'], self.matching("state != 'NEW'"))
+        self.assertEqual(['Item1'], self.matching("value > 5"))
+        self.assertEqual(['Item2'], self.matching("value <= 2.5"))
+        self.assertEqual(['Item1', 'Item2', 'Item3'], self.matching('value >= "10"'))
+        self.assertEqual(['Item1'], self.matching('date >= "2024-01-01"'))
+        self.assertEqual(['Item 4'], self.matching(r'name == "Item \"4\"" or name == "Item 4"'))
+
+    def test_null(self):
+        """
+        Test matching missing and empty values.
+        """
+        self.assertEqual(['Item3', 'Item 4'], self.matching("date == null"))
+        self.assertEqual(['Item1', 'Item2'], self.matching("date != NULL"))
+
+    def test_combinations(self):
+        """
+        Test combining comparisons with 'and', 'or', 'not' and parentheses.
+        """
+        self.assertEqual(['Item1'], self.matching('state == "NEW" and date >= "2024-01-01"'))
+        self.assertEqual(['Item1', 'Item2', 'Item3'], self.matching('state == "NEW" or value < 3'))
+        self.assertEqual(['Item2', 'Item 4'], self.matching('not state == "NEW"'))
+        self.assertEqual(['Item1', 'Item2'],
+                         self.matching('(state == "NEW" OR state == "DONE") AND NOT date == null'))
+        self.assertEqual({'state', 'date'}, RecordFilter('(state == NEW or state == DONE) and date != null').columns)
+
+    def test_syntax_errors(self):
+        """
+        Test invalid expressions.
+        """
+        for expression in ["", "state", "state ==", 'state == "NEW" and', '(state == NEW', 'state == NEW)',
+                           "state ! NEW", "value > null", "and == 1", "state == (NEW)"]:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    RecordFilter(expression)
+
+
+if __name__ == '__main__':
+    unittest.main()
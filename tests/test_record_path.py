@@ -0,0 +1,68 @@
+import unittest
+from logic.record_path import RecordPath
+
+
+class TestRecordPath(unittest.TestCase):
+    """
+    Test suite for the paths of record elements.
+    """
+
+    def test_default(self):
+        """
+        Test that the default path selects the children of the root.
+        """
+        record_path = RecordPath()
+        self.assertTrue(record_path.matches(['root', 'item']))
+        self.assertFalse(record_path.matches(['root']))
+        self.assertFalse(record_path.matches(['root', 'item', 'name']))
+        self.assertEqual(2, record_path.max_depth)
+
+    def test_relative_and_absolute(self):
+        """
+        Test paths relative to the root element and starting with the root element.
+        """
+        for path in ('items/item', '/export/items/item'):
+            with self.subTest(path=path):
+                record_path = RecordPath(path)
+                self.assertTrue(record_path.matches(['export', 'items', 'item']))
+                self.assertFalse(record_path.matches(['export', 'item']))
+                self.assertFalse(record_path.matches(['export', 'archive', 'item']))
+                self.assertFalse(record_path.matches(['export', 'items', 'item', 'item']))
+        self.assertTrue(RecordPath('items/item').matches(['other', 'items', 'item']))
+        self.assertFalse(RecordPath('/export/items/item').matches(['other', 'items', 'item']))
+
+    def test_anywhere(self):
+        """
+        Test paths selecting elements at any depth.
+        """
+        for path in ('item', '//item', './/item', '//items/item'):
+            with self.subTest(path=path):
+                record_path = RecordPath(path)
+                self.assertTrue(record_path.matches(['export', 'items', 'item']))
+                self.assertFalse(record_path.matches(['export', 'items']))
+                self.assertIsNone(record_path.max_depth)
+        self.assertTrue(RecordPath('item').matches(['export', 'archive', 'item']))
+        self.assertFalse(RecordPath('//items/item').matches(['export', 'archive', 'item']))
+
+    def test_wildcard_and_namespace(self):
+        """
+        Test wildcards and the tags of namespaced elements.
+        """
+        self.assertTrue(RecordPath('*/item').matches(['export', 'archive', 'item']))
+        self.assertTrue(RecordPath('items/item').matches(['{urn:x}export', '{urn:x}items', '{urn:x}item']))
+        self.assertTrue(RecordPath('{urn:x}item').matches(['{urn:x}export', '{urn:x}item']))
+        self.assertFalse(RecordPath('{urn:y}item').matches(['{urn:x}export', '{urn:x}item']))
+        self.assertFalse(RecordPath('item').matches(['export', 'subitem']))
+
+    def test_invalid(self):
+        """
+        Test that empty paths and empty steps are rejected.
+        """
+        for path in ('', ' ', '/', 'items//item', 'items/'):
+            with self.subTest(path=path):
+                with self.assertRaises(ValueError):
+                    RecordPath(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import numpy as np
+import pandas as pd
+import logic.type_inference as type_inference
+
+
+class TestTypeInference(unittest.TestCase):
+    """
+    Test suite for the type inference of parsed columns.
+    """
+
+    def test_parse_schema(self):
+        """
+        Test splitting the schema arguments into column types.
+        """
+        self.assertEqual(dict(), type_inference.parse_schema(None))
+        self.assertEqual({'price': 'float', 'ns:state': 'category', 'id': 'string'},
+                         type_inference.parse_schema(["price:float, ns:state:Category", "id:string"]))
+        with self.assertRaises(ValueError):
+            type_inference.parse_schema(["price"])
+        with self.assertRaises(ValueError):
+            type_inference.parse_schema(["price:decimal"])
+
+    def test_infer_types(self):
+        """
+        Test inferring the types of text columns.
+        """
+        dataframe = pd.DataFrame({'integer': ['1', '-20', np.nan, '300'],
+                                  'float': ['1.5', '2', '-3e2', np.nan],
+                                  'boolean': ['true', 'False', 'true', 'false'],
+                                  'date': ['2024-01-31', '2024-02-01 12:30', '2024-02-02T08:00:00', np.nan],
+                                  'state': ['NEW', 'NEW', 'DONE', 'NEW'],
+                                  'name': ['Item1', 'Item2', 'Item3', 'Item4']})
+        result = type_inference.infer_types(dataframe)
+
+        self.assertEqual('Int64', str(result['integer'].dtype))
+        self.assertEqual([1, -20, pd.NA, 300], result['integer'].tolist())
+        self.assertEqual('float64', str(result['float'].dtype))
+        self.assertEqual('bool', str(result['boolean'].dtype))
+        self.assertEqual([True, False, True, False], result['boolean'].tolist())
+        self.assertEqual('datetime64[ns]', str(result['date'].dtype))
+        self.assertEqual(pd.Timestamp('2024-02-01 12:30'), result['date'][1])
+        self.assertEqual('category', str(result['state'].dtype))
+        self.assertEqual(object, result['name'].dtype)
+        # The parsed DataFrame is not changed
+        self.assertEqual(object, dataframe['integer'].dtype)
+
+    def test_keep_text(self):
+        """
+        Test that values which would lose information stay text.
+        """
+        dataframe = pd.DataFrame({'code': ['007', '010', '123'],
+                                  'decimal_code': ['0012.5', '1.5', '2'],
+                                  'identifier': ['1234567890123456', '1', '2'],
+                                  'zone': ['2024-01-31T10:00:00+02:00', '2024-01-31T10:00:00Z', '2024-02-01'],
+                                  'invalid_date': ['2024-13-45', '2024-01-01', '2024-01-02'],
+                                  'padded': [' 1', '2', '3']})
+        result = type_inference.infer_types(dataframe)
+
+        for column in dataframe.columns:
+            with self.subTest(column=column):
+                self.assertEqual(object, result[column].dtype)
+                self.assertEqual(dataframe[column].tolist(), result[column].tolist())
+
+    def test_schema(self):
+        """
+        Test converting columns to the types of a schema.
+        """
+        dataframe = pd.DataFrame({'code': ['007', '010', 'x'],
+                                  'value': ['1', '2', '3'],
+                                  'state': ['NEW', 'DONE', 'OPEN']})
+        result = type_inference.infer_types(dataframe, {'code': 'integer', 'state': 'category', 'missing': 'float'},
+                                            infer=False)
+
+        self.assertEqual([7, 10, pd.NA], result['code'].tolist())
+        self.assertEqual(object, result['value'].dtype)
+        self.assertEqual('category', str(result['state'].dtype))
+
+        self.assertEqual('int64', str(type_inference.infer_types(dataframe, {'code': 'string'})['value'].dtype))
+        self.assertEqual(object, type_inference.infer_types(dataframe, {'code': 'string'})['code'].dtype)
+        with self.assertRaises(ValueError):
+            type_inference.infer_types(dataframe, {'value': 'decimal'})
+
+    def test_integer_range(self):
+        """
+        Test converting integers beyond the precision of a float and beyond the range of int64.
+        """
+        dataframe = pd.DataFrame({'overflow': ['99999999999999999999', '1', '-9223372036854775808'],
+                                  'missing': ['12345678901234567', None, '2.5'],
+                                  'id': ['1234567890123456789', '9223372036854775807', '0']})
+        result = type_inference.infer_types(dataframe, {'overflow': 'integer', 'missing': 'integer', 'id': 'integer'},
+                                            infer=False)
+
+        self.assertEqual([pd.NA, 1, -9223372036854775808], result['overflow'].tolist())
+        self.assertEqual([12345678901234567, pd.NA, pd.NA], result['missing'].tolist())
+        self.assertEqual('Int64', str(result['missing'].dtype))
+        self.assertEqual([1234567890123456789, 9223372036854775807, 0], result['id'].tolist())
+        self.assertEqual('int64', str(result['id'].dtype))
+
+    def test_append_rows(self):
+        """
+        Test converting appended text rows to the types of the converted rows.
+        """
+        dataframe = type_inference.infer_types(pd.DataFrame({'id': ['1', '2'], 'price': ['1.5', '2'],
+                                                             'state': ['NEW', 'NEW'], 'name': ['a', 'b']}))
+        rows = pd.DataFrame({'id': ['3', '4'], 'state': ['DONE', np.nan], 'name': ['c', 'd'], 'note': ['x', 'y']})
+
+        result = type_inference.append_rows(dataframe, rows)
+        self.assertEqual([1, 2, 3, 4], result['id'].tolist())
+        self.assertEqual('int64', str(result['id'].dtype))
+        self.assertEqual([1.5, 2.0], result['price'].tolist()[:2])
+        self.assertTrue(result['price'].iloc[2:].isna().all())
+        self.assertEqual(['NEW', 'DONE'], list(result['state'].cat.categories))
+        self.assertEqual(['NEW', 'NEW', 'DONE'], result['state'].tolist()[:3])
+        self.assertEqual(['a', 'b', 'c', 'd'], result['name'].tolist())
+        self.assertEqual(['x', 'y'], result['note'].tolist()[2:])
+        self.assertEqual(list(range(4)), result.index.tolist())
+
+        # Values that don't match the inferred type need the inference of all rows
+        self.assertIsNone(type_inference.append_rows(dataframe, pd.DataFrame({'id': ['007']})))
+        self.assertIsNone(type_inference.append_rows(dataframe, pd.DataFrame({'price': ['n/a']})))
+        # Schema types are applied like by infer_types
+        result = type_inference.append_rows(dataframe, pd.DataFrame({'id': ['007']}), {'id': 'integer'})
+        self.assertEqual([1, 2, 7], result['id'].tolist())
+
+    def test_empty_columns(self):
+        """
+        Test that empty columns and DataFrames are kept.
+        """
+        dataframe = pd.DataFrame({'empty': [np.nan, np.nan]}, dtype=object)
+        self.assertIs(dataframe, type_inference.infer_types(dataframe))
+        self.assertTrue(type_inference.infer_types(pd.DataFrame()).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import unittest
+import datetime
+import os
+import zipfile
+import numpy as np
+import openpyxl
+import pandas as pd
+import logic.xlsx_writer as xlsx_writer
+from logic.xlsx_writer import XLSXWriter
+
+
+class TestXLSXWriter(unittest.TestCase):
+    """
+    Test suite for the streaming XLSX writer.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        cls.output_file = "xlsx_writer_test.xlsx"
+
+    def tearDown(self):
+        """
+        Clean up the output file after each test.
+        """
+        if os.path.exists(self.output_file):
+            os.remove(self.output_file)
+
+    def test_column_letter(self):
+        """
+        Test the column letters like Excel names them.
+        """
+        self.assertEqual(["A", "Z", "AA", "AZ", "BA", "XFD"],
+                         [xlsx_writer.column_letter(i) for i in [0, 25, 26, 51, 52, 16383]])
+
+    def test_validate_sheet_name(self):
+        """
+        Test sheet names with characters that are not allowed.
+        """
+        xlsx_writer.validate_sheet_name("items 2024")
+        for sheet_name in ["", "items/2024", "items[1]", "items?"]:
+            with self.subTest(sheet_name=sheet_name):
+                with self.assertRaises(ValueError):
+                    xlsx_writer.validate_sheet_name(sheet_name)
+
+    def test_split_rows(self):
+        """
+        Test splitting chunks into parts of at most max_rows rows.
+        """
+        chunks = [pd.DataFrame({'value': range(start, start + 3)}) for start in range(0, 9, 3)]
+        parts = [[list(chunk['value']) for chunk in part] for part in xlsx_writer.split_rows(chunks, 4)]
+        self.assertEqual([[[0, 1, 2], [3]], [[4, 5], [6, 7]], [[8]]], parts)
+
+        parts = [list(part) for part in xlsx_writer.split_rows(chunks[:2] + [pd.DataFrame()], 3)]
+        self.assertEqual(2, len(parts))
+        parts = [list(part) for part in xlsx_writer.split_rows([], 3)]
+        self.assertEqual([[]], parts)
+
+    def test_write_chunks(self):
+        """
+        Test writing chunks with columns found in later chunks into multiple sheets.
+        """
+        chunks = [pd.DataFrame({'name': ['Item1', 'Item2'], 'value': ['10', None]}),
+                  pd.DataFrame({'name': ['Item3'], 'value': ['30'], 'unit': ['kg']})]
+        with XLSXWriter(self.output_file) as writer:
+            self.assertEqual(3, writer.write_sheet("items", iter(chunks)))
+            self.assertEqual(0, writer.write_sheet("empty", []))
+            with self.assertRaises(ValueError):
+                writer.write_sheet("Items", [])
+
+        sheets = pd.read_excel(self.output_file, sheet_name=None, dtype=str)
+        self.assertEqual(["items", "empty"], list(sheets))
+        items = sheets["items"]
+        self.assertEqual(['name', 'value', 'unit'], list(items.columns))
+        self.assertEqual(['Item1', 'Item2', 'Item3'], list(items['name']))
+        self.assertEqual(['10', '30'], list(items['value'].dropna()))
+        self.assertEqual(['kg'], list(items['unit'].dropna()))
+        self.assertTrue(sheets["empty"].empty)
+
+    def test_content_widths(self):
+        """
+        Test the widths of the header and the longest values.
+        """
+        dataframe = pd.DataFrame({'name': ['Item1', None], 'description': ['Heavy', 'Light and small'],
+                                  'v': [1.25, 10.0]})
+        self.assertEqual([5, 15, 4], xlsx_writer.content_widths(dataframe))
+
+    def test_write_column_widths(self):
+        """
+        Test the column widths are the maximum over all chunks.
+        """
+        chunks = [pd.DataFrame({'name': ['Item1'], 'value': ['1']}),
+                  pd.DataFrame({'name': ['Item2'], 'value': ['1000000000'], 'unit': ['kg']})]
+        with XLSXWriter(self.output_file) as writer:
+            writer.write_sheet("items", chunks, prettier=True)
+            writer.write_sheet("plain", chunks)
+
+        workbook = openpyxl.load_workbook(self.output_file)
+        dimensions = workbook["items"].column_dimensions
+        self.assertEqual([7, 12, 6], [dimensions[letter].width for letter in ["A", "B", "C"]])
+        self.assertNotIn("A", workbook["plain"].column_dimensions)
+
+    def test_write_values(self):
+        """
+        Test writing values of different types, special characters and missing values.
+        """
+        dataframe = pd.DataFrame({'text': [' <a & b> ', 'line\x01'],
+                                  'number': [1.5, np.nan],
+                                  'integer': np.array([7, 8], dtype=np.int64),
+                                  'flag': [True, False],
+                                  'time': [pd.Timestamp('2024-01-02 03:04:05'), pd.NaT],
+                                  'date': [datetime.date(2024, 1, 2), None]})
+        with XLSXWriter(self.output_file) as writer:
+            writer.write_sheet("values", [dataframe])
+
+        sheet = openpyxl.load_workbook(self.output_file)["values"]
+        self.assertTrue(sheet['A1'].font.b)
+        self.assertEqual([' <a & b> ', 1.5, 7, True, datetime.datetime(2024, 1, 2, 3, 4, 5),
+                          datetime.datetime(2024, 1, 2)], [cell.value for cell in sheet[2]])
+        self.assertEqual(['line', None, 8, False, None, None], [cell.value for cell in sheet[3]])
+        self.assertTrue(sheet['E2'].is_date)
+
+    def test_append_sheet(self):
+        """
+        Test appending sheets to a workbook created by openpyxl without rewriting the existing sheets.
+        """
+        workbook = openpyxl.Workbook()
+        workbook.active.title = "existing"
+        workbook.active.append(["name", "share"])
+        workbook.active.append(["Item1", 0.5])
+        workbook.active["B2"].number_format = "0.00%"
+        workbook.save(self.output_file)
+        with zipfile.ZipFile(self.output_file) as archive:
+            existing_sheet = archive.getinfo("xl/worksheets/sheet1.xml")
+
+        for sheet_name in ["items", "times"]:
+            with XLSXWriter(self.output_file, append=True) as writer:
+                self.assertEqual("existing", writer.sheet_names[0])
+                writer.write_sheet(sheet_name, [pd.DataFrame({'time': [pd.Timestamp('2024-01-02')]})],
+                                   prettier=True)
+
+        with zipfile.ZipFile(self.output_file) as archive:
+            self.assertIsNone(archive.testzip())
+            sheet = archive.getinfo("xl/worksheets/sheet1.xml")
+            self.assertEqual((existing_sheet.header_offset, existing_sheet.CRC), (sheet.header_offset, sheet.CRC))
+        workbook = openpyxl.load_workbook(self.output_file)
+        self.assertEqual(["existing", "items", "times"], workbook.sheetnames)
+        self.assertEqual("0.00%", workbook["existing"]["B2"].number_format)
+        self.assertTrue(workbook["times"]["A1"].font.b)
+        self.assertEqual(datetime.datetime(2024, 1, 2), workbook["times"]["A2"].value)
+        self.assertTrue(workbook["times"]["A2"].is_date)
+
+    def test_append_failure_restores_file(self):
+        """
+        Test the existing workbook is restored if writing a sheet fails.
+        """
+        with XLSXWriter(self.output_file) as writer:
+            writer.write_sheet("items", [pd.DataFrame({'name': ['Item1']})])
+        with open(self.output_file, 'rb') as file:
+            content = file.read()
+
+        def chunks():
+            yield pd.DataFrame({'name': ['Item2']})
+            raise OSError("Read error")
+
+        with self.assertRaises(OSError):
+            with XLSXWriter(self.output_file, append=True) as writer:
+                writer.write_sheet("more", [pd.DataFrame({'name': ['Item2']})])
+                writer.write_sheet("failed", chunks())
+        with open(self.output_file, 'rb') as file:
+            self.assertEqual(content, file.read())
+
+    def test_append_invalid_file(self):
+        """
+        Test appending to a file that is no workbook.
+        """
+        with open(self.output_file, 'w') as file:
+            file.write("No workbook")
+        with self.assertRaises(IOError):
+            XLSXWriter(self.output_file, append=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import os
+import xml.etree.ElementTree as ET
+import logic.xml_backend as xml_backend
+from logic.xml_dataframe import XMLParser
+
+
+class TestXMLBackend(unittest.TestCase):
+    """
+    Test suite for the XML parser backends.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment.
+        """
+        #  Create XML file with comments, processing instructions and entities
+        cls.xml_data = """<?xml version="1.0"?>
+        <!DOCTYPE root [<!ENTITY unit "kg">]>
+        <root>
+            <!-- First item -->
+            <item>
+                <name>Item1</name>
+                <value>10</value>
+                <unit>&unit;</unit>
+                <?processing instruction?>
+                <properties>
+                    <state>NEW</state>
+                </properties>
+            </item>
+            <item>
+                <name>Item2</name>
+                <value>20</value>
+            </item>
+        </root>"""
+        cls.xml_file = 'backend_test.xml'
+        with open(cls.xml_file, 'w') as file:
+            file.write(cls.xml_data)
+
+        #  Create XML file no content
+        cls.xml_file_empty = 'backend_empty_test.xml'
+        with open(cls.xml_file_empty, 'w') as file:
+            file.write(str())
+
+        #  Create XML with a syntax error
+        cls.xml_file_syntax = 'backend_syntax_test.xml'
+        with open(cls.xml_file_syntax, 'w') as file:
+            file.write("Syntax Error")
+
+        #  Create XML which ends before the root is closed
+        cls.xml_file_truncated = 'backend_truncated_test.xml'
+        with open(cls.xml_file_truncated, 'w') as file:
+            file.write("<root><item><name>Item1</name></item>")
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the test environment.
+        """
+        for file in [cls.xml_file, cls.xml_file_empty, cls.xml_file_syntax, cls.xml_file_truncated]:
+            if os.path.exists(file):
+                os.remove(file)
+
+    def test_default_backend(self):
+        """
+        Test the default backend is lxml if it is installed, except for streaming.
+        """
+        expected_name = "lxml" if xml_backend.lxml_etree is not None else "etree"
+        self.assertEqual(expected_name, xml_backend.get_backend().name)
+        self.assertEqual("etree", xml_backend.get_backend(streaming=True).name)
+        self.assertEqual(expected_name, xml_backend.get_backend(expected_name, streaming=True).name)
+
+    def test_unknown_backend(self):
+        """
+        Test requesting a backend that doesn't exist.
+        """
+        with self.assertRaises(ValueError):
+            xml_backend.get_backend("unknown")
+
+    def test_backends_same_dataframe(self):
+        """
+        Test every backend results in the same DataFrame in DOM and streaming mode.
+        """
+        XMLParser.parse_xml_to_dataframe(self.xml_file, backend="etree")
+        expected_dataframe = XMLParser.dataframe
+        self.assertEqual(['name', 'value', 'unit', 'state'], list(expected_dataframe.columns))
+        self.assertEqual('kg', expected_dataframe['unit'][0])
+
+        for name in xml_backend.backends:
+            for streaming in [False, True]:
+                with self.subTest(backend=name, streaming=streaming):
+                    XMLParser.parse_xml_to_dataframe(self.xml_file, streaming=streaming, backend=name)
+                    self.assertTrue(expected_dataframe.equals(XMLParser.dataframe))
+
+    def test_backends_same_errors(self):
+        """
+        Test every backend raises the same parse error codes as ElementTree.
+        """
+        for file, expected_code in [(self.xml_file_empty, 3), (self.xml_file_truncated, 3),
+                                    (self.xml_file_syntax, 2)]:
+            for name, backend in xml_backend.backends.items():
+                with self.subTest(backend=name, file=file):
+                    with open(file, "rb") as source, self.assertRaises(ET.ParseError) as context:
+                        backend.parse(source)
+                    self.assertEqual(expected_code, context.exception.code)
+
+                    with open(file, "rb") as source, self.assertRaises(ET.ParseError) as context:
+                        list(backend.iterparse(source, ("start", "end")))
+                    self.assertEqual(expected_code, context.exception.code)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,10 @@
+import io
+import threading
 import unittest
+from unittest import mock
 import numpy as np
+import xml.etree.ElementTree as ET
+import logic.xml_dataframe as xml_dataframe
 from logic.xml_dataframe import XMLParser
 import os
 
@@ -144,6 +149,20 @@ class TestXMLParser(unittest.TestCase):
         dataframe = XMLParser.dataframe
         self.assertIsNone(dataframe)
 
+    def test_parse_xml_unreadable(self):
+        """
+        Test that a file that can't be read removes the data of the previous file.
+        """
+        XMLParser.parse_xml_to_dataframe(self.xml_file_even)
+        self.assertIsNotNone(XMLParser.dataframe)
+        XMLParser.parse_xml_to_dataframe('missing_test.xml')
+        self.assertIsNone(XMLParser.dataframe)
+
+        XMLParser.scan_xml_schema(self.xml_file_even)
+        self.assertIsNotNone(XMLParser.schema)
+        XMLParser.scan_xml_schema('missing_test.xml')
+        self.assertIsNone(XMLParser.schema)
+
     def test_parse_non_xml_file(self):
         """
         Test parsing a non XML file with even structure.
@@ -158,5 +177,325 @@ class TestXMLParser(unittest.TestCase):
         self.assertEqual(expected_data, dataframe.to_dict(orient='list'))
 
 
+    def test_parse_xml_streaming_even(self):
+        """
+        Test streaming an XML file with even structure.
+        """
+        XMLParser.parse_xml_to_dataframe(self.xml_file_even, streaming=True)
+        dataframe = XMLParser.dataframe
+
+        expected_columns = ['name', 'value']
+        expected_data = {'name': ['Item1', 'Item2'], 'value': ['10', '20']}
+
+        self.assertEqual(expected_columns, list(dataframe.columns))
+        self.assertEqual(expected_data, dataframe.to_dict(orient='list'))
+
+    def test_parse_xml_streaming_uneven(self):
+        """
+        Test streaming an XML file with uneven structure results in the same DataFrame as the DOM parsing.
+        """
+        XMLParser.parse_xml_to_dataframe(self.xml_file_uneven)
+        expected_dataframe = XMLParser.dataframe
+        XMLParser.parse_xml_to_dataframe(self.xml_file_uneven, streaming=True)
+        dataframe = XMLParser.dataframe
+
+        self.assertEqual(['name', 'value', 'state'], list(dataframe.columns))
+        self.assertTrue(expected_dataframe.equals(dataframe))
+
+    def test_parse_xml_streaming_empty(self):
+        """
+        Test streaming an empty XML file.
+        """
+        XMLParser.parse_xml_to_dataframe(self.xml_file_empty, streaming=True)
+        dataframe = XMLParser.dataframe
+
+        self.assertEqual(list(), list(dataframe.columns))
+        self.assertEqual(dict(), dataframe.to_dict(orient='list'))
+
+    def test_parse_xml_streaming_syntax_error(self):
+        """
+        Test streaming an XML file with syntax error.
+        """
+        XMLParser.parse_xml_to_dataframe(self.xml_file_syntax, streaming=True)
+        dataframe = XMLParser.dataframe
+        self.assertIsNone(dataframe)
+
+    def test_parse_xml_infer_types(self):
+        """
+        Test converting the parsed columns to native types.
+        """
+        dataframe = XMLParser.read_dataframe(self.xml_file_uneven, streaming=True, infer_types=True)
+        self.assertEqual('int64', str(dataframe['value'].dtype))
+        self.assertEqual([10, 20], dataframe['value'].tolist())
+        self.assertEqual(object, dataframe['name'].dtype)
+
+        dataframe = XMLParser.read_dataframe(self.xml_file_even, schema={'value': 'float'})
+        self.assertEqual([10.0, 20.0], dataframe['value'].tolist())
+        self.assertEqual(object, dataframe['name'].dtype)
+
+        chunks = list(XMLParser.iter_dataframes(self.xml_file_even, chunk_size=1, schema={'value': 'integer'}))
+        self.assertEqual([[10], [20]], [chunk['value'].tolist() for chunk in chunks])
+
+    def test_parse_xml_categorical(self):
+        """
+        Test parsing categorical columns results in the same values and inferred types.
+        """
+        expected = XMLParser.read_dataframe(self.xml_file_uneven, streaming=True)
+        dataframe = XMLParser.read_dataframe(self.xml_file_uneven, streaming=True, categorical=True)
+        self.assertTrue(all(str(dtype) == 'category' for dtype in dataframe.dtypes))
+        self.assertTrue(expected.equals(dataframe.astype(object)))
+
+        expected = XMLParser.read_dataframe(self.xml_file_uneven, infer_types=True)
+        dataframe = XMLParser.read_dataframe(self.xml_file_uneven, infer_types=True, categorical=True)
+        self.assertEqual(list(expected.dtypes), list(dataframe.dtypes))
+        self.assertEqual(expected['value'].tolist(), dataframe['value'].tolist())
+
+    def test_parse_xml_selected_columns(self):
+        """
+        Test extracting only selected columns while parsing.
+        """
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                dataframe = XMLParser.read_dataframe(self.xml_file_uneven, streaming=streaming,
+                                                     columns=['state', 'name', 'missing'])
+                self.assertEqual(['name', 'state'], list(dataframe.columns))
+                self.assertEqual(['Item1', 'Item2'], dataframe['name'].tolist())
+                self.assertEqual('NEW', dataframe['state'][0])
+                self.assertEqual(2, len(dataframe))
+
+        dataframe = XMLParser.read_dataframe(self.xml_file_uneven, columns=[])
+        self.assertEqual((2, 0), dataframe.shape)
+
+    def test_parse_xml_filter(self):
+        """
+        Test dropping the records that don't match a filter while parsing.
+        """
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                dataframe = XMLParser.read_dataframe(self.xml_file_uneven, streaming=streaming,
+                                                     record_filter='value > 15')
+                self.assertEqual(['name', 'value', 'state'], list(dataframe.columns))
+                self.assertEqual({'name': ['Item2'], 'value': ['20']},
+                                 dataframe[['name', 'value']].to_dict(orient='list'))
+                self.assertTrue(dataframe['state'].isna().all())
+
+        dataframe = XMLParser.read_dataframe(self.xml_file_uneven, columns=['name'], categorical=True,
+                                             record_filter='state == "NEW"')
+        self.assertEqual(['name'], list(dataframe.columns))
+        self.assertEqual(['Item1'], list(dataframe['name'].cat.categories))
+
+        chunks = list(XMLParser.iter_dataframes(self.xml_file_even, chunk_size=1, record_filter='name != Item1'))
+        self.assertEqual([['Item2']], [chunk['name'].tolist() for chunk in chunks])
+        with self.assertRaises(ValueError):
+            XMLParser.read_dataframe(self.xml_file_even, record_filter='name ==')
+
+    def test_parse_xml_record_path(self):
+        """
+        Test selecting nested records by a record path.
+        """
+        content = (b"<export><header><name>Export</name></header>"
+                   b"<items><item><name>A</name><value>1</value></item><item><name>B</name></item></items>"
+                   b"<archive><item><name>C</name></item></archive></export>")
+        for record_path, names in (('items/item', ['A', 'B']), ('/export/items/item', ['A', 'B']),
+                                   ('item', ['A', 'B', 'C']), ('//item', ['A', 'B', 'C']), ('*/item', ['A', 'B', 'C'])):
+            for streaming in (False, True):
+                with self.subTest(record_path=record_path, streaming=streaming):
+                    dataframe = XMLParser.read_dataframe(io.BytesIO(content), streaming=streaming,
+                                                         record_path=record_path)
+                    self.assertEqual(names, dataframe['name'].tolist())
+
+        dataframe = XMLParser.read_dataframe(io.BytesIO(content), streaming=True)
+        self.assertEqual(3, len(dataframe))
+
+        chunks = list(XMLParser.iter_dataframes(io.BytesIO(content), chunk_size=1, record_path='items/item'))
+        self.assertEqual([['A'], ['B']], [chunk['name'].tolist() for chunk in chunks])
+        schema = XMLParser.scan_schema(io.BytesIO(content), record_path='items/item')
+        self.assertEqual({'name': 2, 'value': 1}, schema['count'].to_dict())
+        with self.assertRaises(ValueError):
+            XMLParser.read_dataframe(io.BytesIO(content), record_path='items//item')
+
+    def test_scan_schema(self):
+        """
+        Test scanning the columns of an XML file without parsing the values.
+        """
+        schema = XMLParser.scan_schema(self.xml_file_uneven)
+        self.assertEqual(['name', 'value', 'state'], list(schema.index))
+        self.assertEqual([2, 2, 1], schema['count'].tolist())
+        self.assertEqual([0.0, 0.0, 0.5], schema['null_ratio'].tolist())
+
+        schema = XMLParser.scan_schema(self.xml_file_uneven, max_records=1)
+        self.assertEqual([1, 1, 1], schema['count'].tolist())
+
+        source = io.BytesIO(b"<root><item><name/><name>A</name><value/></item><item><name>B</name></item></root>")
+        schema = XMLParser.scan_schema(source)
+        self.assertEqual({'name': 2, 'value': 0}, schema['count'].to_dict())
+        self.assertEqual({'name': 0.0, 'value': 1.0}, schema['null_ratio'].to_dict())
+
+        self.assertTrue(XMLParser.scan_schema(self.xml_file_empty).empty)
+        with self.assertRaises(ET.ParseError):
+            XMLParser.scan_schema(self.xml_file_syntax)
+
+    def test_scan_xml_schema(self):
+        """
+        Test storing the scanned columns and notifying the schema listeners.
+        """
+        schemas = list()
+        XMLParser.add_schema_listener(schemas.append)
+        XMLParser.scan_xml_schema(self.xml_file_even)
+        self.assertEqual(['name', 'value'], list(XMLParser.schema.index))
+        XMLParser.scan_xml_schema(self.xml_file_syntax)
+        self.assertIsNone(XMLParser.schema)
+        self.assertEqual(2, len(schemas))
+        self.assertIsNone(schemas[-1])
+
+    def test_iter_dataframes(self):
+        """
+        Test parsing an XML file in chunks with a growing column schema.
+        """
+        chunks = list(XMLParser.iter_dataframes(self.xml_file_uneven, chunk_size=1))
+
+        self.assertEqual(2, len(chunks))
+        self.assertEqual(['name', 'value', 'state'], list(chunks[0].columns))
+        self.assertEqual(['name', 'value', 'state'], list(chunks[1].columns))
+        self.assertEqual({'name': ['Item2'], 'value': ['20']}, chunks[1][['name', 'value']].to_dict(orient='list'))
+        self.assertTrue(chunks[1]['state'].isna().all())
+
+    def test_iter_dataframes_fixed_columns(self):
+        """
+        Test parsing an XML file in chunks with a fixed column schema.
+        """
+        chunks = list(XMLParser.iter_dataframes(self.xml_file_even, chunk_size=1, columns=['value', 'state']))
+
+        self.assertEqual(2, len(chunks))
+        for chunk in chunks:
+            self.assertEqual(['value', 'state'], list(chunk.columns))
+        self.assertEqual(['10'], chunks[0]['value'].tolist())
+        self.assertTrue(chunks[0]['state'].isna().all())
+
+    def test_iter_dataframes_empty(self):
+        """
+        Test parsing an empty XML file in chunks.
+        """
+        self.assertEqual(list(), list(XMLParser.iter_dataframes(self.xml_file_empty)))
+
+    def test_iter_dataframes_syntax_error(self):
+        """
+        Test parsing an XML file with syntax error in chunks.
+        """
+        with self.assertRaises(ET.ParseError):
+            list(XMLParser.iter_dataframes(self.xml_file_syntax))
+
+    def test_parse_xml_progress(self):
+        """
+        Test the progress is reported with the read bytes and parsed records.
+        """
+        reported = list()
+        XMLParser.read_dataframe(self.xml_file_even, streaming=True,
+                                 progress=lambda read_bytes, records: reported.append((read_bytes, records)))
+
+        self.assertEqual((os.path.getsize(self.xml_file_even), 2), reported[-1])
+
+    def test_parse_xml_canceled(self):
+        """
+        Test canceling the parsing of an XML file.
+        """
+        progress_interval = xml_dataframe.PROGRESS_INTERVAL
+        xml_dataframe.PROGRESS_INTERVAL = 1
+        cancel_event = threading.Event()
+        cancel_event.set()
+        try:
+            with self.assertRaises(xml_dataframe.ParseCanceledError):
+                XMLParser.read_dataframe(self.xml_file_even, streaming=True, cancel_event=cancel_event)
+
+            XMLParser.parse_xml_to_dataframe(self.xml_file_even, streaming=True, cancel_event=cancel_event)
+            self.assertIsNone(XMLParser.dataframe)
+        finally:
+            xml_dataframe.PROGRESS_INTERVAL = progress_interval
+
+    def test_parse_xml_incremental(self):
+        """
+        Test parsing only the records appended to a growing XML file.
+        """
+        xml_file = 'test_growing.xml'
+
+        def append(records: str):
+            with open(xml_file, 'rb') as file:
+                content = file.read()
+            end = content.rindex(b'</log>')
+            with open(xml_file, 'wb') as file:
+                file.write(content[:end] + records.encode() + content[end:])
+
+        appended = list()
+        XMLParser.add_append_listener(appended.append)
+        options = {'streaming': True, 'infer_types': True, 'categorical': True}
+        try:
+            with open(xml_file, 'w') as file:
+                file.write('<?xml version="1.0"?>\n<!-- log -->\n<log xmlns="urn:x">\n'
+                           '<entry><id>1</id><state>NEW</state></entry>\n</log>\n')
+            XMLParser.parse_xml_to_dataframe(xml_file, incremental=True, **options)
+            self.assertEqual([1], XMLParser.dataframe['{urn:x}id'].tolist())
+
+            append('<entry><id>2</id><state>DONE</state><note>late</note></entry>\n')
+            XMLParser.parse_xml_to_dataframe(xml_file, incremental=True, **options)
+            self.assertEqual(1, len(appended))
+            self.assertEqual([1], appended[0].index.tolist())
+            self.assertTrue(XMLParser.dataframe.equals(XMLParser.read_dataframe(xml_file, **options)))
+
+            # Nothing appended
+            XMLParser.parse_xml_to_dataframe(xml_file, incremental=True, **options)
+            self.assertEqual(1, len(appended))
+            self.assertEqual(2, len(XMLParser.dataframe))
+
+            # A value that doesn't match the inferred type needs the whole file
+            append('<entry><id>x</id></entry>\n')
+            XMLParser.parse_xml_to_dataframe(xml_file, incremental=True, **options)
+            self.assertEqual(1, len(appended))
+            self.assertEqual(['1', '2', 'x'], XMLParser.dataframe['{urn:x}id'].tolist())
+
+            # A changed record needs the whole file
+            with open(xml_file, 'rb') as file:
+                content = file.read()
+            with open(xml_file, 'wb') as file:
+                file.write(content.replace(b'<id>1</id>', b'<id>3</id>'))
+            append('<entry><id>4</id></entry>\n')
+            XMLParser.parse_xml_to_dataframe(xml_file, incremental=True, **options)
+            self.assertEqual(1, len(appended))
+            self.assertEqual(['3', '2', 'x', '4'], XMLParser.dataframe['{urn:x}id'].tolist())
+        finally:
+            XMLParser.set_dataframe_none()
+            if os.path.exists(xml_file):
+                os.remove(xml_file)
+
+    def test_parse_xml_appended_while_parsing(self):
+        """
+        Test that records appended while a growing XML file is parsed are parsed the next time.
+        """
+        xml_file = 'test_growing.xml'
+        read_dataframe = XMLParser.read_dataframe
+
+        def read_and_append(file_path, **options):
+            dataframe = read_dataframe(file_path, **options)
+            with open(xml_file, 'rb') as file:
+                content = file.read()
+            end = content.rindex(b'</log>')
+            with open(xml_file, 'wb') as file:
+                file.write(content[:end] + b'<entry><id>2</id></entry>\n' + content[end:])
+            return dataframe
+
+        try:
+            with open(xml_file, 'w') as file:
+                file.write('<?xml version="1.0"?>\n<log>\n<entry><id>1</id></entry>\n</log>\n')
+            with mock.patch.object(XMLParser, 'read_dataframe', side_effect=read_and_append):
+                XMLParser.parse_xml_to_dataframe(xml_file, incremental=True)
+            self.assertEqual(['1'], XMLParser.dataframe['id'].tolist())
+
+            XMLParser.parse_xml_to_dataframe(xml_file, incremental=True)
+            self.assertEqual(['1', '2'], XMLParser.dataframe['id'].tolist())
+        finally:
+            XMLParser.set_dataframe_none()
+            if os.path.exists(xml_file):
+                os.remove(xml_file)
+
+
 if __name__ == '__main__':
     unittest.main()
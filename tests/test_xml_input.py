@@ -0,0 +1,156 @@
+import unittest
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import zipfile
+import xml.etree.ElementTree as ET
+import logic.xml_input as xml_input
+from logic.xml_dataframe import XMLParser
+
+
+class TestXMLInput(unittest.TestCase):
+    """
+    Test suite for the input adapters of compressed and memory-mapped XML files.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create the XML file and its compressed copies.
+        """
+        cls.directory = "xml_input_test"
+        os.makedirs(cls.directory, exist_ok=True)
+        cls.content = (b'<?xml version="1.0"?>\n<root>' + b''.join(
+            b'<item><name>Item%d</name><value>%d</value></item>' % (i, i) for i in range(100)) + b'</root>')
+        cls.xml_file = os.path.join(cls.directory, "items.xml")
+        with open(cls.xml_file, 'wb') as file:
+            file.write(cls.content)
+
+        cls.compressed_files = dict()
+        for compression, extension, module in (("gzip", ".gz", gzip), ("bzip2", ".bz2", bz2), ("xz", ".xz", lzma)):
+            path = cls.xml_file + extension
+            with module.open(path, 'wb') as file:
+                file.write(cls.content)
+            cls.compressed_files[compression] = path
+        cls.compressed_files["zip"] = os.path.join(cls.directory, "items.zip")
+        with zipfile.ZipFile(cls.compressed_files["zip"], 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("folder/", "")
+            archive.writestr("folder/items.xml", cls.content)
+            archive.writestr("readme.txt", "Items")
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the test environment.
+        """
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+    def test_detect_compression(self):
+        """
+        Test detecting the compression by the content.
+        """
+        self.assertIsNone(xml_input.detect_compression(self.xml_file))
+        for compression, path in self.compressed_files.items():
+            with self.subTest(compression=compression):
+                self.assertEqual(compression, xml_input.detect_compression(path))
+
+    def test_open_compressed(self):
+        """
+        Test decompressing while reading and parsing compressed files.
+        """
+        expected = XMLParser.read_dataframe(self.xml_file)
+        for compression, path in self.compressed_files.items():
+            for streaming in (False, True):
+                with self.subTest(compression=compression, streaming=streaming):
+                    with xml_input.open_xml(path) as source:
+                        self.assertEqual(self.content, source.read())
+                    self.assertTrue(expected.equals(XMLParser.read_dataframe(path, streaming=streaming)))
+        self.assertTrue(expected.equals(XMLParser.read_dataframe(self.compressed_files["gzip"], workers=2)))
+        self.assertEqual(['name', 'value'], list(XMLParser.scan_schema(self.compressed_files["xz"]).index))
+
+    def test_damaged_compressed(self):
+        """
+        Test that truncated and damaged compressed files raise an OSError.
+        """
+        for compression, path in self.compressed_files.items():
+            with open(path, 'rb') as file:
+                data = file.read()
+            damaged = bytearray(data)
+            # Damage the compressed data behind the headers
+            for i in range(len(damaged) // 2, len(damaged) // 2 + 8):
+                damaged[i] ^= 0xff
+            for name, content in (("truncated", data[:len(data) // 2]), ("damaged", bytes(damaged))):
+                damaged_path = os.path.join(self.directory, name + os.path.basename(path))
+                with open(damaged_path, 'wb') as file:
+                    file.write(content)
+                with self.subTest(compression=compression, name=name):
+                    with self.assertRaises((OSError, ET.ParseError)):
+                        XMLParser.read_dataframe(damaged_path)
+
+    def test_zip_members(self):
+        """
+        Test that a ZIP archive has to contain exactly one XML file.
+        """
+        path = os.path.join(self.directory, "multiple.zip")
+        with zipfile.ZipFile(path, 'w') as archive:
+            archive.writestr("a.xml", self.content)
+            archive.writestr("b.xml", self.content)
+        with self.assertRaises(ValueError):
+            xml_input.open_xml(path)
+
+        with zipfile.ZipFile(path, 'w') as archive:
+            archive.writestr("items.data", self.content)
+        with xml_input.open_xml(path) as source:
+            self.assertEqual(self.content, source.read())
+
+        with open(path, 'wb') as file:
+            file.write(b"PK\x03\x04 damaged")
+        with self.assertRaises(OSError):
+            xml_input.open_xml(path)
+
+    def test_memory_map(self):
+        """
+        Test reading and seeking a memory-mapped file.
+        """
+        with xml_input.open_xml(self.xml_file, memory_map=True) as source:
+            self.assertIsInstance(source, xml_input.MappedReader)
+            self.assertEqual(self.content[:5], source.read(5))
+            self.assertEqual(5, source.tell())
+            buffer = bytearray(3)
+            self.assertEqual(3, source.readinto(buffer))
+            self.assertEqual(self.content[5:8], bytes(buffer))
+            source.seek(-7, os.SEEK_END)
+            self.assertEqual(b"</root>", source.read())
+            self.assertEqual(b"", source.read(10))
+            source.seek(0)
+            self.assertEqual(self.content, source.read())
+        self.assertTrue(source.closed)
+
+        memory_map_size = xml_input.MEMORY_MAP_SIZE
+        xml_input.MEMORY_MAP_SIZE = 1
+        try:
+            self.assertTrue(XMLParser.read_dataframe(self.xml_file).equals(
+                XMLParser.read_dataframe(self.xml_file, streaming=True)))
+        finally:
+            xml_input.MEMORY_MAP_SIZE = memory_map_size
+
+        # Empty files can't be mapped
+        path = os.path.join(self.directory, "empty.xml")
+        open(path, 'w').close()
+        with xml_input.open_xml(path, memory_map=True) as source:
+            self.assertEqual(b"", source.read())
+
+    def test_strip_extensions(self):
+        """
+        Test removing the compression extension next to the XML extension.
+        """
+        self.assertEqual("items", xml_input.strip_extensions("items.xml.gz"))
+        self.assertEqual("items", xml_input.strip_extensions("items.zip"))
+        self.assertEqual("items", xml_input.strip_extensions("items.xml"))
+        self.assertEqual("items.v2", xml_input.strip_extensions("items.v2.xml"))
+
+
+if __name__ == '__main__':
+    unittest.main()